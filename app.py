@@ -5,14 +5,15 @@
 """
 
 import re
-import time
 import urllib.parse
 import streamlit as st
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+import lxml.html
+from blogcheck.cache import cached_result, get_result_cache
+from blogcheck.fast import fetch_blog_info, found_fields, is_complete
+from blogcheck.parser import element_text, parse_serp_links, serp_blog_ids
+from blogcheck.pool import DEFAULT_PREWARM, get_driver_pool, tabs_enabled
+from blogcheck.steps import iter_steps
+from blogcheck.wait import STEP_DEADLINES, StepTimer, wait_for_any, wait_for_count, wait_for_groups
 
 
 def parse_visitor_text(text: str) -> tuple:
@@ -49,40 +50,20 @@ def parse_visitor_text(text: str) -> tuple:
     return today, total
 
 
-@st.cache_resource
-def get_driver():
-    """
-    Selenium WebDriver를 생성하고 캐싱합니다. (Headless 모드)
-    Streamlit Cloud 환경에서도 동작하도록 예외 처리 포함.
-    """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # 브라우저 창 없이 백그라운드 실행
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-software-rasterizer")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1")
-    
-    try:
-        # 로컬 환경: ChromeDriverManager 사용
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-    except Exception:
-        # Streamlit Cloud 환경: 시스템에 설치된 chromium-driver 사용
-        return webdriver.Chrome(options=chrome_options)
-
-
-def get_blog_info(blog_id: str) -> dict:
+@cached_result(get_result_cache, "blog_info", namespace="app.blog_info",
+               valid=lambda r: r["latest_post_title"] != "정보를 찾을 수 없음")
+def get_blog_info(blog_id: str, timer: StepTimer = None) -> dict:
     """
     네이버 블로그에서 기본 정보를 크롤링합니다.
     
     Args:
         blog_id: 네이버 블로그 ID
+        timer: 단계별 소요 시간 기록기 (선택)
         
     Returns:
         블로그 정보가 담긴 딕셔너리
     """
-    driver = get_driver()
+    timer = timer or StepTimer()
     
     result = {
         "blog_id": blog_id,
@@ -91,183 +72,151 @@ def get_blog_info(blog_id: str) -> dict:
         "latest_post_title": "정보를 찾을 수 없음"
     }
     
+    # 방문자 수 선택자
+    visitor_selectors = [
+        "div[class^='count__']",
+        "div[class*='count']",
+        "span[class^='count__']",
+        "span[class*='count']",
+    ]
+    
+    # 최신 게시글 제목 선택자
+    title_selectors = [
+        "strong.title",
+        "span.title",
+        ".title",
+        "div[class^='list__'] strong[class^='title__']",
+        "div[class^='list__'] span[class^='title__']",
+        "div[class^='list__'] [class^='title__']",
+        "[class^='title__']",
+        "a[class*='title']",
+        ".post_title",
+        ".tit_wrap .title",
+        ".list_post_article .title",
+    ]
+    
+    # 빠른 경로: 방문자 수와 최신 글 제목을 HTTP로 먼저 조회 (모두 찾으면 Chrome 생략)
+    required = ["today_visitors", "total_visitors", "latest_post_title"]
+    with timer.step("프로필 HTTP 조회"):
+        fast = {key: value for key, value in fetch_blog_info(blog_id).items() if key in required}
+    if is_complete(fast, required):
+        result.update(fast)
+        return result
+    
     try:
-        url = f"https://m.blog.naver.com/{blog_id}"
-        driver.get(url)
-        time.sleep(3)
+        with get_driver_pool().driver() as driver:
+            url = f"https://m.blog.naver.com/{blog_id}"
+            with timer.step("프로필 페이지 로딩"):
+                driver.get(url)
+            with timer.step("방문자/글목록 대기"):
+                wait_for_groups(driver, [visitor_selectors, title_selectors], STEP_DEADLINES["profile"])
+
+            # 요소마다 find_element/text를 호출하지 않고 렌더링된 DOM을 한 번에 받아 파싱 (탭 모드에서도 동일하게 동작)
+            with timer.step("프로필 파싱"):
+                root = lxml.html.fromstring(driver.page_source)
         
         # 방문자 수 추출 - 다양한 선택자 시도
-        visitor_selectors = [
-            "div[class^='count__']",
-            "div[class*='count']",
-            "span[class^='count__']",
-            "span[class*='count']",
-        ]
-        
         for selector in visitor_selectors:
-            try:
-                visitor_element = driver.find_element(By.CSS_SELECTOR, selector)
-                visitor_text = visitor_element.text.strip()
-                if "오늘" in visitor_text or "전체" in visitor_text:
-                    result["today_visitors"], result["total_visitors"] = parse_visitor_text(visitor_text)
-                    break
-            except Exception:
-                continue
+            found = root.cssselect(selector)
+            visitor_text = element_text(found[0]) if found else ""
+            if "오늘" in visitor_text or "전체" in visitor_text:
+                result["today_visitors"], result["total_visitors"] = parse_visitor_text(visitor_text)
+                break
         
         # XPath 폴백
         if result["today_visitors"] == "정보를 찾을 수 없음":
-            try:
-                visitor_element = driver.find_element(By.XPATH, "//*[contains(text(), '오늘') or contains(text(), '전체')]")
-                visitor_text = visitor_element.text.strip()
-                result["today_visitors"], result["total_visitors"] = parse_visitor_text(visitor_text)
-            except Exception:
-                pass
+            found = root.xpath("//*[contains(text(), '오늘') or contains(text(), '전체')]")
+            if found:
+                result["today_visitors"], result["total_visitors"] = parse_visitor_text(element_text(found[0]))
         
         # 최신 게시글 제목 추출 - 다양한 선택자 시도
-        title_selectors = [
-            "strong.title",
-            "span.title",
-            ".title",
-            "div[class^='list__'] strong[class^='title__']",
-            "div[class^='list__'] span[class^='title__']",
-            "div[class^='list__'] [class^='title__']",
-            "[class^='title__']",
-            "a[class*='title']",
-            ".post_title",
-            ".tit_wrap .title",
-            ".list_post_article .title",
-        ]
-        
         for selector in title_selectors:
-            try:
-                title_element = driver.find_element(By.CSS_SELECTOR, selector)
-                title_text = title_element.text.strip()
-                if title_text and len(title_text) > 0:
-                    result["latest_post_title"] = title_text
-                    break
-            except Exception:
-                continue
+            found = root.cssselect(selector)
+            title_text = element_text(found[0]) if found else ""
+            if title_text:
+                result["latest_post_title"] = title_text
+                break
         
-        # XPath 폴백 - 게시글 목록에서 첫 번째 제목 찾기
+        # XPath 폴백 - 게시글 목록에서 첫 번째 제목 찾기 (제목에 해당하는 strong 또는 span 요소)
         if result["latest_post_title"] == "정보를 찾을 수 없음":
-            try:
-                # 제목에 해당하는 strong 또는 span 요소 찾기
-                title_element = driver.find_element(By.XPATH, "//strong[contains(@class, 'title')] | //span[contains(@class, 'title')]")
-                title_text = title_element.text.strip()
-                if title_text:
-                    result["latest_post_title"] = title_text
-            except Exception:
-                pass
+            found = root.xpath("//strong[contains(@class, 'title')] | //span[contains(@class, 'title')]")
+            title_text = element_text(found[0]) if found else ""
+            if title_text:
+                result["latest_post_title"] = title_text
     
     except Exception as e:
         st.error(f"❌ 오류 발생: {e}")
     
+    # Selenium으로 찾은 값보다 빠른 경로에서 찾은 값을 우선
+    result.update(found_fields(fast))
     return result
 
 
-def check_search_exposure(blog_id: str, post_title: str) -> tuple:
+@cached_result(get_result_cache, "exposure", namespace="app.exposure",
+               key=lambda blog_id, post_title, *args, **kwargs: f"{blog_id}|{post_title}",
+               valid=lambda r: not str(r[1]).startswith("검색 오류"))
+def check_search_exposure(blog_id: str, post_title: str, timer: StepTimer = None) -> tuple:
     """
     네이버 검색에서 블로그 글의 노출 여부를 확인합니다.
     
     Args:
         blog_id: 블로그 ID
         post_title: 검색할 게시글 제목
+        timer: 단계별 소요 시간 기록기 (선택)
         
     Returns:
         (노출 여부, 순위 또는 메시지) 튜플
     """
+    timer = timer or StepTimer()
     if post_title == "정보를 찾을 수 없음" or not post_title:
         return False, "게시글 제목을 찾을 수 없어 검색할 수 없습니다."
     
-    driver = get_driver()
-    
     try:
-        # 네이버 검색 URL 생성
-        encoded_query = urllib.parse.quote(post_title)
-        search_url = f"https://m.search.naver.com/search.naver?where=m_view&query={encoded_query}"
+        with get_driver_pool().driver() as driver:
+            # 네이버 검색 URL 생성
+            encoded_query = urllib.parse.quote(post_title)
+            search_url = f"https://m.search.naver.com/search.naver?where=m_view&query={encoded_query}"
         
-        driver.get(search_url)
-        time.sleep(3)
+            blog_link_selector = 'a[href*="blog.naver.com"]'
+            with timer.step("검색 결과 로딩"):
+                driver.get(search_url)
+            with timer.step("검색 결과 링크 대기"):
+                wait_for_any(driver, [blog_link_selector], STEP_DEADLINES["serp"])
         
-        # 스크롤해서 동적 콘텐츠 로딩
-        driver.execute_script("window.scrollTo(0, 500);")
-        time.sleep(2)
+            # 스크롤해서 동적 콘텐츠 로딩 - 상위 5개 판정에 필요한 링크가 모이면 바로 진행
+            with timer.step("스크롤 후 추가 로딩 대기"):
+                driver.execute_script("window.scrollTo(0, 500);")
+                wait_for_count(driver, blog_link_selector, 5, STEP_DEADLINES["serp_scroll"])
         
-        # JavaScript로 모든 링크 추출 (렌더링된 DOM에서)
-        try:
-            all_links = driver.execute_script("""
-                var links = [];
-                var anchors = document.querySelectorAll('a[href*="blog.naver.com"]');
-                anchors.forEach(function(a) {
-                    if (a.href && a.href.includes('blog.naver.com')) {
-                        links.push(a.href);
-                    }
-                });
-                return links;
-            """)
-        except Exception:
-            all_links = []
+            # 렌더링된 DOM을 한 번에 받아 파싱 (광고 제외, 같은 글 중복 제거)
+            with timer.step("검색 결과 파싱"):
+                unique_links = parse_serp_links(driver.page_source)
         
-        # 광고 링크 제외
-        blog_links = [
-            link for link in all_links 
-            if 'ader.naver.com' not in link 
-            and 'ad.search.naver.com' not in link
-            and 'm.blog.naver.com' in link
-        ]
+            # 상위 5개에서 해당 블로그 ID 확인
+            for i, link in enumerate(unique_links[:5]):
+                if f"blog.naver.com/{blog_id}" in link:
+                    return True, i + 1  # 순위 반환 (1-indexed)
         
-        # 중복 제거하면서 순서 유지
-        seen = set()
-        unique_links = []
-        for link in blog_links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
-        
-        # 상위 5개에서 해당 블로그 ID 확인
-        for i, link in enumerate(unique_links[:5]):
-            if blog_id in link:
-                return True, i + 1  # 순위 반환 (1-indexed)
-        
-        # 백업: 페이지 소스에서 직접 검색
-        page_source = driver.page_source
-        
-        # 블로그 ID가 포함된 링크 패턴 검색
-        blog_pattern = rf'blog\.naver\.com/{re.escape(blog_id)}'
-        if re.search(blog_pattern, page_source):
-            # 해당 블로그가 페이지에 존재함 -> 순위 계산
-            # 모든 블로그 링크 찾기
-            all_blog_matches = re.findall(r'm\.blog\.naver\.com/([a-zA-Z0-9_-]+)/\d+', page_source)
-            # 중복 제거하면서 순서 유지
-            seen_ids = []
-            for bid in all_blog_matches:
-                if bid not in seen_ids:
-                    seen_ids.append(bid)
-            
-            # 해당 블로그 ID의 순위 찾기
-            for i, bid in enumerate(seen_ids[:5]):
-                if bid == blog_id:
-                    return True, i + 1
-            
-            # 5위 밖이지만 페이지에 있음
+            # 백업: 블로그 단위 순위 (한 블로그의 글이 여러 개 노출된 경우)
+            seen_ids = serp_blog_ids(unique_links)
             if blog_id in seen_ids:
                 rank = seen_ids.index(blog_id) + 1
-                if rank > 5:
-                    return False, f"상위 5개 밖 ({rank}위)"
+                if rank <= 5:
+                    return True, rank
+                return False, f"상위 5개 밖 ({rank}위)"
         
-        return False, "상위 5개 결과에 블로그가 없습니다."
+            return False, "상위 5개 결과에 블로그가 없습니다."
     
     except Exception as e:
         return False, f"검색 오류: {e}"
 
 
-def display_blog_info(info: dict, exposure_result: tuple = None) -> None:
+def display_blog_info(info: dict) -> None:
     """
-    블로그 정보를 Streamlit UI로 보기 좋게 출력합니다.
+    블로그 기본 정보(방문자 수, 최신 게시글)를 Streamlit UI로 보기 좋게 출력합니다.
     
     Args:
         info: 블로그 정보 딕셔너리
-        exposure_result: 검색 노출 결과 튜플 (노출여부, 순위/메시지)
     """
     st.divider()
     st.subheader("📊 네이버 블로그 기본 정보")
@@ -286,15 +235,39 @@ def display_blog_info(info: dict, exposure_result: tuple = None) -> None:
     st.write(f"**📝 최신 게시글:** {info['latest_post_title']}")
     
     st.divider()
+
+
+def display_exposure(exposure_result: tuple) -> None:
+    """
+    검색 노출 결과를 출력합니다. (placeholder.container() 안에서 호출)
     
-    # 검색 노출 결과 출력
-    if exposure_result:
-        st.subheader("🔍 검색 노출 판독 결과")
-        is_exposed, rank_or_msg = exposure_result
-        if is_exposed:
-            st.success(f"✅ **노출 잘됨 (합격)** - 검색 결과 **{rank_or_msg}위**")
+    Args:
+        exposure_result: 검색 노출 결과 튜플 (노출여부, 순위/메시지)
+    """
+    st.subheader("🔍 검색 노출 판독 결과")
+    is_exposed, rank_or_msg = exposure_result
+    if is_exposed:
+        st.success(f"✅ **노출 잘됨 (합격)** - 검색 결과 **{rank_or_msg}위**")
+    else:
+        st.error(f"❌ **노출 안됨 (주의 요망)** - {rank_or_msg}")
+
+
+def display_timing(timer: StepTimer) -> None:
+    """단계별 소요 시간과 캐시 적중률을 출력합니다."""
+    with st.expander(f"⏱ 단계별 소요 시간 (총 {timer.total():.2f}초)"):
+        if timer.steps:
+            st.table({"단계": [name for name, _ in timer.steps],
+                      "소요 시간(초)": [round(seconds, 2) for _, seconds in timer.steps]})
         else:
-            st.error(f"❌ **노출 안됨 (주의 요망)** - {rank_or_msg}")
+            st.write("모든 단계가 캐시에서 응답했습니다.")
+        st.caption("캐시 적중률")
+        st.json(get_result_cache().stats())
+
+
+@st.cache_resource
+def prewarm_drivers(count):
+    """앱 시작 시 Chrome을 백그라운드에서 미리 띄웁니다. (프로세스당 한 번)"""
+    return get_driver_pool().prewarm(count)
 
 
 def main():
@@ -305,10 +278,15 @@ def main():
         page_icon="📊",
         layout="centered"
     )
+    if DEFAULT_PREWARM:
+        prewarm_drivers(DEFAULT_PREWARM)
     
     # 헤더
     st.title("🌐 네이버 블로그 분석기")
     st.caption("블로그 기본 정보 크롤러 + 검색 노출 판독기")
+    if tabs_enabled():
+        st.caption("🧪 실험 기능: 탭 다중화(BLOGCHECK_TABS)로 Chrome 하나에 탭을 열어 분석 중입니다. "
+                   "실제 Chrome에서 더 빠른지는 아직 측정하지 않았습니다.")
     st.divider()
     
     # 블로그 ID 입력
@@ -324,19 +302,28 @@ def main():
             st.warning("⚠️ 블로그 ID를 입력해주세요.")
         else:
             blog_id = blog_id.strip()
+            timer = StepTimer()
+            progress = st.progress(0.0, text=f"🔄 '{blog_id}' 블로그 정보를 가져오는 중...")
             
-            # 블로그 정보 가져오기 (스피너 표시)
-            with st.spinner(f"🔄 '{blog_id}' 블로그 정보를 가져오는 중..."):
-                info = get_blog_info(blog_id)
+            # 블로그 정보는 받는 즉시 표시
+            info = get_blog_info(blog_id, timer)
+            display_blog_info(info)
             
-            # 검색 노출 확인
-            exposure_result = None
+            # 검색 노출 확인은 작업자 스레드에서 실행하고, 끝나면 자리에 채움
             if info["latest_post_title"] != "정보를 찾을 수 없음":
-                with st.spinner(f"🔎 '{info['latest_post_title']}' 검색 노출 확인 중..."):
-                    exposure_result = check_search_exposure(blog_id, info["latest_post_title"])
+                progress.progress(0.5, text=f"🔎 '{info['latest_post_title']}' 검색 노출 확인 중...")
+                exposure_slot = st.empty()
+                exposure_slot.caption("⏳ 검색 노출 확인 중...")
+                steps = {"exposure": lambda: check_search_exposure(blog_id, info["latest_post_title"], timer)}
+                for _, exposure_result, error in iter_steps(steps):
+                    if error is not None:
+                        exposure_slot.error(f"검색 노출 확인 실패: {error}")
+                    else:
+                        with exposure_slot.container():
+                            display_exposure(exposure_result)
+            progress.progress(1.0, text="✅ 분석 완료")
             
-            # 결과 표시
-            display_blog_info(info, exposure_result)
+            display_timing(timer)
     
     # 푸터
     st.divider()
@@ -0,0 +1,194 @@
+"""
+로컬 네이버 목업 서버
+- bench/fixtures의 저장된 페이지를 블로그 ID만 바꿔 돌려주는 HTTP 서버입니다.
+- 요청마다 지연(latency ± jitter)을 넣어 실제 네트워크와 비슷한 조건에서 파이프라인을 측정합니다.
+- blogcheck의 BLOGCHECK_*_BASE 환경 변수를 이 서버로 돌리면 네트워크 없이 전체 분석이 돌아갑니다.
+
+경로:
+    /rego/BlogInfo.naver?blogId=ID      방문자 수 JSON
+    /ID.xml                             RSS
+    /ID                                 모바일 프로필
+    /ID/LOGNO, /PostView.naver?...      모바일 게시글 (PostView 본문)
+    /pc/ID/LOGNO                        mainFrame iframe을 쓰는 PC 게시글 껍데기
+    /search.naver?query=...             검색 결과 (검색어마다 순위가 고정된 블로그 링크 20개)
+
+응답에는 본문 기준 ETag가 붙고(If-None-Match가 같으면 304), Accept-Encoding에 gzip이 있으면 압축해 보냅니다.
+
+사용 예:
+    python bench/mock_naver.py --port 8765 --latency 0.15 --jitter 0.05
+"""
+
+import argparse
+import gzip
+import os
+import random
+import re
+import sys
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_BLOG_ID = "testid"
+SERP_SIZE = 20
+
+
+def _load(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _stable_int(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+class MockNaver:
+    """
+    목업 응답 생성기
+
+    Args:
+        latency: 요청당 기본 지연 (초)
+        jitter: 지연에 더하거나 뺄 최대 무작위 값 (초)
+        hit_ratio: 검색 결과에 분석 대상 블로그가 들어갈 비율 (0~1)
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, hit_ratio: float = 0.7):
+        self.latency = latency
+        self.jitter = jitter
+        self.hit_ratio = hit_ratio
+        self.profile = _load("profile.html")
+        self.post = _load("post_se.html")
+        self.rss = _load("rss.xml")
+        self.blog_info = _load("blog_info.json")
+
+    def delay(self) -> float:
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def _for_blog(self, template: str, blog_id: str) -> str:
+        return template.replace(FIXTURE_BLOG_ID, blog_id)
+
+    def blog_info_json(self, blog_id: str) -> str:
+        # 블로그마다 다른 방문자 수
+        seed = _stable_int(blog_id)
+        return (self._for_blog(self.blog_info, blog_id)
+                .replace('"dayVisitorCount":1234', f'"dayVisitorCount":{seed % 5000}')
+                .replace('"totalVisitorCount":98765', f'"totalVisitorCount":{seed % 900000 + 5000}'))
+
+    def rss_xml(self, blog_id: str) -> str:
+        # 제목 맨 앞에 블로그 ID를 넣어, 제목으로 만든 검색어에서 검색 결과가 분석 대상 블로그를 찾을 수 있게 함
+        return self._for_blog(self.rss, blog_id).replace("<![CDATA[", f"<![CDATA[{blog_id} ")
+
+    def pc_post(self, blog_id: str, log_no: str) -> str:
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>네이버 블로그</title></head><body>'
+            f'<iframe id="mainFrame" name="mainFrame" src="/PostView.naver?blogId={blog_id}&logNo={log_no}"></iframe>'
+            "</body></html>"
+        )
+
+    def serp(self, query: str) -> str:
+        # 검색어 안의 블로그 ID(제목에 들어간 경우)나 검색어 해시로 분석 대상 블로그의 순위를 정함
+        seed = _stable_int(query)
+        target = re.search(r"bench\d+", query)
+        hit_rank = seed % SERP_SIZE + 1 if (seed % 100) < self.hit_ratio * 100 else None
+        items = []
+        for rank in range(1, SERP_SIZE + 1):
+            blog_id = f"serp{(seed + rank) % 997:03d}"
+            if rank == hit_rank:
+                blog_id = target.group(0) if target else FIXTURE_BLOG_ID
+            items.append(
+                f'<li class="bx"><a class="title_link" href="https://m.blog.naver.com/{blog_id}/{223300000000 + rank}">'
+                f"{query} {rank}</a></li>"
+            )
+        ad = '<li><a href="https://ader.naver.com/v1/ad?u=https%3A%2F%2Fm.blog.naver.com%2Fadblog%2F1">광고</a></li>'
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+            f'<ul class="lst_ad">{ad}</ul><ul class="lst_view">{"".join(items)}</ul></body></html>'
+        )
+
+    def respond(self, path: str, query: dict):
+        """(상태 코드, content-type, 본문)을 반환합니다."""
+        html = "text/html; charset=utf-8"
+        if path == "/rego/BlogInfo.naver":
+            return 200, "application/json; charset=utf-8", self.blog_info_json(query.get("blogId", FIXTURE_BLOG_ID))
+        if path == "/search.naver":
+            return 200, html, self.serp(query.get("query", ""))
+        if path == "/PostView.naver":
+            return 200, html, self._for_blog(self.post, query.get("blogId", FIXTURE_BLOG_ID))
+
+        parts = [p for p in path.split("/") if p]
+        if len(parts) == 1 and parts[0].endswith(".xml"):
+            return 200, "application/rss+xml; charset=utf-8", self.rss_xml(parts[0][:-4])
+        if len(parts) == 1:
+            return 200, html, self._for_blog(self.profile, parts[0])
+        if len(parts) == 2 and parts[1].isdigit():
+            return 200, html, self._for_blog(self.post, parts[0])
+        if len(parts) == 3 and parts[0] == "pc" and parts[2].isdigit():
+            return 200, html, self.pc_post(parts[1], parts[2])
+        return 404, "text/plain; charset=utf-8", "not found"
+
+
+def make_handler(mock: MockNaver):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            split = urllib.parse.urlsplit(self.path)
+            query = {k: v[0] for k, v in urllib.parse.parse_qs(split.query).items()}
+            time.sleep(mock.delay())
+            status, content_type, body = mock.respond(split.path, query)
+            data = body.encode("utf-8")
+            # 본문이 같으면 ETag도 같으므로, 조건부 요청에는 304로 응답
+            etag = f'"{zlib.crc32(data):08x}"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            gzipped = status == 200 and "gzip" in (self.headers.get("Accept-Encoding") or "")
+            if gzipped:
+                data = gzip.compress(data)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            if status == 200:
+                self.send_header("ETag", etag)
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_server(port: int = 0, latency: float = 0.0, jitter: float = 0.0, host: str = "127.0.0.1"):
+    """목업 서버를 만들어 반환합니다. (serve_forever는 호출하는 쪽에서 실행)"""
+    server = ThreadingHTTPServer((host, port), make_handler(MockNaver(latency, jitter)))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 네이버 목업 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.1, help="요청당 기본 지연 (초, 기본 0.1)")
+    parser.add_argument("--jitter", type=float, default=0.03, help="지연 흔들림 (초, 기본 0.03)")
+    args = parser.parse_args(argv)
+
+    server = start_server(args.port, args.latency, args.jitter, args.host)
+    print(f"mock naver listening on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
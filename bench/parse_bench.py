@@ -0,0 +1,111 @@
+"""
+HTML 파서 벤치마크
+- bench/fixtures의 저장된 페이지를 파싱해 expected.json과 비교하고, 페이지당 파싱 시간을 측정합니다.
+- 브라우저나 네트워크 없이 실행되므로 파서를 고친 뒤 바로 확인할 수 있습니다.
+
+사용 예:
+    python bench/parse_bench.py
+    python bench/parse_bench.py -n 500 -o parse_bench.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blogcheck.fast import parse_rss_posts, parse_visitor_counts  # noqa: E402
+from blogcheck.parser import parse_post_html, parse_profile_html, parse_serp_links, serp_blog_ids  # noqa: E402
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_BLOG_ID = "testid"
+
+
+def _parse_serp(html):
+    links = parse_serp_links(html)
+    return {"links": links, "blog_ids": serp_blog_ids(links)}
+
+
+def _parse_visitors(text):
+    return dict(zip(("today_visitors", "total_visitors"), parse_visitor_counts(text)))
+
+
+def _parse_rss(text):
+    posts = parse_rss_posts(text, FIXTURE_BLOG_ID)
+    return {"titles": [p["title"] for p in posts], "urls": [p["url"] for p in posts]}
+
+
+# 파일 이름 -> 파서
+PARSERS = {
+    "serp_m_view.html": _parse_serp,
+    "profile.html": lambda html: parse_profile_html(html, FIXTURE_BLOG_ID),
+    "post_se.html": parse_post_html,
+    "post_legacy.html": parse_post_html,
+    "blog_info.json": _parse_visitors,
+    "rss.xml": _parse_rss,
+}
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def check_fixture(name: str, parsed: dict, expected: dict) -> list:
+    """기대값과 다른 필드 목록을 반환합니다."""
+    return [
+        f"{field}: {parsed.get(field)!r} != {value!r}"
+        for field, value in expected.items()
+        if parsed.get(field) != value
+    ]
+
+
+def bench_fixture(name: str, iterations: int) -> dict:
+    parse = PARSERS[name]
+    text = load_fixture(name)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        parse(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "bytes": len(text.encode("utf-8")),
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="저장된 페이지로 HTML 파서를 검증하고 파싱 시간을 측정합니다.")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="페이지당 반복 횟수 (기본 200)")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    with open(os.path.join(FIXTURE_DIR, "expected.json"), encoding="utf-8") as f:
+        expected = json.load(f)
+
+    report = {"fixtures": {}, "failures": {}}
+    for name in PARSERS:
+        errors = check_fixture(name, PARSERS[name](load_fixture(name)), expected.get(name, {}))
+        if errors:
+            report["failures"][name] = errors
+        report["fixtures"][name] = bench_fixture(name, max(1, args.iterations))
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
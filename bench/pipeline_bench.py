@@ -0,0 +1,142 @@
+"""
+크롤링 파이프라인 벤치마크
+- 로컬 네이버 목업 서버(mock_naver.py)를 띄우고 동시 작업 수별로 analyze_blog 처리량을 측정합니다.
+- 동시 작업 수마다 새 프로세스에서 실행해 캐시와 최대 메모리(peak RSS)가 서로 섞이지 않게 합니다.
+  키워드 문서 빈도/유사 문서 색인/이력 SQLite도 수준마다 임시 폴더에 새로 만들고 끝나면 지웁니다.
+- 결과(blogs/min, p50/p95 지연, peak RSS)는 JSON으로 저장해 변경 전후를 비교합니다.
+
+사용 예:
+    python bench/pipeline_bench.py
+    python bench/pipeline_bench.py -n 200 -c 1 4 8 16 --latency 0.15 --jitter 0.05 -o bench_results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+
+def percentile(values: list, p: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb() -> float:
+    # 리눅스는 KB, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_level(blogs: int, concurrency: int, deep_posts: int, queries: int) -> dict:
+    """현재 프로세스에서 한 번 측정합니다. (환경 변수로 목업 서버 주소가 지정되어 있어야 함)"""
+    import functools
+
+    from blogcheck.batch import iter_batch
+    from blogcheck.crawler import analyze_blog
+
+    blog_ids = [f"bench{i:05d}" for i in range(blogs)]
+    analyze = functools.partial(analyze_blog, deep_posts=deep_posts, queries=queries)
+
+    start = time.perf_counter()
+    rows = list(iter_batch(blog_ids, analyze, workers=concurrency))
+    wall = time.perf_counter() - start
+
+    latencies = [row["elapsed"] for row in rows]
+    return {
+        "concurrency": concurrency,
+        "blogs": len(rows),
+        "errors": sum(1 for row in rows if row.get("error")),
+        "exposed": sum(1 for row in rows if row.get("exposure_ok")),
+        "wall_seconds": round(wall, 2),
+        "blogs_per_min": round(len(rows) / wall * 60, 1) if wall else None,
+        "p50_seconds": percentile(latencies, 50),
+        "p95_seconds": percentile(latencies, 95),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def start_mock(latency: float, jitter: float):
+    from mock_naver import start_server
+
+    server = start_server(0, latency, jitter)
+    threading.Thread(target=server.serve_forever, name="mock-naver", daemon=True).start()
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 목업 서버로 크롤링 파이프라인 처리량을 측정합니다.")
+    parser.add_argument("-n", "--blogs", type=int, default=100, help="동시 작업 수마다 분석할 블로그 수 (기본 100)")
+    parser.add_argument("-c", "--concurrency", type=int, nargs="+", default=[1, 4, 8, 16],
+                        help="측정할 동시 작업 수 목록 (기본 1 4 8 16)")
+    parser.add_argument("--latency", type=float, default=0.1, help="목업 서버 요청당 지연 (초, 기본 0.1)")
+    parser.add_argument("--jitter", type=float, default=0.03, help="지연 흔들림 (초, 기본 0.03)")
+    parser.add_argument("--posts", type=int, default=0, help="analyze_blog deep_posts (기본 0)")
+    parser.add_argument("--queries", type=int, default=1, help="analyze_blog queries (기본 1)")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (기본: 표준 출력)")
+    parser.add_argument("--level", type=int, help=argparse.SUPPRESS)  # 하위 프로세스용
+    args = parser.parse_args(argv)
+
+    if args.level is not None:
+        print(json.dumps(run_level(args.blogs, args.level, args.posts, args.queries)))
+        return 0
+
+    # 목업 서버는 부모 프로세스에서 띄워 측정 대상 프로세스의 RSS에 포함되지 않게 함
+    sys.path.insert(0, BENCH_DIR)
+    server = start_mock(args.latency, args.jitter)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    env = dict(os.environ, BLOGCHECK_MOBILE_BLOG_BASE=base, BLOGCHECK_RSS_BASE=base, BLOGCHECK_SEARCH_BASE=base)
+    env.pop("BLOGCHECK_CACHE_PATH", None)
+
+    levels = []
+    try:
+        for concurrency in args.concurrency:
+            cmd = [sys.executable, os.path.abspath(__file__), "--level", str(concurrency),
+                   "-n", str(args.blogs), "--posts", str(args.posts), "--queries", str(args.queries)]
+            with tempfile.TemporaryDirectory(prefix="blogcheck-bench-") as state_dir:
+                level_env = dict(env, **{
+                    name: os.path.join(state_dir, filename) for name, filename in (
+                        ("BLOGCHECK_KEYWORDS_PATH", "keywords.sqlite3"),
+                        ("BLOGCHECK_DEDUP_PATH", "dedup.sqlite3"),
+                        ("BLOGCHECK_HISTORY_PATH", "history.sqlite3"),
+                    )
+                })
+                proc = subprocess.run(cmd, env=level_env, capture_output=True, text=True)
+            if proc.returncode != 0:
+                print(proc.stderr, file=sys.stderr)
+                return proc.returncode
+            level = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(f"concurrency={concurrency}: {level['blogs_per_min']} blogs/min, "
+                  f"p95 {level['p95_seconds']}s", file=sys.stderr)
+            levels.append(level)
+    finally:
+        server.shutdown()
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "config": {"blogs": args.blogs, "latency": args.latency, "jitter": args.jitter,
+                   "posts": args.posts, "queries": args.queries},
+        "levels": levels,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
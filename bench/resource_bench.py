@@ -0,0 +1,94 @@
+"""
+리소스 차단 벤치마크
+- 같은 페이지를 차단 없이 / 차단 분류를 적용해 열고, 로드 시간과 전송 바이트를 비교합니다.
+- Chrome이 설치된 환경에서 실제 네이버 페이지로 실행합니다.
+
+사용 예:
+    python bench/resource_bench.py https://m.blog.naver.com/blog_id/223300000000
+    python bench/resource_bench.py -n 5 --block images,fonts -o resource_bench.json URL [URL ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import TimeoutException  # noqa: E402
+from selenium.webdriver.support.ui import WebDriverWait  # noqa: E402
+
+from blogcheck.driver import blocked_resources, create_driver, measure_page_load  # noqa: E402
+
+
+LOAD_TIMEOUT = 20
+
+
+def load_page(driver, url: str) -> dict:
+    """페이지를 열고 load 이벤트까지 기다린 뒤 측정값을 반환합니다."""
+    start = time.perf_counter()
+    driver.get(url)
+    try:
+        WebDriverWait(driver, LOAD_TIMEOUT, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        pass
+    sample = measure_page_load(driver)
+    sample["wall_ms"] = round((time.perf_counter() - start) * 1000)
+    return sample
+
+
+def bench_mode(urls: list, resources: list, iterations: int) -> dict:
+    driver = create_driver(resources)
+    try:
+        pages = {}
+        for url in urls:
+            # 브라우저 캐시 영향을 줄이기 위해 매번 캐시를 비움
+            samples = []
+            for _ in range(iterations):
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                samples.append(load_page(driver, url))
+            pages[url] = {
+                field: statistics.median(s[field] for s in samples)
+                for field in ("wall_ms", "load_ms", "dom_ready_ms", "bytes", "requests")
+            }
+        return {"blocked": resources, "pages": pages}
+    finally:
+        driver.quit()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="리소스 차단 전후의 페이지 로드 시간과 전송량을 비교합니다.")
+    parser.add_argument("urls", nargs="+", help="측정할 페이지 주소")
+    parser.add_argument("-n", "--iterations", type=int, default=3, help="페이지당 반복 횟수 (기본 3)")
+    parser.add_argument("--block", help="차단할 분류 (기본: BLOGCHECK_BLOCK_RESOURCES 또는 전체)")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    iterations = max(1, args.iterations)
+    baseline = bench_mode(args.urls, [], iterations)
+    blocked = bench_mode(args.urls, blocked_resources(args.block), iterations)
+
+    savings = {}
+    for url in args.urls:
+        before, after = baseline["pages"][url], blocked["pages"][url]
+        savings[url] = {
+            field: round(1 - after[field] / before[field], 3) if before[field] else None
+            for field in ("wall_ms", "load_ms", "bytes")
+        }
+
+    report = {"baseline": baseline, "blocked": blocked, "savings": savings}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+베리굿 블로그 판독기 공용 모듈
+- Streamlit 앱(naver_blog_crawler.py, app.py)과 명령줄(python -m blogcheck)이 함께 사용하는 크롤링 기능입니다.
+- 주요 함수는 처음 사용할 때 import 되므로, 패키지 import만으로는 selenium/streamlit을 불러오지 않습니다.
+"""
+
+import importlib
+
+# 공개 이름 -> 정의된 모듈
+_LAZY_EXPORTS = {
+    "get_blog_info": "blogcheck.crawler",
+    "analyze_post_detail": "blogcheck.crawler",
+    "check_search_exposure": "blogcheck.crawler",
+    "analyze_blog": "blogcheck.crawler",
+    "iter_batch": "blogcheck.batch",
+    "run_batch": "blogcheck.batch",
+    "extract_blog_id": "blogcheck.urls",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'blogcheck' has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,5 @@
+import sys
+
+from blogcheck.cli import main
+
+sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+asyncio 크롤링 엔진
+- 각 단계는 동기 함수이며 asyncio.to_thread로 실행합니다. HTTP 빠른 경로는 프로세스 공유 httpx 클라이언트를 쓰므로
+  블로그마다 asyncio.run을 새로 해도 연결을 다시 씁니다. (동시 Chrome 수는 드라이버 풀이 제한)
+- get_blog_info가 최신 글 제목/주소를 얻으면 analyze_post_detail과 check_search_exposure를 동시에 실행합니다.
+
+사용 예:
+    info, detail, exposure = asyncio.run(run_pipeline(blog_id, get_blog_info, analyze_post_detail,
+                                                      check_search_exposure, timer))
+"""
+
+import asyncio
+import inspect
+
+
+async def run_step(func, *args, **kwargs):
+    """코루틴 함수는 await, 일반 함수는 스레드에서 실행합니다."""
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def run_pipeline(blog_id, get_blog_info, analyze_post_detail, check_search_exposure, timer=None) -> tuple:
+    """
+    프로필 → (상세 분석 ∥ 검색 노출) 순서로 실행합니다.
+
+    Returns:
+        (info, detail, exposure) 튜플. 최신 글이 없으면 detail, exposure는 None.
+    """
+    info = await run_step(get_blog_info, blog_id, timer)
+    if not info.get("latest_post_url"):
+        return info, None, None
+
+    detail, exposure = await run_post_steps(blog_id, info, analyze_post_detail, check_search_exposure, timer)
+    return info, detail, exposure
+
+
+async def run_post_steps(blog_id, info, analyze_post_detail, check_search_exposure, timer=None) -> tuple:
+    """최신 글 정보가 준비된 뒤 상세 분석과 검색 노출 확인을 동시에 실행해 (detail, exposure)를 반환합니다."""
+    return tuple(await asyncio.gather(
+        run_step(analyze_post_detail, info["latest_post_url"], timer),
+        run_step(check_search_exposure, blog_id, info["latest_post_title"], timer),
+    ))
@@ -0,0 +1,153 @@
+"""
+일괄 분석
+- 블로그 ID/URL 목록을 중복 제거한 뒤 작업자 풀에서 동시에 분석합니다.
+- 끝나는 순서대로 결과를 내보내므로 화면에 바로 표시할 수 있습니다.
+
+사용 예:
+    for row in iter_batch(["id1", "https://blog.naver.com/id2"], analyze_blog, workers=4):
+        print(row)
+"""
+
+import csv
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from blogcheck.metrics import record_failure
+from blogcheck.urls import extract_blog_id
+
+
+DEFAULT_WORKERS = 4
+MAX_WORKERS = 16
+
+# 내보내기 열 순서
+EXPORT_FIELDS = [
+    "blog_id",
+    "today_visitors",
+    "total_visitors",
+    "latest_post_title",
+    "latest_post_url",
+    "publish_date",
+    "char_count",
+    "image_count",
+    "like_count",
+    "comment_count",
+    "warnings",
+    "exposure_ok",
+    "exposure_msg",
+    "exposure_rank",
+    "exposure_queries",
+    "exposure_best_rank",
+    "exposure_worst_rank",
+    "duplicate_ratio",
+    "duplicate_urls",
+    "posts_analyzed",
+    "median_char_count",
+    "median_image_count",
+    "short_post_ratio",
+    "median_post_interval_days",
+    "incremental",
+    "elapsed",
+    "error",
+]
+
+# CSV에서 블로그 ID로 인식할 헤더 이름
+_ID_HEADERS = ["blog_id", "id", "url", "blog", "블로그", "블로그id", "주소"]
+
+
+def dedupe_blog_ids(items) -> list:
+    """ID/URL 목록을 블로그 ID로 바꾸고 입력 순서를 유지하며 중복을 제거합니다."""
+    seen = set()
+    blog_ids = []
+    for item in items:
+        blog_id = extract_blog_id(item or "")
+        if blog_id and blog_id not in seen:
+            seen.add(blog_id)
+            blog_ids.append(blog_id)
+    return blog_ids
+
+
+def read_blog_ids(csv_text: str) -> list:
+    """
+    CSV 텍스트에서 블로그 ID/URL을 읽습니다.
+    헤더에 blog_id/url 등의 열이 있으면 그 열을, 없으면 첫 번째 열을 사용합니다.
+    """
+    rows = [row for row in csv.reader(io.StringIO(csv_text)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+
+    header = [cell.strip().lower().replace(" ", "") for cell in rows[0]]
+    column = next((header.index(name) for name in _ID_HEADERS if name in header), None)
+    if column is None:
+        return dedupe_blog_ids(row[0] for row in rows)
+    return dedupe_blog_ids(row[column] for row in rows[1:] if len(row) > column)
+
+
+def _run_one(analyze, blog_id: str) -> dict:
+    start = time.perf_counter()
+    try:
+        row = dict(analyze(blog_id))
+        row.setdefault("error", "")
+    except Exception as e:
+        record_failure("batch", e)
+        row = {"error": str(e)}
+    row["blog_id"] = blog_id
+    row["elapsed"] = round(time.perf_counter() - start, 2)
+    return row
+
+
+def iter_batch(items, analyze, workers: int = DEFAULT_WORKERS):
+    """
+    블로그 목록을 동시에 분석하며 끝나는 순서대로 결과를 yield 합니다.
+
+    Args:
+        items: 블로그 ID 또는 URL 목록 (중복 자동 제거)
+        analyze: blog_id를 받아 결과 딕셔너리를 반환하는 함수
+        workers: 동시에 분석할 최대 블로그 수
+    """
+    blog_ids = dedupe_blog_ids(items)
+    workers = max(1, min(workers, MAX_WORKERS, len(blog_ids) or 1))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blogcheck") as executor:
+        futures = [executor.submit(_run_one, analyze, blog_id) for blog_id in blog_ids]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(items, analyze, workers: int = DEFAULT_WORKERS) -> list:
+    """iter_batch 결과를 입력 순서대로 정렬해 리스트로 반환합니다."""
+    order = {blog_id: i for i, blog_id in enumerate(dedupe_blog_ids(items))}
+    rows = list(iter_batch(items, analyze, workers))
+    return sorted(rows, key=lambda row: order.get(row["blog_id"], len(order)))
+
+
+def _export_value(value):
+    if isinstance(value, (list, tuple)):
+        return " / ".join(str(v) for v in value)
+    return "" if value is None else value
+
+
+def to_csv(rows: list) -> str:
+    """엑셀에서 한글이 깨지지 않도록 BOM을 붙인 CSV 문자열"""
+    buffer = io.StringIO()
+    buffer.write("\ufeff")
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({key: _export_value(row.get(key)) for key in EXPORT_FIELDS})
+    return buffer.getvalue()
+
+
+def to_record(row: dict) -> dict:
+    """내보내기 열만 남긴 딕셔너리"""
+    return {key: row.get(key) for key in EXPORT_FIELDS}
+
+
+def to_json(rows: list) -> str:
+    return json.dumps(
+        [to_record(row) for row in rows],
+        ensure_ascii=False,
+        indent=2,
+        default=str,
+    )
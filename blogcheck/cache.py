@@ -0,0 +1,324 @@
+"""
+분석 결과 캐시
+- 같은 블로그를 다시 조회할 때 Selenium/HTTP 요청을 반복하지 않도록 단계별 결과를 TTL과 함께 저장합니다.
+- 항목 수와 바이트 크기 기준으로 가장 오래 쓰지 않은 항목부터 지웁니다. (LRU)
+- BLOGCHECK_CACHE_PATH를 지정하면 SQLite 파일에 저장해 Streamlit을 재시작해도 유지됩니다.
+- 같은 키를 동시에 조회하면 먼저 시작한 호출 하나만 실제로 실행하고, 나머지는 그 결과를 함께 받습니다. (요청 병합)
+
+사용 예:
+    cache = ResultCache.from_env()
+
+    @cached_result(lambda: cache, "blog_info")
+    def get_blog_info(blog_id, timer=None):
+        ...
+"""
+
+import copy
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from blogcheck.metrics import get_metrics
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# 단계별 TTL (초) - 방문자 수는 자주 바뀌고, 게시글 상세는 거의 바뀌지 않음
+# http는 조건부 요청용 원문(ETag/Last-Modified + 본문)으로, 만료 전에도 매번 서버에 바뀌었는지 확인함
+STEP_TTLS = {
+    "blog_info": _env_float("BLOGCHECK_TTL_BLOG_INFO", 5 * 60),
+    "post_detail": _env_float("BLOGCHECK_TTL_POST_DETAIL", 6 * 60 * 60),
+    "exposure": _env_float("BLOGCHECK_TTL_EXPOSURE", 30 * 60),
+    "http": _env_float("BLOGCHECK_TTL_HTTP", 7 * 24 * 60 * 60),
+}
+
+DEFAULT_MAX_ENTRIES = int(_env_float("BLOGCHECK_CACHE_MAX_ENTRIES", 5000))
+DEFAULT_MAX_BYTES = int(_env_float("BLOGCHECK_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+class MemoryBackend:
+    """프로세스 메모리에 저장하는 LRU 백엔드"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()  # key -> (만료 시각, 직렬화된 값)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, blob = item
+            if expires < time.time():
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return blob
+
+    def set(self, key: str, blob: bytes, ttl: float) -> None:
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = (time.time() + ttl, blob)
+            self._bytes += len(blob)
+            while self._items and (len(self._items) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._items)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def size(self) -> tuple:
+        with self._lock:
+            return len(self._items), self._bytes
+
+    def _remove(self, key: str) -> None:
+        _, blob = self._items.pop(key)
+        self._bytes -= len(blob)
+
+
+class SQLiteBackend:
+    """SQLite 파일에 저장하는 LRU 백엔드 (재시작 후에도 유지)"""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS result_cache ("
+            " key TEXT PRIMARY KEY, value BLOB, size INTEGER, expires REAL, accessed REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS result_cache_accessed ON result_cache (accessed)")
+        self._conn.commit()
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE result_cache SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, blob: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now + ttl, now),
+            )
+            self._conn.execute("DELETE FROM result_cache WHERE expires < ?", (now,))
+            self._evict()
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM result_cache")
+            self._conn.commit()
+
+    def size(self) -> tuple:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM result_cache"
+            ).fetchone()
+            return count, total
+
+    def _evict(self) -> None:
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM result_cache"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # 오래 쓰지 않은 순서로 한도 안에 들어올 때까지 삭제
+        rows = self._conn.execute("SELECT key, size FROM result_cache ORDER BY accessed").fetchall()
+        doomed = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM result_cache WHERE key = ?", doomed)
+
+
+class _Flight:
+    """실행 중인 조회 하나 (요청 병합용)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    단계별 TTL을 적용하는 결과 캐시
+
+    Args:
+        backend: MemoryBackend 또는 SQLiteBackend
+        ttls: 단계 이름 -> TTL(초)
+    """
+
+    def __init__(self, backend=None, ttls: dict = None):
+        self.backend = backend or MemoryBackend()
+        self.ttls = dict(STEP_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._flights = {}  # 캐시 키 -> 실행 중인 _Flight
+
+    @classmethod
+    def from_env(cls):
+        """BLOGCHECK_CACHE_PATH가 있으면 SQLite, 없으면 메모리 백엔드로 생성합니다."""
+        path = os.environ.get("BLOGCHECK_CACHE_PATH")
+        return cls(SQLiteBackend(path) if path else MemoryBackend())
+
+    def get(self, step: str, key: str, namespace: str = None):
+        """(찾았는지 여부, 값)을 반환하고 적중/미스 횟수를 기록합니다."""
+        blob = self.backend.get(f"{namespace or step}:{key}")
+        self._count(namespace or step, "hits" if blob is not None else "misses")
+        if blob is None:
+            return False, None
+        return True, pickle.loads(blob)
+
+    def set(self, step: str, key: str, value, namespace: str = None) -> None:
+        self.backend.set(f"{namespace or step}:{key}", pickle.dumps(value), self.ttls.get(step, 0))
+
+    def load(self, step: str, key: str, compute, valid=None, namespace: str = None):
+        """
+        캐시에 없는 값을 compute()로 구해 저장합니다.
+        같은 키를 이미 구하는 중이면 새로 실행하지 않고 그 결과(또는 예외)를 기다려 받습니다.
+        """
+        name = namespace or step
+        full_key = f"{name}:{key}"
+        with self._lock:
+            flight = self._flights.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full_key] = _Flight()
+
+        if not leader:
+            self._count(name, "coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # 캐시 적중과 같이 호출마다 독립된 객체를 돌려줌
+            return copy.deepcopy(flight.value)
+
+        try:
+            # 조회와 등록 사이에 다른 호출이 끝내고 저장했을 수 있음
+            blob = self.backend.get(full_key)
+            if blob is not None:
+                value = pickle.loads(blob)
+            else:
+                value = compute()
+                if valid is None or valid(value):
+                    self.set(step, key, value, namespace)
+            # 호출한 쪽이 돌려받은 값을 고칠 수 있으므로 기다리던 호출에는 따로 떠 둔 값을 나눠 줌
+            flight.value = copy.deepcopy(value)
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[full_key]
+            flight.done.set()
+
+    def stats(self) -> dict:
+        """이름공간별 hits/misses/coalesced/hit_rate"""
+        with self._lock:
+            stats = {}
+            for name, counts in self._stats.items():
+                total = counts["hits"] + counts["misses"]
+                stats[name] = dict(counts, hit_rate=round(counts["hits"] / total, 3) if total else 0.0)
+        stats["_size"] = dict(zip(("entries", "bytes"), self.backend.size()))
+        return stats
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def metric_samples(self) -> list:
+        """지표 수집기용 (이름, 종류, labels, 값) 목록"""
+        stats = self.stats()
+        size = stats.pop("_size")
+        samples = [
+            ("blogcheck_cache_entries", "gauge", {}, size["entries"]),
+            ("blogcheck_cache_bytes", "gauge", {}, size["bytes"]),
+        ]
+        for name, counts in stats.items():
+            samples += [
+                ("blogcheck_cache_hits_total", "counter", {"namespace": name}, counts["hits"]),
+                ("blogcheck_cache_misses_total", "counter", {"namespace": name}, counts["misses"]),
+                ("blogcheck_cache_coalesced_total", "counter", {"namespace": name}, counts["coalesced"]),
+                ("blogcheck_cache_hit_rate", "gauge", {"namespace": name}, counts["hit_rate"]),
+            ]
+        return samples
+
+    def _count(self, name: str, field: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(name, {"hits": 0, "misses": 0, "coalesced": 0})
+            counts[field] += 1
+
+
+def cached_result(get_cache, step: str, key=None, valid=None, namespace: str = None):
+    """
+    함수 결과를 ResultCache에 저장하는 데코레이터
+
+    Args:
+        get_cache: ResultCache를 반환하는 함수 (호출 시점에 가져옴)
+        step: TTL을 고를 단계 이름 (blog_info / post_detail / exposure)
+        key: 인자로 캐시 키를 만드는 함수 (기본: 첫 번째 인자)
+        valid: 결과를 저장할지 판단하는 함수 (실패 결과는 저장하지 않기 위함)
+        namespace: 결과 형태가 다른 함수끼리 키가 섞이지 않도록 구분하는 이름
+    """
+    key = key or (lambda *args, **kwargs: args[0])
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            cache_key = str(key(*args, **kwargs))
+            found, value = cache.get(step, cache_key, namespace)
+            if found:
+                return value
+            return cache.load(step, cache_key, lambda: func(*args, **kwargs), valid, namespace)
+        return wrapper
+
+    return decorator
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전체가 공유하는 결과 캐시 (BLOGCHECK_CACHE_PATH 지정 시 SQLite에 저장)"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultCache.from_env()
+            get_metrics().register_collector("cache", _shared_cache.metric_samples)
+        return _shared_cache
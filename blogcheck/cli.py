@@ -0,0 +1,154 @@
+"""
+명령줄 실행 (Streamlit 없이 분석)
+- --help 가 빠르게 뜨도록 selenium/lxml 등 무거운 모듈은 실제 분석 직전에 import 합니다.
+
+사용 예:
+    python -m blogcheck blog_id https://blog.naver.com/other_id
+    python -m blogcheck -f ids.csv -j 8 > results.jsonl
+    python -m blogcheck -f ids.csv --metrics-port 9108 --metrics-json metrics.json
+    python -m blogcheck -f watchlist.csv --history history.sqlite3 --incremental
+    python -m blogcheck -f ids.csv --processes 16 --drivers-per-process 2
+    python -m blogcheck -f ids.csv --tabs          # 실험 기능: Chrome 하나에 탭 여러 개
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from blogcheck.batch import DEFAULT_WORKERS, MAX_WORKERS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="blogcheck",
+        description="네이버 블로그 방문자 수, 최신글 품질, 검색 노출을 분석합니다.",
+    )
+    parser.add_argument("blogs", nargs="*", help="블로그 ID 또는 URL")
+    parser.add_argument("-f", "--file", help="블로그 ID/URL 목록 파일 (CSV 또는 한 줄에 하나, '-'는 표준 입력)")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시에 분석할 블로그 수 (기본 {DEFAULT_WORKERS}, 최대 {MAX_WORKERS})")
+    parser.add_argument("--processes", type=int, metavar="N",
+                        help="작업자 프로세스 N개로 분석 (프로세스마다 Chrome을 따로 띄움, -j 대신 사용)")
+    parser.add_argument("--drivers-per-process", type=int, default=2, metavar="N",
+                        help="--processes 사용 시 프로세스 하나가 띄울 최대 Chrome 수 (기본 2)")
+    parser.add_argument("--tabs", action="store_true",
+                        help="[실험 기능] Chrome을 여러 개 띄우는 대신 Chrome 하나에 탭을 열어 분석 (BLOGCHECK_TABS=1과 같음, "
+                             "실제 Chrome에서 더 빠른지는 측정하지 않음)")
+    parser.add_argument("--posts", type=int, default=0, metavar="N",
+                        help="최신 글 하나 대신 최근 N개 글을 추가로 분석해 요약 (기본 0: 끄기)")
+    parser.add_argument("--queries", type=int, default=1, metavar="N",
+                        help="검색 노출을 확인할 후보 검색어 수 (기본 1: 제목 상위 3단어만)")
+    parser.add_argument("--format", choices=["jsonl", "json", "csv"], default="jsonl",
+                        help="출력 형식 (기본 jsonl: 끝나는 순서대로 한 줄씩 출력)")
+    parser.add_argument("-o", "--output", help="결과 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그를 표준 에러로 출력")
+    parser.add_argument("--history", metavar="PATH",
+                        help="분석 결과를 쌓아 둘 SQLite 파일 (기본: 저장 안 함, --incremental이면 BLOGCHECK_HISTORY_PATH)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="최신 글이 지난 실행과 같으면 상세 분석을 생략하고 검색 순위만 다시 확인")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="분석하는 동안 http://0.0.0.0:PORT/metrics 에 Prometheus 지표를 제공 (--processes와 함께 못 씀)")
+    parser.add_argument("--metrics-json", metavar="PATH", help="끝난 뒤 지표를 JSON 파일로 저장 (--processes와 함께 못 씀)")
+    return parser
+
+
+def _read_input(args) -> list:
+    from blogcheck.batch import dedupe_blog_ids, read_blog_ids
+
+    items = list(args.blogs)
+    if args.file:
+        if args.file == "-":
+            text = sys.stdin.read()
+        else:
+            with open(args.file, encoding="utf-8-sig") as f:
+                text = f.read()
+        items += read_blog_ids(text)
+    return dedupe_blog_ids(items)
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+        stream=sys.stderr,
+    )
+
+    blog_ids = _read_input(args)
+    if not blog_ids:
+        build_parser().print_usage(sys.stderr)
+        print("blogcheck: 분석할 블로그 ID를 입력하세요.", file=sys.stderr)
+        return 2
+    if args.processes and (args.metrics_port or args.metrics_json):
+        # 지표는 작업자 프로세스마다 따로 쌓이므로 부모 프로세스에서는 비어 있음
+        print("blogcheck: --metrics-port/--metrics-json은 --processes와 함께 쓸 수 없습니다.", file=sys.stderr)
+        return 2
+
+    if args.tabs:
+        # 드라이버 풀과 작업자 프로세스가 환경 변수로 모드를 정하므로 풀을 만들기 전에 설정
+        os.environ["BLOGCHECK_TABS"] = "1"
+
+    import functools
+
+    from blogcheck.batch import iter_batch, to_csv, to_json, to_record
+    from blogcheck.crawler import analyze_blog
+    from blogcheck.metrics import get_metrics, serve_metrics
+    from blogcheck.pool import get_driver_pool
+
+    server = serve_metrics(args.metrics_port) if args.metrics_port else None
+
+    history = None
+    if args.history:
+        from blogcheck.history import HistoryStore
+        history = HistoryStore(args.history)
+    elif args.incremental:
+        from blogcheck.history import get_history_store
+        history = get_history_store()
+
+    worker_pool = None
+    if args.processes:
+        # 이력 저장소(SQLite 연결)는 넘길 수 없으므로 경로만 넘겨 작업자마다 엽니다
+        from blogcheck.procpool import ProcessWorkerPool
+        worker_pool = ProcessWorkerPool(
+            args.processes, drivers_per_process=args.drivers_per_process, deep_posts=args.posts,
+            queries=args.queries, incremental=args.incremental,
+            history_path=history.path if history is not None else None,
+        )
+        results = worker_pool.imap(blog_ids)
+    else:
+        analyze = functools.partial(analyze_blog, deep_posts=args.posts, queries=args.queries,
+                                    history=history, incremental=args.incremental)
+        results = iter_batch(blog_ids, analyze, workers=args.jobs)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    rows = []
+    try:
+        for i, row in enumerate(results, 1):
+            elapsed = row.get("elapsed")
+            logging.info("[%d/%d] %s (%s)", i, len(blog_ids), row["blog_id"],
+                         f"{elapsed:.2f}s" if elapsed is not None else row.get("error") or "-")
+            if args.format == "jsonl":
+                out.write(json.dumps(to_record(row), ensure_ascii=False, default=str) + "\n")
+                out.flush()
+            else:
+                rows.append(row)
+
+        if args.format == "json":
+            out.write(to_json(rows) + "\n")
+        elif args.format == "csv":
+            out.write(to_csv(rows))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if worker_pool is not None:
+            worker_pool.close()
+        get_driver_pool().close()
+        if args.metrics_json:
+            with open(args.metrics_json, "w", encoding="utf-8") as f:
+                json.dump(get_metrics().snapshot(), f, ensure_ascii=False, indent=2)
+        if server is not None:
+            server.shutdown()
+
+    return 0
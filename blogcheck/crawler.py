@@ -0,0 +1,361 @@
+"""
+네이버 블로그 크롤링 로직
+- Streamlit 없이 import 할 수 있도록 UI(naver_blog_crawler.py)에서 분리한 분석 함수들입니다.
+- 빠른 경로(HTTP)를 먼저 시도하고, 필요한 값이 없을 때만 드라이버 풀의 Chrome을 사용합니다.
+
+사용 예:
+    from blogcheck.crawler import analyze_blog
+    row = analyze_blog("blog_id")
+"""
+
+import asyncio
+import functools
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from blogcheck.aio import run_pipeline
+from blogcheck.cache import cached_result, get_result_cache
+from blogcheck.dedup import find_duplicates
+from blogcheck.deep import analyze_recent_posts
+from blogcheck.driver import count_commands
+from blogcheck.fast import (BLOG_INFO_REQUIRED, POST_DETAIL_REQUIRED, fetch_blog_info, fetch_post_detail, fetch_text,
+                            found_fields, is_complete, mobile_post_url, serp_url)
+from blogcheck.history import previous_detail
+from blogcheck.keywords import DEFAULT_KEYWORD_COUNT, extract_keywords, get_keyword_index, keyword_phrase, term_words
+from blogcheck.metrics import get_metrics, record_failure, timed
+from blogcheck.parser import (CONTENT_SELECTORS, POST_TITLE_SELECTORS, VISITOR_SELECTORS, normalize_query,
+                              parse_post_html, parse_profile_html, parse_serp_links, post_key)
+from blogcheck.pool import get_driver_pool
+from blogcheck.ratelimit import get_rate_limiter
+from blogcheck.wait import STEP_DEADLINES, StepTimer, wait_for_any, wait_for_groups
+
+logger = logging.getLogger(__name__)
+
+
+# --- 1. 유틸리티 함수들 ---
+def is_within_one_month(date_obj):
+    if not date_obj: return False
+    one_month_ago = datetime.now() - timedelta(days=30)
+    return date_obj >= one_month_ago
+
+# --- 2. 블로그 기본 정보 가져오기 ---
+@timed("get_blog_info")
+@cached_result(get_result_cache, "blog_info", valid=lambda r: r["latest_post_url"] is not None)
+def get_blog_info(blog_id, timer=None):
+    timer = timer or StepTimer()
+    result = {
+        "today_visitors": "확인 불가",
+        "total_visitors": "확인 불가", 
+        "latest_post_title": "글 없음",
+        "latest_post_url": None
+    }
+    
+    # 빠른 경로: 방문자 JSON과 RSS를 동시에 요청, 필요한 값이 모두 있으면 Chrome을 띄우지 않음
+    with timer.step("프로필 HTTP 조회"):
+        fast = fetch_blog_info(blog_id)
+    if is_complete(fast, BLOG_INFO_REQUIRED):
+        result.update(fast)
+        return result
+    
+    get_metrics().inc("blogcheck_selenium_fallback_total", step="get_blog_info")
+    try:
+        with get_driver_pool().driver() as driver, count_commands(driver) as commands:
+            url = f"https://m.blog.naver.com/{blog_id}"
+            with timer.step("프로필 페이지 로딩"):
+                get_rate_limiter().acquire(url)
+                driver.get(url)
+            with timer.step("방문자/글목록 대기"):
+                wait_for_groups(driver, [VISITOR_SELECTORS, POST_TITLE_SELECTORS], STEP_DEADLINES["profile"])
+            # 선택자마다 find_element/text를 호출하지 않고 렌더링된 DOM을 한 번에 받아 파싱
+            with timer.step("프로필 파싱"):
+                result.update(found_fields(parse_profile_html(driver.page_source, blog_id, driver.current_url)))
+            logger.debug("get_blog_info(%s) WebDriver 명령 %d회: %s", blog_id, sum(commands.values()), dict(commands))
+                
+    except Exception as e:
+        logger.warning("get_blog_info(%s) 실패: %s", blog_id, e)
+        record_failure("get_blog_info", e)
+    
+    # Selenium으로 찾은 값보다 빠른 경로에서 찾은 값을 우선
+    result.update(found_fields(fast))
+    return result
+
+# --- 3. 상세 페이지 분석 ---
+@timed("analyze_post_detail")
+@cached_result(get_result_cache, "post_detail", valid=lambda r: r["publish_date"] != "확인 불가",
+               key=lambda post_url, timer=None: mobile_post_url(post_url))
+def analyze_post_detail(post_url, timer=None):
+    timer = timer or StepTimer()
+    result = {
+        "publish_date": "확인 불가",
+        "publish_date_obj": None,
+        "char_count": 0,
+        "image_count": 0,
+        "like_count": "0",
+        "comment_count": "0",
+        "content_signature": None,
+        "content_terms": None
+    }
+    
+    if not post_url: return result
+    
+    # PC 주소/PostView 등 어떤 형식이든 모바일 PostView로 바꿔 iframe(mainFrame) 없이 본문을 바로 엶
+    post_url = mobile_post_url(post_url)
+    
+    # 빠른 경로: 게시글 HTML을 직접 받아 파싱
+    with timer.step("게시글 HTTP 조회"):
+        fast = fetch_post_detail(post_url)
+    if is_complete(fast, POST_DETAIL_REQUIRED):
+        result.update(found_fields(fast))
+        learn_keywords(post_url, result)
+        return result
+    
+    get_metrics().inc("blogcheck_selenium_fallback_total", step="analyze_post_detail")
+    try:
+        with get_driver_pool().driver() as driver, count_commands(driver) as commands:
+            with timer.step("게시글 페이지 로딩"):
+                get_rate_limiter().acquire(post_url)
+                driver.get(post_url)
+            with timer.step("본문 대기"):
+                wait_for_any(driver, CONTENT_SELECTORS, STEP_DEADLINES["post"])
+            # 날짜/본문/이미지/공감/댓글을 요소마다 조회하지 않고 DOM을 한 번에 받아 파싱
+            with timer.step("게시글 파싱"):
+                result.update(found_fields(parse_post_html(driver.page_source, body_fallback=True)))
+            logger.debug("analyze_post_detail(%s) WebDriver 명령 %d회: %s",
+                         post_url, sum(commands.values()), dict(commands))
+
+    except Exception as e:
+        logger.warning("analyze_post_detail(%s) 실패: %s", post_url, e)
+        record_failure("analyze_post_detail", e)
+    
+    result.update(found_fields(fast))
+    learn_keywords(post_url, result)
+    return result
+
+def learn_keywords(post_url, detail):
+    # 본문 단어를 키워드 문서 빈도 표에 더함 (검색어 선택용). 실패해도 분석은 계속
+    if not detail.get("content_terms"): return
+    key = post_key(post_url)
+    try:
+        get_keyword_index().add("/".join(key) if key else post_url, detail["content_terms"])
+    except Exception as e:
+        logger.warning("learn_keywords(%s) 실패: %s", post_url, e)
+        record_failure("learn_keywords", e)
+
+# --- 4. 검색 노출 확인 ---
+DEFAULT_QUERY_COUNT = 5
+MAX_QUERY_COUNT = 30
+SERP_WORKERS = 8
+
+def _clean_title(post_title):
+    return re.sub(r'[^\w\s가-힣]', ' ', post_title or "").strip()
+
+def build_search_query(post_title, scored=None):
+    # 제목 단어 중 TF-IDF 점수 상위 3개를 제목에 적힌 그대로, 제목 순서대로 이음 (분석한 글이 쌓일수록 흔한 단어는 밀려남)
+    clean_title = _clean_title(post_title)
+    search_query = keyword_phrase(clean_title, DEFAULT_KEYWORD_COUNT, scored=scored)
+    if not search_query:
+        search_query = clean_title[:20]
+    return search_query
+
+def build_search_queries(post_title, limit=DEFAULT_QUERY_COUNT):
+    # 후보 검색어: TF-IDF 상위 3단어 → 전체 제목 → 상위 2/4단어 → 연속 두 단어(bigram)를 점수 합 순으로
+    clean_title = _clean_title(post_title)
+    scored = extract_keywords(clean_title)
+    scores = dict(scored)
+    terms = term_words(clean_title)
+    
+    candidates = [build_search_query(post_title, scored), " ".join(clean_title.split())]
+    candidates += [keyword_phrase(clean_title, k, scored=scored) for k in (2, 4) if len(scored) >= k]
+    bigrams = sorted(zip(terms, terms[1:]), key=lambda pair: -(scores[pair[0][0]] + scores[pair[1][0]]))
+    candidates += [f"{a} {b}" for (_, a), (_, b) in bigrams]
+    
+    queries = []
+    for query in candidates:
+        if query and query not in queries:
+            queries.append(query)
+    return queries[:max(1, limit)]
+
+def exposure_message(rank, search_query):
+    if rank is None:
+        return False, f"❌ 20위권 밖 (키워드: {search_query})"
+    if rank == 1:
+        return True, f"🏅 1위! 키워드({search_query}) 최적화"
+    elif rank <= 3:
+        return True, f"✅ {rank}위 - 경쟁력 있음"
+    elif rank <= 10:
+        return False, f"⚠️ {rank}위 - 상위권 진입 필요"
+    else:
+        return False, f"❌ {rank}위 - 노출 약함"
+
+def find_rank(blog_id, links):
+    for i, link in enumerate(links):
+        key = post_key(link)
+        if key and key[0] == blog_id:
+            return i + 1
+    return None
+
+@timed("fetch_serp_links")
+@cached_result(get_result_cache, "exposure", namespace="serp", valid=lambda links: links is not None,
+               key=lambda search_query, timer=None: normalize_query(search_query))
+def fetch_serp_links(search_query, timer=None):
+    # 검색어별 상위 블로그 링크 (광고 제외). 정규화한 검색어가 같으면 블로그/사용자와 관계없이 캐시를 공유하고,
+    # 동시에 같은 검색어를 조회하면 요청 하나만 보냄. 순위는 find_rank로 어떤 blog_id든 이 목록에서 찾음
+    # 실패하면 None
+    timer = timer or StepTimer()
+    search_url = serp_url(normalize_query(search_query))
+    
+    with timer.step("검색 결과 HTTP 조회"):
+        links = parse_serp_links(fetch_text(search_url))
+    if links:
+        return links
+    
+    get_metrics().inc("blogcheck_selenium_fallback_total", step="fetch_serp_links")
+    try:
+        with get_driver_pool().driver() as driver:
+            with timer.step("검색 결과 로딩"):
+                get_rate_limiter().acquire(search_url)
+                driver.get(search_url)
+            with timer.step("검색 결과 링크 대기"):
+                wait_for_any(driver, ['a[href*="blog.naver.com"]'], STEP_DEADLINES["serp"])
+            return parse_serp_links(driver.page_source)
+    except Exception as e:
+        logger.warning("fetch_serp_links(%s) 실패: %s", search_query, e)
+        record_failure("fetch_serp_links", e)
+        return None
+
+def _exposure_from_links(blog_id, search_query, result_links):
+    if result_links is None:
+        return False, "에러: 검색 결과를 가져오지 못했습니다"
+    if not result_links:
+        return False, "❌ 검색 결과 없음"
+    return exposure_message(find_rank(blog_id, result_links), search_query)
+
+@timed("check_search_exposure")
+def check_search_exposure_ranked(blog_id, post_title, timer=None):
+    # 검색어 하나의 노출 확인 결과와 실제로 쓴 검색어/순위
+    # 반환: {"query", "rank", "exposed", "message"} (제목이 없거나 검색어로 쓸 단어가 없으면 query/rank는 None)
+    # 검색어는 키워드 문서 빈도에 따라 달라지므로 한 번만 만들어 메시지와 순위에 같이 씀
+    search_query = build_search_query(post_title) if post_title and post_title != "글 없음" else ""
+    if not search_query:
+        return {"query": None, "rank": None, "exposed": False, "message": "제목 없음"}
+    
+    links = fetch_serp_links(search_query, timer)
+    is_good, message = _exposure_from_links(blog_id, search_query, links)
+    return {"query": search_query, "rank": find_rank(blog_id, links or []), "exposed": is_good, "message": message}
+
+def check_search_exposure(blog_id, post_title, timer=None):
+    result = check_search_exposure_ranked(blog_id, post_title, timer)
+    return result["exposed"], result["message"]
+
+@timed("check_search_exposure_multi")
+def check_search_exposure_multi(blog_id, post_title, timer=None, max_queries=DEFAULT_QUERY_COUNT):
+    # 후보 검색어 여러 개의 노출 순위를 동시에 확인
+    # 반환: {"primary": 첫 검색어의 (노출 여부, 메시지), "queries": [{"query", "rank", "exposed", "message"}],
+    #        "best_rank", "worst_rank"(하나라도 20위권 밖이면 None), "exposed_count"(10위 이내 검색어 수)}
+    # 제목이 없거나 이모지만 있는 제목처럼 검색어로 쓸 단어가 없으면 검색하지 않음
+    queries = (build_search_queries(post_title, min(max_queries, MAX_QUERY_COUNT))
+               if post_title and post_title != "글 없음" else [])
+    if not queries:
+        return {"primary": (False, "제목 없음"), "queries": [], "best_rank": None, "worst_rank": None, "exposed_count": 0}
+    
+    with ThreadPoolExecutor(max_workers=min(SERP_WORKERS, len(queries)), thread_name_prefix="blogcheck-serp") as executor:
+        link_lists = list(executor.map(lambda q: fetch_serp_links(q, timer), queries))
+    
+    rows = []
+    for query, links in zip(queries, link_lists):
+        is_good, message = _exposure_from_links(blog_id, query, links)
+        rows.append({"query": query, "rank": find_rank(blog_id, links or []), "exposed": is_good, "message": message})
+    
+    ranks = [row["rank"] for row in rows if row["rank"] is not None]
+    return {
+        "primary": (rows[0]["exposed"], rows[0]["message"]),
+        "queries": rows,
+        "best_rank": min(ranks) if ranks else None,
+        "worst_rank": max(ranks) if len(ranks) == len(rows) else None,
+        "exposed_count": sum(1 for rank in ranks if rank <= 10),
+    }
+
+# --- 5. 전체 분석 파이프라인 ---
+def diagnose_quality(detail):
+    warns = []
+    if detail['char_count'] < 1000: warns.append("글자 수 부족 (1,000자 미만)")
+    if detail['image_count'] < 5: warns.append("이미지 부족 (5장 미만)")
+    if not is_within_one_month(detail['publish_date_obj']): warns.append("최근 활동 뜸함")
+    if detail.get('duplicates'): warns.append(f"유사 문서 {len(detail['duplicates'])}건 (복사/짜깁기 의심)")
+    return warns
+
+@timed("check_duplicates")
+def check_duplicates(blog_id, post_url, detail, recent_posts=()):
+    # 최신 글(+ 최근 글)을 유사 문서 색인에 넣고 비교. detail["duplicates"]에 최신 글과 비슷한 글 주소를 채움
+    # 반환: find_duplicates 결과 (실패하면 None, 분석은 계속)
+    if not post_url: return None
+    posts = [dict(detail, url=post_url, blog_id=blog_id)] + [dict(p, blog_id=blog_id) for p in recent_posts]
+    try:
+        result = find_duplicates(posts)
+    except Exception as e:
+        logger.warning("check_duplicates(%s) 실패: %s", blog_id, e)
+        record_failure("check_duplicates", e)
+        return None
+    detail["duplicates"] = [url for _, _, url in result["matches"].get(post_url, [])]
+    return result
+
+def incremental_post_detail(previous):
+    # 최신 글이 지난 실행과 같으면 저장된 상세 지표를 쓰고, 바뀌었을 때만 analyze_post_detail 실행
+    def detail_step(post_url, timer=None):
+        return previous_detail(previous, post_url) or analyze_post_detail(post_url, timer)
+    return detail_step
+
+@timed("analyze_blog")
+def analyze_blog(blog_id, timer=None, deep_posts=0, queries=1, history=None, incremental=False):
+    # 프로필 → 최신글 상세 → 검색 노출 순서로 분석해 한 줄짜리 결과로 반환 (일괄 분석용)
+    # 상세 분석과 검색 노출 확인은 서로 독립적이므로 동시에 실행
+    # deep_posts > 0 이면 최근 글 N개 심층 분석 요약(summary 키들)을 함께 담음
+    # queries > 1 이면 후보 검색어 여러 개의 최고/최저 순위를 함께 담음
+    # history(HistoryStore)가 있으면 결과를 저장하고, incremental이면 최신 글이 그대로일 때 상세 분석을 생략
+    timer = timer or StepTimer()
+    previous = history.latest(blog_id) if history is not None and incremental else None
+    check_exposure = (functools.partial(check_search_exposure_multi, max_queries=queries)
+                      if queries > 1 else check_search_exposure_ranked)
+    detail_step = incremental_post_detail(previous) if previous else analyze_post_detail
+    info, detail, exposure = asyncio.run(
+        run_pipeline(blog_id, get_blog_info, detail_step, check_exposure, timer))
+    row = dict(info, blog_id=blog_id)
+    
+    if detail is None:
+        row["warnings"] = ["최신 글 없음"]
+        if history is not None:
+            history.record(row)
+        return row
+    
+    deep = None
+    if deep_posts:
+        with timer.step(f"최근 글 {deep_posts}개 분석"):
+            deep = analyze_recent_posts(blog_id, analyze_post_detail, deep_posts)
+    duplicates = check_duplicates(blog_id, info["latest_post_url"], detail, deep["posts"] if deep else ())
+    row.update(detail)
+    row.pop("publish_date_obj", None)
+    row.pop("content_signature", None)
+    row.pop("content_terms", None)
+    row.pop("duplicates", None)
+    row["duplicate_ratio"] = duplicates["duplicate_ratio"] if duplicates else None
+    row["duplicate_urls"] = detail.get("duplicates") or []
+    row["warnings"] = diagnose_quality(detail)
+    if queries > 1:
+        row["exposure_ok"], row["exposure_msg"] = exposure["primary"]
+        row["exposure_queries"] = len(exposure["queries"])
+        row["exposure_best_rank"] = exposure["best_rank"]
+        row["exposure_worst_rank"] = exposure["worst_rank"]
+        row["exposure_rank"] = exposure["queries"][0]["rank"] if exposure["queries"] else None
+    else:
+        row["exposure_ok"], row["exposure_msg"] = exposure["exposed"], exposure["message"]
+        row["exposure_rank"] = exposure["rank"]
+    row["incremental"] = previous_detail(previous, info["latest_post_url"]) is not None
+    
+    if deep:
+        row.update(deep["summary"])
+    if history is not None:
+        history.record(row)
+    return row
+
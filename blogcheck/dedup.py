@@ -0,0 +1,201 @@
+"""
+유사 문서(복사/짜깁기 글) 탐지
+- 게시글 본문을 글자 단위 shingle로 나누고 MinHash 서명(128개 값)을 만듭니다. (NumPy로 한 번에 계산)
+- 서명을 LSH 밴드(16개 × 8행)로 나눠 SQLite에 저장하므로, 새 글은 전체와 비교하지 않고 같은 버킷의 후보만 비교합니다.
+- 추정 유사도(Jaccard)가 DUPLICATE_THRESHOLD 이상이면 중복으로 봅니다. 같은 블로그의 다른 글과 다른 블로그의 글 모두 대상입니다.
+- BLOGCHECK_DEDUP_PATH로 색인 파일 위치를 지정합니다. (기본: 현재 폴더의 blogcheck_dedup.sqlite3)
+
+사용 예:
+    signature = minhash_signature(body_text)
+    index = get_duplicate_index()
+    index.add(("blog_id", "223300000001"), "blog_id", url, signature)
+    index.query(signature)  # [(유사도, (blogId, logNo), url), ...]
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+DUPLICATE_THRESHOLD = 0.8
+DEFAULT_DEDUP_PATH = "blogcheck_dedup.sqlite3"
+
+# 해시 (a * x + b) mod p 의 계수 - 실행마다 같아야 저장된 서명과 비교할 수 있으므로 시드 고정
+_PRIME = np.uint64(4294967311)  # 2^32보다 큰 소수
+_rng = np.random.default_rng(20240520)
+_A = _rng.integers(1, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """공백을 뺀 본문의 연속 size글자 조각 집합 (한국어는 띄어쓰기가 들쭉날쭉해 단어보다 글자 단위가 안정적)"""
+    text = "".join((text or "").lower().split())
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(text: str) -> bytes:
+    """
+    본문의 MinHash 서명 (uint32 NUM_PERM개를 이어 붙인 bytes). 본문이 SHINGLE_SIZE글자보다 짧으면 None.
+    """
+    pieces = shingles(text)
+    if not pieces:
+        return None
+    hashes = np.fromiter((zlib.crc32(p.encode("utf-8")) for p in pieces), dtype=np.uint64, count=len(pieces))
+    # (순열 수 × shingle 수) 행렬에서 순열마다 최솟값
+    permuted = (np.outer(_A, hashes) + _B[:, None]) % _PRIME
+    return permuted.min(axis=1).astype(np.uint32).tobytes()
+
+
+def _values(signature: bytes) -> np.ndarray:
+    return np.frombuffer(signature, dtype=np.uint32)
+
+
+def similarity(signature_a: bytes, signature_b: bytes) -> float:
+    """두 서명의 추정 Jaccard 유사도 (0~1)"""
+    return float(np.mean(_values(signature_a) == _values(signature_b)))
+
+
+def band_buckets(signature: bytes) -> list:
+    """LSH 밴드별 버킷 값 (밴드 번호를 섞어 해시하므로 한 열로 조회 가능)"""
+    values = _values(signature)
+    buckets = []
+    for band in range(BANDS):
+        rows = values[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(band.to_bytes(1, "big") + rows.tobytes(), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+def _post_id(key: tuple) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+class DuplicateIndex:
+    """
+    MinHash LSH 색인 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " post_id TEXT PRIMARY KEY, blog_id TEXT NOT NULL, url TEXT, signature BLOB NOT NULL, indexed_at REAL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS bands (bucket INTEGER NOT NULL, post_id TEXT NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS bands_bucket ON bands (bucket)")
+        self._conn.commit()
+
+    def add(self, key: tuple, blog_id: str, url: str, signature: bytes) -> None:
+        """글 하나의 서명을 색인에 넣습니다. 같은 글(key)이 있으면 바꿉니다."""
+        post_id = _post_id(key)
+        with self._lock:
+            self._conn.execute("DELETE FROM bands WHERE post_id = ?", (post_id,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posts (post_id, blog_id, url, signature, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (post_id, blog_id, url, signature, time.time()),
+            )
+            self._conn.executemany("INSERT INTO bands (bucket, post_id) VALUES (?, ?)",
+                                   [(bucket, post_id) for bucket in band_buckets(signature)])
+            self._conn.commit()
+
+    def signature(self, key: tuple) -> bytes:
+        """저장된 서명 (없으면 None). 증분 분석처럼 본문을 다시 받지 않은 글에 사용"""
+        with self._lock:
+            row = self._conn.execute("SELECT signature FROM posts WHERE post_id = ?", (_post_id(key),)).fetchone()
+        return row[0] if row else None
+
+    def query(self, signature: bytes, exclude: tuple = None, threshold: float = DUPLICATE_THRESHOLD) -> list:
+        """
+        같은 LSH 버킷에 든 글 중 추정 유사도가 threshold 이상인 글
+
+        Returns:
+            [(유사도, (blogId, logNo), url)] 리스트 (유사도 높은 순)
+        """
+        buckets = band_buckets(signature)
+        excluded = _post_id(exclude) if exclude else None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_id, url, signature FROM posts WHERE post_id IN "
+                f"(SELECT DISTINCT post_id FROM bands WHERE bucket IN ({', '.join('?' * len(buckets))}))",
+                buckets,
+            ).fetchall()
+        matches = []
+        for post_id, url, other in rows:
+            if post_id == excluded:
+                continue
+            score = similarity(signature, other)
+            if score >= threshold:
+                matches.append((round(score, 3), tuple(post_id.split("/", 1)), url))
+        return sorted(matches, reverse=True)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def find_duplicates(posts: list, index: DuplicateIndex = None, threshold: float = DUPLICATE_THRESHOLD) -> dict:
+    """
+    분석한 글들을 색인에 넣고, 글마다 유사 문서를 찾습니다.
+
+    Args:
+        posts: {"url", "blog_id", "content_signature"(없으면 색인에 저장된 서명 사용)} 딕셔너리 리스트
+        index: DuplicateIndex (기본: get_duplicate_index())
+
+    Returns:
+        {"duplicate_ratio": 유사 문서가 있는 글 비율 (서명이 있는 글 기준, 없으면 None),
+         "matches": {url: [(유사도, (blogId, logNo), url)]}}
+    """
+    from blogcheck.parser import post_key
+
+    index = index or get_duplicate_index()
+    signed = []
+    seen = set()
+    for post in posts:
+        key = post_key(post.get("url"))
+        if key is None or key in seen:
+            continue
+        signature = post.get("content_signature") or index.signature(key)
+        if signature is None:
+            continue
+        seen.add(key)
+        # 같은 묶음의 글끼리도 비교되도록 먼저 모두 넣고 조회
+        index.add(key, post.get("blog_id") or key[0], post["url"], signature)
+        signed.append((post["url"], key, signature))
+
+    matches = {url: index.query(signature, exclude=key, threshold=threshold) for url, key, signature in signed}
+    return {
+        "duplicate_ratio": round(sum(1 for found in matches.values() if found) / len(signed), 2) if signed else None,
+        "matches": matches,
+    }
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_duplicate_index() -> DuplicateIndex:
+    """프로세스 전체가 공유하는 유사 문서 색인 (BLOGCHECK_DEDUP_PATH)"""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = DuplicateIndex(os.environ.get("BLOGCHECK_DEDUP_PATH", DEFAULT_DEDUP_PATH))
+        return _shared_index
@@ -0,0 +1,102 @@
+"""
+최근 글 N개 심층 분석
+- 최신 글 하나가 아니라 최근 N개 글을 동시에 분석해 품질 진단의 표본을 늘립니다.
+- 글 목록은 RSS 한 번으로 받아오고, 게시글은 작업자 풀에서 병렬로 분석합니다.
+- 블로그마다 시간 예산이 있어, 예산을 넘기면 끝난 글까지만 집계합니다.
+"""
+
+import os
+import statistics
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from blogcheck.fast import fetch_recent_posts
+
+
+DEFAULT_DEEP_POSTS = 10
+MAX_DEEP_POSTS = 30
+DEEP_WORKERS = 8
+DEEP_TIME_BUDGET = float(os.environ.get("BLOGCHECK_DEEP_TIME_BUDGET", 20))
+
+# 이미지 수 분포 구간 (이상, 미만)
+IMAGE_BUCKETS = [("0장", 0, 1), ("1~4장", 1, 5), ("5~9장", 5, 10), ("10장 이상", 10, None)]
+
+
+def _median(values: list):
+    return statistics.median(values) if values else None
+
+
+def summarize_posts(posts: list) -> dict:
+    """
+    분석된 글 목록을 집계합니다.
+
+    Args:
+        posts: analyze_post_detail 결과에 title/url/pub_date가 더해진 딕셔너리 리스트 (최신순)
+    """
+    chars = [p["char_count"] for p in posts if p.get("char_count")]
+    images = [p["image_count"] for p in posts if p.get("image_count") is not None]
+    dates = sorted((p["pub_date"] for p in posts if p.get("pub_date")), reverse=True)
+    intervals = [(newer - older).total_seconds() / 86400 for newer, older in zip(dates, dates[1:])]
+
+    distribution = {}
+    for label, low, high in IMAGE_BUCKETS:
+        distribution[label] = sum(1 for n in images if n >= low and (high is None or n < high))
+
+    return {
+        "posts_analyzed": len(posts),
+        "median_char_count": _median(chars),
+        "median_image_count": _median(images),
+        "image_count_distribution": distribution,
+        "short_post_ratio": round(sum(1 for n in chars if n < 1000) / len(chars), 2) if chars else None,
+        "median_post_interval_days": round(_median(intervals), 1) if intervals else None,
+        "posts_per_week": round(7 / _median(intervals), 1) if intervals and _median(intervals) > 0 else None,
+    }
+
+
+def analyze_recent_posts(blog_id: str, analyze_post_detail, limit: int = DEFAULT_DEEP_POSTS,
+                         workers: int = DEEP_WORKERS, budget: float = DEEP_TIME_BUDGET) -> dict:
+    """
+    최근 글 limit개를 병렬로 분석하고 집계합니다.
+
+    Args:
+        blog_id: 블로그 ID
+        analyze_post_detail: 게시글 주소를 받아 상세 딕셔너리를 반환하는 함수
+        limit: 분석할 글 수 (최대 MAX_DEEP_POSTS)
+        workers: 동시에 분석할 글 수
+        budget: 블로그 하나에 쓸 최대 시간 (초)
+
+    Returns:
+        {"posts": [...], "summary": {...}, "skipped": 예산 초과로 빠진 글 수}
+    """
+    deadline = time.monotonic() + budget
+    posts = fetch_recent_posts(blog_id)[:max(1, min(limit, MAX_DEEP_POSTS))]
+
+    done_posts = []
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(posts) or 1)),
+                                  thread_name_prefix="blogcheck-deep")
+    futures = {executor.submit(analyze_post_detail, post["url"]): post for post in posts}
+    pending = set(futures)
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            finished, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    detail = dict(future.result())
+                except Exception:
+                    continue
+                detail.update(futures[future])
+                done_posts.append(detail)
+    finally:
+        # 예산을 넘긴 글은 기다리지 않음 (시작 전인 작업은 취소)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    order = {post["url"]: i for i, post in enumerate(posts)}
+    done_posts.sort(key=lambda p: order.get(p["url"], len(order)))
+    return {
+        "posts": done_posts,
+        "summary": summarize_posts(done_posts),
+        "skipped": len(posts) - len(done_posts),
+    }
@@ -0,0 +1,258 @@
+"""
+Chrome WebDriver 생성
+- 두 Streamlit 앱이 같은 옵션으로 드라이버를 만들도록 한 곳에 모아둡니다.
+- 분석에는 이미지 픽셀/폰트/동영상/광고 스크립트가 필요 없으므로 기본으로 차단합니다. (CDP Network.setBlockedURLs)
+  img의 src 속성은 그대로 남아 이미지 수 집계에는 영향이 없습니다.
+- BLOGCHECK_BLOCK_RESOURCES로 차단할 분류를 고릅니다. (예: "fonts,media", 끄려면 "none")
+- chromedriver 경로는 프로세스에서 한 번만 정합니다. BLOGCHECK_CHROMEDRIVER_PATH → 시스템 설치 경로 →
+  ChromeDriverManager 순서로 찾으므로, 경로를 지정하면 첫 분석 때 드라이버 확인/다운로드를 하지 않습니다.
+- BLOGCHECK_USER_DATA_DIR를 지정하면 Chrome마다 그 아래 profile-N 폴더를 프로필로 써서,
+  재시작 뒤에도 디스크 캐시와 쿠키가 남습니다.
+"""
+
+import logging
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1"
+)
+
+# 서버 환경에서 chromium 바이너리를 찾을 경로 후보
+CHROME_BINARY_PATHS = [
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/usr/bin/google-chrome-stable",
+]
+
+# 시스템에 설치된 chromedriver 경로 후보
+CHROMEDRIVER_PATHS = [
+    "/usr/bin/chromedriver",
+    "/usr/lib/chromium/chromedriver",
+    "/usr/lib/chromium-browser/chromedriver",
+]
+
+# 분류별 차단 URL 패턴 (CDP 와일드카드)
+BLOCKED_URL_PATTERNS = {
+    "images": [
+        "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.bmp", "*.svg", "*.ico",
+        "*.jpg?*", "*.jpeg?*", "*.png?*", "*.gif?*", "*.webp?*", "*.JPG?*", "*.JPEG?*", "*.PNG?*",
+        "*://postfiles.pstatic.net/*", "*://blogfiles.pstatic.net/*", "*://mblogthumb-phinf.pstatic.net/*",
+        "*://search.pstatic.net/*", "*://dthumb-phinf.pstatic.net/*", "*://storep-phinf.pstatic.net/*",
+    ],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*.woff2?*", "*.woff?*"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.ts", "*.mp3", "*://*.vod.naver.com/*", "*://apis.naver.com/rmcnmv/*"],
+    "trackers": [
+        "*://ader.naver.com/*", "*://*.ad.naver.com/*", "*://siape.veta.naver.com/*", "*://tivan.naver.com/*",
+        "*://nlog.naver.com/*", "*://lcs.naver.com/*", "*://wcs.naver.com/*", "*://wcs.naver.net/*",
+        "*://cc.naver.com/*", "*://*.doubleclick.net/*", "*://*.google-analytics.com/*",
+        "*://*.googletagmanager.com/*", "*://*.googlesyndication.com/*",
+    ],
+}
+# 문서, 스크립트, XHR, 스타일시트는 본문 렌더링과 검색 결과 로딩에 필요하므로 어떤 분류에도 넣지 않음
+
+DEFAULT_BLOCKED_RESOURCES = "images,fonts,media,trackers"
+
+# 페이지 로드 측정 스크립트 - 차단된 요청은 resource 항목에 나타나지 않음
+_PAGE_LOAD_JS = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var resources = performance.getEntriesByType('resource');
+var bytes = nav.transferSize || 0;
+resources.forEach(function(r) { bytes += r.transferSize || 0; });
+return {
+    load_ms: Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || 0),
+    dom_ready_ms: Math.round(nav.domContentLoadedEventEnd || 0),
+    bytes: bytes,
+    requests: resources.length + 1
+};
+"""
+
+
+def blocked_resources(value: str = None) -> list:
+    """
+    차단할 분류 목록 (BLOGCHECK_BLOCK_RESOURCES, 기본: 전체)
+    - "none" 또는 빈 문자열이면 차단하지 않음, 알 수 없는 이름은 무시
+    """
+    if value is None:
+        value = os.environ.get("BLOGCHECK_BLOCK_RESOURCES", DEFAULT_BLOCKED_RESOURCES)
+    names = [name.strip() for name in value.split(",")]
+    return [name for name in names if name in BLOCKED_URL_PATTERNS]
+
+
+def blocked_url_patterns(resources: list) -> list:
+    return [pattern for name in resources for pattern in BLOCKED_URL_PATTERNS[name]]
+
+
+_driver_path = None
+_driver_path_resolved = False
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """
+    chromedriver 경로를 정합니다. 프로세스에서 처음 한 번만 찾고 이후에는 저장된 값을 씁니다.
+    None이면 selenium이 PATH에서 찾도록 맡깁니다.
+    """
+    global _driver_path, _driver_path_resolved
+    with _driver_path_lock:
+        if _driver_path_resolved:
+            return _driver_path
+
+        configured = os.environ.get("BLOGCHECK_CHROMEDRIVER_PATH")
+        if configured and not os.path.exists(configured):
+            logger.warning("BLOGCHECK_CHROMEDRIVER_PATH 경로가 없습니다: %s", configured)
+            configured = None
+        path = configured or next((p for p in CHROMEDRIVER_PATHS if os.path.exists(p)), None)
+        if path is None:
+            try:
+                # 로컬 환경: ChromeDriverManager로 한 번만 확인/다운로드
+                path = ChromeDriverManager().install()
+            except Exception as e:
+                # Streamlit Cloud 환경: 시스템에 설치된 chromium-driver 사용 (원인은 남겨 둠)
+                logger.warning("ChromeDriverManager로 드라이버를 찾지 못해 시스템 chromedriver 사용: %s", e)
+
+        _driver_path = path
+        _driver_path_resolved = True
+        return path
+
+
+_profiles_in_use = set()
+_profiles_lock = threading.Lock()
+
+
+def _claim_profile_dir() -> str:
+    """BLOGCHECK_USER_DATA_DIR 아래에서 다른 Chrome이 쓰고 있지 않은 프로필 폴더를 고릅니다."""
+    root = os.environ.get("BLOGCHECK_USER_DATA_DIR")
+    if not root:
+        return None
+    with _profiles_lock:
+        index = 0
+        while True:
+            path = os.path.abspath(os.path.join(root, f"profile-{index}"))
+            # SingletonLock은 다른 프로세스의 Chrome이 같은 프로필을 열고 있다는 표시
+            if path not in _profiles_in_use and not os.path.lexists(os.path.join(path, "SingletonLock")):
+                _profiles_in_use.add(path)
+                os.makedirs(path, exist_ok=True)
+                return path
+            index += 1
+
+
+def _release_profile(path: str) -> None:
+    if path:
+        with _profiles_lock:
+            _profiles_in_use.discard(path)
+
+
+def release_profile_dir(driver) -> None:
+    """드라이버를 종료한 뒤 프로필 폴더를 다른 Chrome이 쓸 수 있게 돌려놓습니다."""
+    _release_profile(getattr(driver, "blogcheck_profile_dir", None))
+
+
+def build_chrome_options(resources: list = None, user_data_dir: str = None,
+                         page_load_strategy: str = "eager") -> Options:
+    """Headless 모바일 Chrome 옵션을 만듭니다."""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-software-rasterizer")
+    # DOMContentLoaded까지만 기다리고, 나머지는 단계별 선택자 대기로 처리 (탭 모드는 "none", blogcheck.tabs 참고)
+    chrome_options.page_load_strategy = page_load_strategy
+    chrome_options.add_argument(f"user-agent={MOBILE_USER_AGENT}")
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    resources = blocked_resources() if resources is None else resources
+    if "images" in resources:
+        # CDP 패턴에 걸리지 않는 이미지도 내려받지 않음 (태그와 src 속성은 유지)
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    for path in CHROME_BINARY_PATHS:
+        if os.path.exists(path):
+            chrome_options.binary_location = path
+            break
+
+    return chrome_options
+
+
+def apply_resource_blocking(driver, resources: list) -> None:
+    """드라이버의 현재 탭에 URL 차단 패턴을 적용합니다. (빈 목록이면 차단 해제)"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(resources)})
+
+
+def _start_chrome(driver_path: str, chrome_options: Options):
+    if driver_path:
+        try:
+            return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+        except Exception as e:
+            # 지정한 chromedriver가 Chrome 버전과 맞지 않는 경우 등: selenium이 찾는 드라이버로 재시도
+            logger.warning("chromedriver(%s)로 Chrome 시작 실패, 기본 드라이버로 재시도: %s", driver_path, e)
+    return webdriver.Chrome(options=chrome_options)
+
+
+def create_driver(resources: list = None, page_load_strategy: str = "eager"):
+    """
+    Selenium WebDriver를 새로 생성합니다. (Headless 모드)
+    Streamlit Cloud 환경에서도 동작하도록 예외 처리 포함.
+
+    Args:
+        resources: 차단할 리소스 분류 (기본: BLOGCHECK_BLOCK_RESOURCES)
+        page_load_strategy: "eager"(기본) 또는 "none"(명령이 페이지 로딩을 기다리지 않음)
+    """
+    resources = blocked_resources() if resources is None else resources
+    profile_dir = _claim_profile_dir()
+    chrome_options = build_chrome_options(resources, profile_dir, page_load_strategy)
+    try:
+        driver = _start_chrome(resolve_driver_path(), chrome_options)
+    except Exception:
+        _release_profile(profile_dir)
+        raise
+
+    driver.blogcheck_profile_dir = profile_dir
+    if resources:
+        apply_resource_blocking(driver, resources)
+    return driver
+
+
+def measure_page_load(driver) -> dict:
+    """
+    마지막으로 연 페이지의 로드 시간(ms)과 전송 바이트, 요청 수를 Performance API로 측정합니다.
+    - transferSize는 교차 출처 리소스에서 0일 수 있어 실제보다 작게 나올 수 있음
+    """
+    return driver.execute_script(_PAGE_LOAD_JS)
+
+
+@contextmanager
+def count_commands(driver):
+    """
+    블록 안에서 driver가 보낸 WebDriver 명령(HTTP 왕복)을 명령 이름별로 셉니다.
+
+    사용 예:
+        with count_commands(driver) as commands:
+            driver.get(url)
+        sum(commands.values())  # 1
+    """
+    commands = Counter()
+    execute = driver.execute
+
+    def counting_execute(command, params=None):
+        commands[command] += 1
+        return execute(command, params)
+
+    driver.execute = counting_execute
+    try:
+        yield commands
+    finally:
+        del driver.execute
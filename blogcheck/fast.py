@@ -0,0 +1,156 @@
+"""
+HTTP 빠른 경로 (Chrome 없이 조회)
+- 방문자 수는 모바일 블로그 JSON, 최신 글은 RSS, 게시글 상세는 모바일 게시글 HTML에서 가져옵니다.
+- 게시글 주소는 어떤 형식이든 모바일 PostView 주소(blogId + logNo)로 바꿔, mainFrame iframe 없이 한 번에 본문을 받습니다.
+- 찾지 못한 값은 None으로 반환하며, 필요한 값이 빠졌을 때만 Selenium 경로로 넘어갑니다.
+- 요청은 공유 HTTP 클라이언트(blogcheck.httpclient)로 보내 연결 재사용, 압축, 조건부 요청(304)을 적용합니다.
+"""
+
+import json
+import os
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+from lxml import etree
+
+from blogcheck.httpclient import fetch_text
+from blogcheck.parser import parse_post_html, post_key
+
+
+# 접속 주소 (로컬 목업 서버로 바꿔 테스트할 수 있도록 환경 변수로 조정)
+MOBILE_BLOG_BASE = os.environ.get("BLOGCHECK_MOBILE_BLOG_BASE", "https://m.blog.naver.com")
+RSS_BASE = os.environ.get("BLOGCHECK_RSS_BASE", "https://rss.blog.naver.com")
+SEARCH_BASE = os.environ.get("BLOGCHECK_SEARCH_BASE", "https://m.search.naver.com")
+
+# 빠른 경로에서 반드시 채워져야 Selenium을 건너뛰는 필드
+BLOG_INFO_REQUIRED = ["today_visitors", "total_visitors", "latest_post_title", "latest_post_url"]
+POST_DETAIL_REQUIRED = ["publish_date", "char_count", "image_count"]
+
+def _load_json(text: str):
+    # 네이버 JSON 응답 앞에 붙는 XSSI 방지 접두어 ")]}'," 제거
+    if not text:
+        return None
+    text = text.strip()
+    if text.startswith(")]}'"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[5:]
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def mobile_post_url(link: str) -> str:
+    """
+    게시글 링크를 모바일 PostView 주소(m.blog.naver.com/PostView.naver?blogId=&logNo=)로 바꿉니다.
+    - blog.naver.com / m.blog.naver.com / PostView.naver·nhn 형식과 RSS 추적 파라미터 모두 지원
+    - 글 링크가 아니면 그대로 반환
+    """
+    key = post_key(link)
+    if not key:
+        return link
+    return f"{MOBILE_BLOG_BASE}/PostView.naver?" + urllib.parse.urlencode({"blogId": key[0], "logNo": key[1]})
+
+
+def visitor_counts_url(blog_id: str) -> tuple:
+    return f"{MOBILE_BLOG_BASE}/rego/BlogInfo.naver", {"blogId": blog_id}
+
+
+def rss_url(blog_id: str) -> str:
+    return f"{RSS_BASE}/{blog_id}.xml"
+
+
+def serp_url(query: str) -> str:
+    return f"{SEARCH_BASE}/search.naver?where=m_view&query={urllib.parse.quote(query)}"
+
+
+def parse_visitor_counts(text: str) -> tuple:
+    """BlogInfo JSON에서 (오늘 방문자, 전체 방문자) 문자열 튜플. 찾지 못하면 (None, None)."""
+    data = _load_json(text)
+    info = (data or {}).get("result") or {}
+    today = info.get("dayVisitorCount")
+    total = info.get("totalVisitorCount")
+    if today is None or total is None:
+        return None, None
+    return f"{int(today):,}", f"{int(total):,}"
+
+
+def parse_rss_posts(text: str, blog_id: str) -> list:
+    """
+    RSS에서 최근 글 목록을 추출합니다. (최신순)
+
+    Returns:
+        [{"title", "url", "pub_date"}] 리스트. pub_date는 datetime 또는 None.
+    """
+    if not text:
+        return []
+    try:
+        root = etree.fromstring(text.encode("utf-8"))
+    except etree.XMLSyntaxError:
+        return []
+
+    posts = []
+    for item in root.iter("item"):
+        title = (item.findtext("title") or "").strip()
+        link = (item.findtext("link") or "").strip()
+        if not (title and link and blog_id in link):
+            continue
+        try:
+            pub_date = parsedate_to_datetime(item.findtext("pubDate") or "")
+        except (TypeError, ValueError):
+            pub_date = None
+        posts.append({"title": title, "url": mobile_post_url(link), "pub_date": pub_date})
+    return posts
+
+
+def parse_latest_post(text: str, blog_id: str) -> tuple:
+    """RSS에서 (최신 글 제목, 최신 글 주소)를 추출합니다. 찾지 못하면 (None, None)."""
+    posts = parse_rss_posts(text, blog_id)
+    if not posts:
+        return None, None
+    return posts[0]["title"], posts[0]["url"]
+
+
+def build_blog_info(visitor_text: str, rss_text: str, blog_id: str) -> dict:
+    """get_blog_info와 같은 키의 딕셔너리. 찾지 못한 값은 None."""
+    today, total = parse_visitor_counts(visitor_text)
+    title, url = parse_latest_post(rss_text, blog_id)
+    return {
+        "today_visitors": today,
+        "total_visitors": total,
+        "latest_post_title": title,
+        "latest_post_url": url,
+    }
+
+
+# 방문자 JSON과 RSS를 동시에 요청할 때 RSS를 맡는 스레드 (공유 클라이언트의 연결을 그대로 씀)
+_side_requests = ThreadPoolExecutor(max_workers=8, thread_name_prefix="blogcheck-http")
+
+
+def fetch_blog_info(blog_id: str) -> dict:
+    """
+    get_blog_info와 같은 키의 딕셔너리. 찾지 못한 값은 None.
+    방문자 JSON과 RSS는 공유 HTTP 클라이언트로 동시에 요청합니다.
+    """
+    url, params = visitor_counts_url(blog_id)
+    rss = _side_requests.submit(fetch_text, rss_url(blog_id))
+    return build_blog_info(fetch_text(url, params), rss.result(), blog_id)
+
+
+def fetch_post_detail(post_url: str) -> dict:
+    """analyze_post_detail과 같은 키의 딕셔너리. 찾지 못한 값은 None."""
+    return parse_post_html(fetch_text(mobile_post_url(post_url)))
+
+
+def fetch_recent_posts(blog_id: str) -> list:
+    """RSS 한 번으로 최근 글 목록을 가져옵니다. (parse_rss_posts 참고)"""
+    return parse_rss_posts(fetch_text(rss_url(blog_id)), blog_id)
+
+
+def is_complete(fields: dict, required: list) -> bool:
+    return all(fields.get(key) is not None for key in required)
+
+
+def found_fields(fields: dict) -> dict:
+    """None이 아닌(빠른 경로에서 찾은) 값만 남깁니다."""
+    return {key: value for key, value in fields.items() if value is not None}
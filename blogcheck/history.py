@@ -0,0 +1,141 @@
+"""
+분석 이력 저장소
+- 블로그별 실행 결과(방문자 수, 최신 글, 상세 지표, 검색 노출 순위)를 SQLite에 쌓아 둡니다.
+- 증분 분석: 최신 글 주소가 지난 실행과 같으면 저장된 상세 지표를 재사용하고 검색 순위만 다시 확인합니다.
+- BLOGCHECK_HISTORY_PATH로 파일 위치를 지정합니다. (기본: 현재 폴더의 blogcheck_history.sqlite3)
+
+사용 예:
+    store = HistoryStore("history.sqlite3")
+    row = analyze_blog("blog_id", history=store, incremental=True)
+    store.history("blog_id")
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from blogcheck.parser import parse_date, post_key
+
+
+DEFAULT_HISTORY_PATH = "blogcheck_history.sqlite3"
+
+# 이력에 남기는 필드 (analyze_blog 결과 키)
+HISTORY_FIELDS = [
+    "today_visitors",
+    "total_visitors",
+    "latest_post_title",
+    "latest_post_url",
+    "publish_date",
+    "char_count",
+    "image_count",
+    "like_count",
+    "comment_count",
+    "exposure_ok",
+    "exposure_rank",
+    "exposure_msg",
+    "incremental",
+    "error",
+]
+
+# 지난 실행에서 재사용할 상세 지표
+DETAIL_FIELDS = ["publish_date", "char_count", "image_count", "like_count", "comment_count"]
+
+
+class HistoryStore:
+    """
+    블로그별 분석 이력 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, blog_id TEXT NOT NULL, checked_at REAL NOT NULL,"
+            " today_visitors TEXT, total_visitors TEXT, latest_post_title TEXT, latest_post_url TEXT,"
+            " publish_date TEXT, char_count INTEGER, image_count INTEGER, like_count TEXT, comment_count TEXT,"
+            " exposure_ok INTEGER, exposure_rank INTEGER, exposure_msg TEXT, incremental INTEGER, error TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS runs_blog_checked ON runs (blog_id, checked_at)")
+        self._conn.commit()
+
+    def record(self, row: dict, checked_at: float = None) -> None:
+        """analyze_blog 결과 한 줄을 저장합니다."""
+        values = [row.get(field) for field in HISTORY_FIELDS]
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO runs (blog_id, checked_at, {', '.join(HISTORY_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(HISTORY_FIELDS))})",
+                [row["blog_id"], checked_at or time.time()] + values,
+            )
+            self._conn.commit()
+
+    def latest(self, blog_id: str, successful: bool = True) -> dict:
+        """가장 최근 실행 결과 (없으면 None). successful이면 최신 글을 찾은 실행만 봅니다."""
+        condition = " AND latest_post_url IS NOT NULL AND COALESCE(error, '') = ''" if successful else ""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT * FROM runs WHERE blog_id = ?{condition} ORDER BY checked_at DESC, id DESC LIMIT 1",
+                (blog_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def history(self, blog_id: str, limit: int = 30) -> list:
+        """최근 실행 결과 목록 (최신순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM runs WHERE blog_id = ? ORDER BY checked_at DESC, id DESC LIMIT ?",
+                (blog_id, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def blog_ids(self) -> list:
+        """이력이 있는 블로그 ID 목록 (관심 목록 재확인용)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT blog_id FROM runs ORDER BY blog_id").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def previous_detail(previous: dict, post_url: str) -> dict:
+    """
+    지난 실행의 최신 글이 post_url과 같으면 저장된 상세 지표를 analyze_post_detail 형태로 반환합니다.
+    다르거나 지난 실행에서 상세 분석에 실패했으면 None.
+    """
+    if not previous or not post_url:
+        return None
+    # 주소 형식(PC/모바일/PostView)이 달라도 같은 글이면 재사용
+    previous_url = previous.get("latest_post_url")
+    if previous_url != post_url and (post_key(previous_url) or previous_url) != (post_key(post_url) or post_url):
+        return None
+    if previous.get("publish_date") in (None, "확인 불가"):
+        return None
+
+    detail = {field: previous.get(field) for field in DETAIL_FIELDS}
+    detail["char_count"] = detail["char_count"] or 0
+    detail["image_count"] = detail["image_count"] or 0
+    detail["publish_date_obj"] = parse_date(detail["publish_date"])
+    return detail
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore:
+    """프로세스 전체가 공유하는 이력 저장소 (BLOGCHECK_HISTORY_PATH)"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = HistoryStore(os.environ.get("BLOGCHECK_HISTORY_PATH", DEFAULT_HISTORY_PATH))
+        return _shared_store
@@ -0,0 +1,131 @@
+"""
+공유 HTTP 클라이언트 (Chrome 없이 조회하는 경로 전용)
+- 프로세스 전체가 httpx 클라이언트 하나를 쓰므로 호스트별 keep-alive 연결을 다시 씁니다.
+- h2 패키지가 있으면 HTTP/2, brotli 패키지가 있으면 br 압축을 씁니다. (없으면 HTTP/1.1 + gzip/deflate)
+- 응답에 ETag / Last-Modified가 있으면 본문(압축 저장)과 함께 결과 캐시("http" 단계)에 남기고,
+  다음 요청에 If-None-Match / If-Modified-Since를 붙여 바뀌지 않았으면 304만 받고 저장한 본문을 씁니다.
+- 받은 바이트 수(압축된 크기)와 304 응답 수는 지표로 남습니다.
+
+사용 예:
+    text = fetch_text(url)  # 스레드에서 호출해도 공유 클라이언트 하나를 씀 (asyncio 코드는 asyncio.to_thread로)
+"""
+
+import os
+import threading
+import zlib
+from importlib.util import find_spec
+
+import httpx
+
+from blogcheck.cache import get_result_cache
+from blogcheck.driver import MOBILE_USER_AGENT
+from blogcheck.metrics import get_metrics
+from blogcheck.ratelimit import get_rate_limiter
+
+
+HTTP_TIMEOUT = 5
+HTTP_HEADERS = {
+    "User-Agent": MOBILE_USER_AGENT,
+    "Referer": "https://m.blog.naver.com/",
+}
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+BROTLI_AVAILABLE = find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+
+# 연결 수 한도 (연결은 호스트마다 따로 유지되고, 쉬는 연결은 keepalive_expiry초 뒤 닫힘)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.environ.get("BLOGCHECK_HTTP_MAX_CONNECTIONS", 64)),
+    max_keepalive_connections=int(os.environ.get("BLOGCHECK_HTTP_KEEPALIVE", 32)),
+    keepalive_expiry=30,
+)
+
+
+def _client_options() -> dict:
+    return {
+        "headers": HTTP_HEADERS,
+        "timeout": HTTP_TIMEOUT,
+        "follow_redirects": True,
+        "http2": HTTP2_AVAILABLE,
+        "limits": HTTP_LIMITS,
+    }
+
+
+def new_client() -> httpx.Client:
+    return httpx.Client(**_client_options())
+
+
+def _cache_key(url: str, params: dict = None) -> str:
+    # httpx.URL(url, params=None)는 주소의 쿼리 문자열을 지우므로 params를 합쳐 씀 (글/검색어마다 다른 키)
+    return str(httpx.URL(url).copy_merge_params(params or {}))
+
+
+def conditional_request(url: str, params: dict = None) -> tuple:
+    """
+    저장된 검증자로 조건부 요청 헤더를 만듭니다.
+
+    Returns:
+        (캐시 키, 저장된 항목 또는 None, 요청 헤더)
+    """
+    key = _cache_key(url, params)
+    found, entry = get_result_cache().get("http", key)
+    headers = {}
+    if found:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return key, entry if found else None, headers
+
+
+def read_response(key: str, entry: dict, response: httpx.Response) -> str:
+    """
+    응답을 본문으로 바꿉니다. 304면 저장한 본문, 200이면 새 본문(검증자가 있으면 저장), 그 밖에는 None.
+    """
+    metrics = get_metrics()
+    metrics.inc("blogcheck_http_requests_total", status=response.status_code)
+    metrics.inc("blogcheck_http_bytes_total", amount=response.num_bytes_downloaded)
+    if response.status_code == 304 and entry is not None:
+        metrics.inc("blogcheck_http_not_modified_total")
+        return zlib.decompress(entry["body"]).decode("utf-8")
+    if response.status_code != 200:
+        return None
+
+    text = response.text
+    etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+    if etag or last_modified:
+        get_result_cache().set("http", key, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": zlib.compress(text.encode("utf-8")),
+        })
+    return text
+
+
+def _record_error(error: Exception) -> None:
+    get_metrics().inc("blogcheck_http_requests_total", status=type(error).__name__)
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 전체가 공유하는 동기 클라이언트 (스레드 안전)"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = new_client()
+        return _shared_client
+
+
+def fetch_text(url: str, params: dict = None) -> str:
+    """GET 요청 후 본문을 반환합니다. 실패하면 None."""
+    get_rate_limiter().acquire(url)
+    key, entry, headers = conditional_request(url, params)
+    try:
+        response = get_http_client().get(url, params=params, headers=headers)
+    except httpx.HTTPError as e:
+        _record_error(e)
+        return None
+    return read_response(key, entry, response)
+
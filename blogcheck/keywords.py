@@ -0,0 +1,197 @@
+"""
+검색 노출 확인용 키워드 추출 (TF-IDF)
+- 분석한 게시글 본문마다 등장한 단어를 문서 빈도(DF) 표로 SQLite에 쌓습니다. (같은 글은 한 번만 셈)
+- 제목 단어는 "제목 안 빈도 × 역문서 빈도(IDF)"로 점수를 매겨, 어느 글에나 나오는 흔한 단어보다
+  이 글을 특정하는 단어를 검색어로 고릅니다.
+- 조사를 뗀 어간은 점수 계산과 문서 빈도 조회에만 쓰고, 검색어에는 제목에 적힌 단어 그대로를 제목 순서대로 씁니다.
+  (조사는 고양이/하와이/시험결과처럼 명사 끝과 헷갈리는 한 글자 이/가/도/와/과 등은 떼지 않음)
+- score_documents는 여러 제목을 SciPy 희소 행렬 하나로 만들어 한 번에 점수를 계산하므로 수천 개도 한 번에 처리합니다.
+  단, 일괄 분석(iter_batch, ProcessWorkerPool)에서는 제목을 블로그마다 get_blog_info 뒤에야 알 수 있으므로
+  crawler.build_search_query(s)는 제목 하나씩 점수를 매깁니다. (미리 모은 제목 목록을 점수 매길 때 score_documents 사용)
+- 표가 비어 있으면(IDF가 모두 같으면) 제목 순서를 그대로 따르므로 기존 "앞 3단어" 방식과 같아집니다.
+- BLOGCHECK_KEYWORDS_PATH로 문서 빈도 표 위치를 지정합니다. (기본: 현재 폴더의 blogcheck_keywords.sqlite3)
+
+사용 예:
+    index = get_keyword_index()
+    index.add("blog_id/223300000001", tokenize(body_text))
+    extract_keywords("강남역 파스타 맛집 솔직 후기")  # [("파스타", 0.61), ("강남역", 0.55), ...]
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+from scipy import sparse
+
+
+# 흔한 단어는 IDF가 낮춰 주므로 불용어는 문법 요소만 둠
+STOPWORDS = ["더", "그", "이", "저", "및", "등", "를", "을", "의", "에", "로", "나", "하다", "하는", "합니다"]
+# 단어 끝에서 떼어 낼 조사 (긴 것부터 검사)
+# 한 글자 조사 중 명사 끝에 흔한 이/가/도/와/과/의/로/만/랑은 떼지 않음 (고양이, 하와이, 시험결과, 첫사랑 등)
+JOSA = sorted(["은", "는", "을", "를", "에", "에서", "에게", "으로", "까지", "부터", "이랑", "처럼"],
+              key=len, reverse=True)
+DEFAULT_KEYWORD_COUNT = 3
+DEFAULT_KEYWORDS_PATH = "blogcheck_keywords.sqlite3"
+SQL_CHUNK = 500
+
+# 한글, 영문, 숫자와 한자/가나 (東京旅行 같은 제목 단어도 검색어 후보로 남김)
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+
+def _strip_josa(word: str) -> str:
+    for josa in JOSA:
+        if word.endswith(josa) and len(word) - len(josa) >= 2:
+            return word[:-len(josa)]
+    return word
+
+
+def term_words(text: str) -> list:
+    """
+    제목의 [(어간, 제목에 적힌 단어)] (순서 유지)
+    어간은 소문자화하고 조사를 뗀 형태로 점수 계산에만 쓰고, 검색어에는 적힌 단어를 씁니다.
+    """
+    pairs = ((_strip_josa(word.lower()), word) for word in _TOKEN_RE.findall(text or ""))
+    return [(term, word) for term, word in pairs if len(term) > 1 and term not in STOPWORDS]
+
+
+def tokenize(text: str) -> list:
+    """본문/제목을 점수 계산용 어간 목록으로 나눕니다. (소문자화, 조사 제거, 불용어와 한 글자 단어 제외, 순서 유지)"""
+    return [term for term, _ in term_words(text)]
+
+
+class KeywordIndex:
+    """
+    문서 빈도 표 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS documents (doc_id TEXT PRIMARY KEY, indexed_at REAL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL)")
+        self._conn.commit()
+
+    def add(self, doc_id: str, terms) -> bool:
+        """
+        글 하나의 단어를 문서 빈도에 더합니다. 이미 센 글(doc_id)이면 무시합니다.
+
+        Returns:
+            새로 센 글이면 True
+        """
+        unique = sorted(set(terms))
+        with self._lock:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO documents (doc_id, indexed_at) VALUES (?, ?)",
+                                        (doc_id, time.time()))
+            if cursor.rowcount == 0:
+                return False
+            self._conn.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                [(term,) for term in unique],
+            )
+            self._conn.commit()
+        return True
+
+    def document_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def frequencies(self, terms: list) -> np.ndarray:
+        """terms 순서대로 문서 빈도 배열 (표에 없는 단어는 0)"""
+        found = {}
+        with self._lock:
+            for start in range(0, len(terms), SQL_CHUNK):
+                chunk = terms[start:start + SQL_CHUNK]
+                found.update(self._conn.execute(
+                    f"SELECT term, df FROM terms WHERE term IN ({', '.join('?' * len(chunk))})", chunk,
+                ).fetchall())
+        return np.array([found.get(term, 0) for term in terms], dtype=np.float64)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def score_documents(texts: list, index: KeywordIndex = None) -> list:
+    """
+    여러 제목(또는 문서)의 단어 점수를 한 번에 계산합니다.
+    TF는 로그 스케일(1 + log tf), IDF는 log((N + 1) / (df + 1)) + 1, 문서마다 L2 정규화
+
+    Args:
+        texts: 제목 문자열 리스트
+        index: KeywordIndex (기본: get_keyword_index())
+
+    Returns:
+        문서마다 [(단어, 점수)] 리스트 (점수 높은 순, 같은 점수면 문서에 먼저 나온 단어 먼저)
+    """
+    index = index or get_keyword_index()
+    docs = [tokenize(text) for text in texts]
+    vocabulary = {}
+    rows, cols = [], []
+    for row, words in enumerate(docs):
+        for word in words:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(word, len(vocabulary)))
+    if not vocabulary:
+        return [[] for _ in docs]
+
+    # (문서 × 단어) 빈도 행렬 - 같은 (행, 열) 항목은 더해짐
+    counts = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(docs), len(vocabulary)))
+    tf = counts.copy()
+    tf.data = 1 + np.log(tf.data)
+    idf = np.log((index.document_count() + 1) / (index.frequencies(list(vocabulary)) + 1)) + 1
+    weights = sparse.csr_matrix(tf.multiply(idf))
+    norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+    weights = sparse.diags(1 / np.where(norms > 0, norms, 1)) @ weights
+
+    terms = list(vocabulary)
+    results = []
+    for row, words in enumerate(docs):
+        start, end = weights.indptr[row], weights.indptr[row + 1]
+        scores = dict(zip((terms[c] for c in weights.indices[start:end]), weights.data[start:end]))
+        first = {word: i for i, word in reversed(list(enumerate(words)))}
+        ranked = sorted(scores, key=lambda word: (-round(scores[word], 9), first[word]))
+        results.append([(word, round(float(scores[word]), 3)) for word in ranked])
+    return results
+
+
+def extract_keywords(text: str, limit: int = None, index: KeywordIndex = None) -> list:
+    """제목 하나의 [(단어, 점수)] (점수 높은 순, limit개까지)"""
+    scored = score_documents([text], index)[0]
+    return scored[:limit] if limit else scored
+
+
+def keyword_phrase(text: str, count: int = DEFAULT_KEYWORD_COUNT, index: KeywordIndex = None,
+                   scored: list = None) -> str:
+    """
+    점수 상위 count개 어간의 원래 단어를 제목에 나온 순서대로 이은 검색어 (단어가 없으면 빈 문자열)
+    scored에 extract_keywords(text) 결과를 넘기면 점수를 다시 계산하지 않습니다.
+    """
+    scored = extract_keywords(text, index=index) if scored is None else scored
+    best = {term for term, _ in scored[:count]}
+    used, ordered = set(), []
+    for term, word in term_words(text):
+        if term in best and term not in used:
+            used.add(term)
+            ordered.append(word)
+    return " ".join(ordered)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_keyword_index() -> KeywordIndex:
+    """프로세스 전체가 공유하는 문서 빈도 표 (BLOGCHECK_KEYWORDS_PATH)"""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = KeywordIndex(os.environ.get("BLOGCHECK_KEYWORDS_PATH", DEFAULT_KEYWORDS_PATH))
+        return _shared_index
@@ -0,0 +1,236 @@
+"""
+분석 지표 (Prometheus 형식)
+- 단계별 소요 시간 히스토그램, 실패 원인별 횟수, 선택자 폴백 깊이, 드라이버 풀 사용률, 캐시 적중률을 모읍니다.
+- 외부 의존성 없이 Prometheus 텍스트 형식과 JSON 두 가지로 내보냅니다.
+- serve_metrics(port)로 /metrics(텍스트), /metrics.json 엔드포인트를 띄울 수 있습니다.
+
+사용 예:
+    metrics = get_metrics()
+
+    @timed("get_blog_info")
+    def get_blog_info(blog_id, timer=None):
+        ...
+
+    print(metrics.render())
+"""
+
+import functools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 지표 설명 (# HELP 줄)
+METRIC_HELP = {
+    "blogcheck_step_seconds": "분석 함수별 소요 시간",
+    "blogcheck_substep_seconds": "StepTimer 세부 단계별 소요 시간 (페이지 로딩, 본문 대기, 검색 결과 대기 등)",
+    "blogcheck_driver_start_seconds": "Chrome 드라이버 생성 시간",
+    "blogcheck_pool_wait_seconds": "드라이버 풀에서 드라이버를 빌리기까지 기다린 시간",
+    "blogcheck_failures_total": "단계/원인별 실패 횟수",
+    "blogcheck_selenium_fallback_total": "HTTP 빠른 경로가 불완전해 Selenium을 사용한 횟수",
+    "blogcheck_selector_depth_total": "선택자 그룹별로 값을 찾은 폴백 순서 (miss: 모두 실패)",
+    "blogcheck_http_requests_total": "빠른 경로 HTTP 요청 결과별 횟수",
+}
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra: dict = None) -> str:
+    items = list(labels) + list((extra or {}).items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+class Metrics:
+    """
+    스레드 안전한 지표 저장소
+
+    - 카운터: inc(name, **labels)
+    - 히스토그램: observe(name, seconds, **labels)
+    - 수집기: 렌더링 시점에 값을 읽어오는 함수 (드라이버 풀, 캐시 등)
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}    # name -> {label_key: 값}
+        self._histograms = {}  # name -> {label_key: [구간별 개수..., 합계, 개수]}
+        self._collectors = {}  # 이름 -> 함수() -> [(지표 이름, 종류, labels, 값)]
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            state = series.get(key)
+            if state is None:
+                state = series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def register_collector(self, name: str, collect) -> None:
+        """같은 이름으로 다시 등록하면 교체됩니다."""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _collected(self) -> list:
+        with self._lock:
+            collectors = list(self._collectors.values())
+        samples = []
+        for collect in collectors:
+            try:
+                samples.extend(collect())
+            except Exception:
+                continue
+        return samples
+
+    def snapshot(self) -> dict:
+        """JSON으로 내보낼 수 있는 딕셔너리 (히스토그램은 개수/합계/평균/구간별 누적 개수)"""
+        with self._lock:
+            counters = {name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                        for name, series in self._counters.items()}
+            histograms = {}
+            for name, series in self._histograms.items():
+                histograms[name] = [{
+                    "labels": dict(key),
+                    "count": state[-1],
+                    "sum": round(state[-2], 4),
+                    "mean": round(state[-2] / state[-1], 4) if state[-1] else None,
+                    "buckets": {str(bound): state[i] for i, bound in enumerate(self.buckets)},
+                } for key, state in series.items()]
+
+        gauges = {}
+        for name, kind, labels, value in self._collected():
+            target = counters if kind == "counter" else gauges
+            target.setdefault(name, []).append({"labels": labels, "value": value})
+        return {"counters": counters, "gauges": gauges, "histograms": histograms, "time": time.time()}
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+
+        def header(name, kind):
+            if name in METRIC_HELP:
+                lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {k: list(v) for k, v in series.items()} for name, series in self._histograms.items()}
+
+        for name in sorted(counters):
+            header(name, "counter")
+            for key, value in counters[name].items():
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+
+        for name in sorted(histograms):
+            header(name, "histogram")
+            for key, state in histograms[name].items():
+                for i, bound in enumerate(self.buckets):
+                    lines.append(f"{name}_bucket{_format_labels(key, {'le': f'{bound:g}'})} {state[i]}")
+                lines.append(f"{name}_bucket{_format_labels(key, {'le': '+Inf'})} {state[-1]}")
+                lines.append(f"{name}_sum{_format_labels(key)} {state[-2]:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {state[-1]}")
+
+        seen = set()
+        for name, kind, labels, value in self._collected():
+            if name not in seen:
+                seen.add(name)
+                header(name, kind)
+            lines.append(f"{name}{_format_labels(_label_key(labels))} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+_shared_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """프로세스 전체가 공유하는 지표 저장소"""
+    return _shared_metrics
+
+
+def failure_cause(error) -> str:
+    """예외 또는 원인 문자열을 지표 라벨로 쓸 이름으로 바꿉니다."""
+    if isinstance(error, BaseException):
+        return type(error).__name__
+    return str(error)
+
+
+def record_failure(step: str, error) -> None:
+    get_metrics().inc("blogcheck_failures_total", step=step, cause=failure_cause(error))
+
+
+def record_selector_depth(group: str, depth) -> None:
+    """선택자 그룹에서 몇 번째 선택자로 값을 찾았는지 기록합니다. (찾지 못하면 depth=None)"""
+    get_metrics().inc("blogcheck_selector_depth_total", group=group, depth="miss" if depth is None else depth)
+
+
+def timed(step: str):
+    """함수 전체 소요 시간을 blogcheck_step_seconds{step=...}에 기록하고, 예외는 실패로 셉니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                record_failure(step, e)
+                raise
+            finally:
+                get_metrics().observe("blogcheck_step_seconds", time.perf_counter() - start, step=step)
+        return wrapper
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body, content_type = get_metrics().render(), "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body, content_type = json.dumps(get_metrics().snapshot(), ensure_ascii=False), "application/json"
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_metrics(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 /metrics, /metrics.json을 제공하는 HTTP 서버를 시작합니다."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="blogcheck-metrics", daemon=True)
+    thread.start()
+    return server
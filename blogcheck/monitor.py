@@ -0,0 +1,282 @@
+"""
+관심 블로그 정기 점검 (스케줄러 + 작업 큐)
+- 관심 목록의 블로그를 일정 간격마다 작업 큐에 넣고, 작업자 스레드가 꺼내 analyze_blog로 분석합니다.
+- 네이버 호스트별 요청 속도는 토큰 버킷(blogcheck.ratelimit)으로 제한합니다.
+- 실패한 작업은 지수 백오프로 다시 시도하고, 모든 결과는 이력 저장소(SQLite)에 남깁니다.
+- 프로세스가 살아 있는 동안 드라이버 풀과 결과 캐시를 계속 쓰므로 회차마다 Chrome을 새로 띄우지 않습니다.
+
+사용 예:
+    python -m blogcheck.monitor -f watchlist.csv --every 3h --rate 2 --history history.sqlite3
+    python -m blogcheck.monitor blog_a blog_b --once
+"""
+
+import argparse
+import heapq
+import itertools
+import logging
+import random
+import re
+import sys
+import threading
+import time
+
+from blogcheck.batch import dedupe_blog_ids
+from blogcheck.metrics import get_metrics, record_failure
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL = 3 * 60 * 60
+DEFAULT_MONITOR_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 30.0
+MAX_BACKOFF = 15 * 60.0
+
+
+def parse_interval(text: str) -> float:
+    """"90", "30m", "3h", "1d" 형식의 간격을 초로 바꿉니다."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", text or "")
+    if not match:
+        raise ValueError(f"간격 형식이 올바르지 않습니다: {text!r} (예: 90, 30m, 3h, 1d)")
+    unit = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+    return float(match.group(1)) * unit
+
+
+def failure_reason(row: dict) -> str:
+    """다시 시도할 만한 실패인지 판단해 원인을 반환합니다. 정상 결과면 None."""
+    if row.get("error"):
+        return row["error"]
+    if row.get("today_visitors") == "확인 불가" and not row.get("latest_post_url"):
+        return "프로필 조회 실패"
+    if str(row.get("exposure_msg") or "").startswith("에러"):
+        return row["exposure_msg"]
+    return None
+
+
+def backoff_delay(attempt: int, base: float = DEFAULT_BACKOFF) -> float:
+    """attempt번째 재시도까지 기다릴 시간 (지수 백오프 + 최대 20% 무작위 지연)"""
+    delay = min(MAX_BACKOFF, base * (2 ** (attempt - 1)))
+    return delay * (1 + random.uniform(0, 0.2))
+
+
+class Monitor:
+    """
+    관심 목록 정기 점검기
+
+    Args:
+        blog_ids: 관심 블로그 ID 또는 URL 목록
+        analyze: blog_id를 받아 결과 딕셔너리를 반환하는 함수 (예: analyze_blog에 history를 묶은 partial)
+        interval: 회차 간격 (초)
+        workers: 동시에 분석할 블로그 수
+        max_retries: 실패한 블로그를 다시 시도할 최대 횟수
+        backoff: 첫 재시도까지 기다릴 시간 (초, 이후 두 배씩 증가)
+        on_result: 결과 한 줄마다 호출할 함수 (선택)
+    """
+
+    def __init__(self, blog_ids, analyze, interval: float = DEFAULT_INTERVAL,
+                 workers: int = DEFAULT_MONITOR_WORKERS, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, on_result=None):
+        self.blog_ids = dedupe_blog_ids(blog_ids)
+        self.analyze = analyze
+        self.interval = interval
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.on_result = on_result
+
+        self._cond = threading.Condition()
+        self._queue = []           # (실행 시각, 순번, blog_id, 시도 횟수) 힙
+        self._seq = itertools.count()
+        self._pending = set()      # 큐에 있거나 분석 중인 blog_id (같은 블로그 중복 방지)
+        self._stop = threading.Event()
+        self.rounds = 0
+
+    def enqueue_round(self) -> int:
+        """관심 목록 전체를 큐에 넣습니다. 이전 회차 작업이 남은 블로그는 건너뜁니다."""
+        now = time.monotonic()
+        added = 0
+        with self._cond:
+            for blog_id in self.blog_ids:
+                if blog_id in self._pending:
+                    continue
+                self._pending.add(blog_id)
+                heapq.heappush(self._queue, (now, next(self._seq), blog_id, 1))
+                added += 1
+            self.rounds += 1
+            self._cond.notify_all()
+        get_metrics().inc("blogcheck_monitor_jobs_total", amount=added, kind="scheduled")
+        logger.info("%d회차: %d개 블로그 예약", self.rounds, added)
+        return added
+
+    def _next_job(self):
+        with self._cond:
+            while not self._stop.is_set():
+                if self._queue:
+                    wait = self._queue[0][0] - time.monotonic()
+                    if wait <= 0:
+                        _, _, blog_id, attempt = heapq.heappop(self._queue)
+                        return blog_id, attempt
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            return None
+
+    def _finish(self, blog_id: str, attempt: int, row: dict) -> None:
+        reason = failure_reason(row)
+        with self._cond:
+            if reason and attempt <= self.max_retries and not self._stop.is_set():
+                delay = backoff_delay(attempt, self.backoff)
+                heapq.heappush(self._queue, (time.monotonic() + delay, next(self._seq), blog_id, attempt + 1))
+                self._cond.notify()
+                retry = delay
+            else:
+                self._pending.discard(blog_id)
+                retry = None
+                self._cond.notify_all()
+
+        if reason:
+            record_failure("monitor", "retry" if retry is not None else "gave_up")
+            logger.warning("%s 실패 (%d번째 시도): %s%s", blog_id, attempt, reason,
+                           f" → {retry:.0f}초 뒤 재시도" if retry is not None else " → 포기")
+        get_metrics().inc("blogcheck_monitor_jobs_total", kind="failed" if reason else "done")
+
+        if self.on_result and (retry is None):
+            self.on_result(row)
+
+    def _work(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            blog_id, attempt = job
+            start = time.perf_counter()
+            try:
+                row = dict(self.analyze(blog_id))
+                row.setdefault("error", "")
+            except Exception as e:
+                row = {"error": str(e) or type(e).__name__}
+            row["blog_id"] = blog_id
+            row["attempt"] = attempt
+            row["elapsed"] = round(time.perf_counter() - start, 2)
+            self._finish(blog_id, attempt, row)
+
+    def idle(self) -> bool:
+        with self._cond:
+            return not self._pending
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """현재 회차(재시도 포함)가 모두 끝날 때까지 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending and not self._stop.is_set():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._pending
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def run(self, once: bool = False) -> None:
+        """작업자를 띄우고 interval마다 회차를 예약합니다. once면 한 회차만 돌고 끝냅니다."""
+        threads = [threading.Thread(target=self._work, name=f"blogcheck-monitor-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            while not self._stop.is_set():
+                self.enqueue_round()
+                if once:
+                    self.wait_idle()
+                    break
+                self._stop.wait(self.interval)
+        finally:
+            self.stop()
+            for thread in threads:
+                thread.join(timeout=5)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m blogcheck.monitor",
+        description="관심 블로그를 일정 간격마다 분석해 이력 저장소에 기록합니다.",
+    )
+    parser.add_argument("blogs", nargs="*", help="블로그 ID 또는 URL")
+    parser.add_argument("-f", "--file", help="관심 블로그 목록 파일 (CSV 또는 한 줄에 하나)")
+    parser.add_argument("--every", default="3h", help="점검 간격 (예: 90, 30m, 3h, 1d / 기본 3h)")
+    parser.add_argument("--once", action="store_true", help="한 회차만 실행하고 종료 (cron 등에서 사용)")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_MONITOR_WORKERS,
+                        help=f"동시에 분석할 블로그 수 (기본 {DEFAULT_MONITOR_WORKERS})")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="네이버 호스트별 초당 최대 요청 수 (기본 2, 0이면 제한 없음)")
+    parser.add_argument("--burst", type=float, default=5, help="한 번에 몰아서 보낼 수 있는 요청 수 (기본 5)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES,
+                        help=f"실패한 블로그 재시도 횟수 (기본 {DEFAULT_MAX_RETRIES})")
+    parser.add_argument("--backoff", type=float, default=DEFAULT_BACKOFF,
+                        help=f"첫 재시도 대기 시간 (초, 기본 {DEFAULT_BACKOFF:g}, 이후 두 배씩)")
+    parser.add_argument("--queries", type=int, default=1, metavar="N", help="검색 노출 확인 검색어 수 (기본 1)")
+    parser.add_argument("--full", action="store_true", help="최신 글이 그대로여도 상세 분석을 다시 실행")
+    parser.add_argument("--history", metavar="PATH", help="결과를 저장할 SQLite 파일 (기본: BLOGCHECK_HISTORY_PATH)")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT", help="/metrics 엔드포인트 포트")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+        stream=sys.stderr,
+    )
+    try:
+        interval = parse_interval(args.every)
+    except ValueError as e:
+        print(f"blogcheck.monitor: {e}", file=sys.stderr)
+        return 2
+
+    import functools
+
+    from blogcheck.batch import read_blog_ids
+    from blogcheck.crawler import analyze_blog
+    from blogcheck.history import HistoryStore, get_history_store
+    from blogcheck.metrics import serve_metrics
+    from blogcheck.pool import get_driver_pool
+    from blogcheck.ratelimit import configure_rate_limit
+
+    items = list(args.blogs)
+    if args.file:
+        with open(args.file, encoding="utf-8-sig") as f:
+            items += read_blog_ids(f.read())
+    if not dedupe_blog_ids(items):
+        build_parser().print_usage(sys.stderr)
+        print("blogcheck.monitor: 점검할 블로그 ID를 입력하세요.", file=sys.stderr)
+        return 2
+
+    configure_rate_limit(args.rate or None, args.burst)
+    history = HistoryStore(args.history) if args.history else get_history_store()
+    analyze = functools.partial(analyze_blog, queries=args.queries, history=history, incremental=not args.full)
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+
+    # 예외로 끝난 작업은 analyze_blog가 기록하지 못하므로 재시도를 포기한 시점에 남김
+    def record_error(row):
+        if row.get("error"):
+            history.record(row)
+
+    monitor = Monitor(items, analyze, interval=interval, workers=args.jobs,
+                      max_retries=args.retries, backoff=args.backoff, on_result=record_error)
+    try:
+        monitor.run(once=args.once)
+    except KeyboardInterrupt:
+        monitor.stop()
+    finally:
+        get_driver_pool().close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
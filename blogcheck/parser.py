@@ -0,0 +1,292 @@
+"""
+네이버 블로그 HTML 파서
+- 브라우저 없이 원본 HTML(HTTP 응답 또는 driver.page_source)에서 분석에 필요한 값을 추출합니다.
+- 프로필 / 게시글 / 검색 결과(SERP) 페이지를 지원하며, bench/fixtures의 저장된 페이지로 검증할 수 있습니다.
+- Selenium 경로와 같은 선택자 우선순위와 이미지 판정 규칙을 사용합니다.
+- 찾지 못한 값은 None으로 남겨, 호출하는 쪽이 Selenium 폴백 여부를 판단할 수 있게 합니다.
+"""
+
+import re
+import unicodedata
+import urllib.parse
+from datetime import datetime
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from blogcheck.dedup import minhash_signature
+from blogcheck.keywords import tokenize
+from blogcheck.metrics import record_selector_depth
+
+
+# 프로필 선택자 (우선순위 순)
+VISITOR_SELECTORS = [".count.total", "div[class^='count__']", ".count"]
+POST_TITLE_SELECTORS = ["strong[class*='title__']", ".list_post_article a.title", "a.title"]
+
+# 게시글 상세 선택자 (우선순위 순)
+DATE_SELECTORS = [".se_publishDate", ".blog_date", ".date", ".fil5", "span[class*='date']"]
+CONTENT_SELECTORS = [".se-main-container", "#postViewArea"]
+LIKE_SELECTOR = "em[class*='u_cnt']"
+COMMENT_SELECTOR = "em[class*='_count']"
+
+# 본문 이미지로 인정하는 도메인 / 제외할 클래스
+VALID_IMAGE_DOMAINS = ["postfiles", "blogfiles", "pstatic.net", "naver.net", "blogpfthumb"]
+SKIP_IMAGE_CLASSES = ["sticker", "icon", "profile"]
+IMAGE_SRC_ATTRS = ["src", "data-src", "data-lazy-src"]
+
+_selector_cache = {}
+
+
+def _select(root, selector: str) -> list:
+    compiled = _selector_cache.get(selector)
+    if compiled is None:
+        compiled = _selector_cache[selector] = CSSSelector(selector)
+    return compiled(root)
+
+
+def element_text(element) -> str:
+    """script/style을 제외한 요소의 텍스트를 반환합니다."""
+    parts = element.xpath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    return " ".join(" ".join(parts).split())
+
+
+def parse_visitor_counts_text(text: str) -> tuple:
+    """
+    "오늘 1,234 전체 12,345" 형식의 텍스트에서 (오늘, 전체)를 추출합니다. 없는 값은 None.
+    """
+    today = total = None
+    numbers = re.findall(r'\d[\d,]*', text or "")
+    if len(numbers) >= 2:
+        today, total = numbers[0], numbers[1]
+    elif len(numbers) == 1:
+        if "오늘" in text: today = numbers[0]
+        elif "전체" in text: total = numbers[0]
+    return today, total
+
+
+def parse_profile_html(html: str, blog_id: str, base_url: str = "https://m.blog.naver.com/") -> dict:
+    """
+    렌더링된 모바일 블로그 프로필 HTML에서 방문자 수와 최신 글을 추출합니다.
+
+    Returns:
+        get_blog_info와 같은 키의 딕셔너리. 찾지 못한 값은 None.
+    """
+    result = {
+        "today_visitors": None,
+        "total_visitors": None,
+        "latest_post_title": None,
+        "latest_post_url": None,
+    }
+    if not html:
+        return result
+
+    root = lxml.html.fromstring(html)
+
+    depth = None
+    for i, selector in enumerate(VISITOR_SELECTORS, 1):
+        found = _select(root, selector)
+        text = element_text(found[0]) if found else ""
+        if "오늘" in text or "전체" in text:
+            result["today_visitors"], result["total_visitors"] = parse_visitor_counts_text(text)
+            depth = i
+            break
+    record_selector_depth("visitor", depth)
+
+    depth = None
+    for i, selector in enumerate(POST_TITLE_SELECTORS, 1):
+        found = _select(root, selector)
+        if not found:
+            continue
+        elem = found[0]
+        title = element_text(elem)
+        href = elem.get("href")
+        if not href:
+            anchor = next(elem.iterancestors("a"), None)
+            href = anchor.get("href") if anchor is not None else None
+        href = urllib.parse.urljoin(base_url, href) if href else None
+
+        if title and len(title) > 2 and "사진 개수" not in title:
+            if href and blog_id in href:
+                result["latest_post_title"] = title
+                result["latest_post_url"] = href
+                depth = i
+                break
+    record_selector_depth("post_title", depth)
+
+    return result
+
+
+def parse_date(date_text):
+    try:
+        clean_text = date_text.replace(" ", "").strip(".")
+        parts = clean_text.split(".")
+        if len(parts) >= 3:
+            year = int(parts[0])
+            month = int(parts[1])
+            day = int(parts[2]) if parts[2] else 1
+            return datetime(year, month, day)
+    except:
+        pass
+    return None
+
+
+def count_chars(text: str) -> int:
+    """공백과 줄바꿈을 뺀 글자 수"""
+    return len(text.replace(" ", "").replace("\n", ""))
+
+
+def is_content_image(src: str, cls: str) -> bool:
+    """스티커/아이콘/프로필을 제외한 본문 이미지인지 판정합니다."""
+    if any(skip in cls for skip in SKIP_IMAGE_CLASSES):
+        return False
+    if "l.blog.naver" in src:
+        return False
+    return any(d in src for d in VALID_IMAGE_DOMAINS)
+
+
+def parse_post_html(html: str, body_fallback: bool = False) -> dict:
+    """
+    게시글 HTML에서 상세 정보를 추출합니다.
+
+    Args:
+        html: 게시글 HTML
+        body_fallback: 본문 영역을 찾지 못하면 body 전체 글자 수를 셀지 여부 (Selenium 경로와 동일한 동작)
+
+    Returns:
+        analyze_post_detail과 같은 키의 딕셔너리. 찾지 못한 값은 None.
+        content_signature는 본문의 MinHash 서명 (유사 문서 탐지용, blogcheck.dedup),
+        content_terms는 본문 단어 목록 (중복 제거, 키워드 문서 빈도용, blogcheck.keywords)
+    """
+    result = {
+        "publish_date": None,
+        "publish_date_obj": None,
+        "char_count": None,
+        "image_count": None,
+        "like_count": None,
+        "comment_count": None,
+        "content_signature": None,
+        "content_terms": None,
+    }
+    if not html:
+        return result
+
+    root = lxml.html.fromstring(html)
+
+    depth = None
+    for i, selector in enumerate(DATE_SELECTORS, 1):
+        found = _select(root, selector)
+        date_text = element_text(found[0]) if found else ""
+        if date_text:
+            result["publish_date"] = date_text
+            result["publish_date_obj"] = parse_date(date_text)
+            depth = i
+            break
+    record_selector_depth("date", depth)
+
+    content = None
+    depth = None
+    for i, selector in enumerate(CONTENT_SELECTORS, 1):
+        found = _select(root, selector)
+        if found:
+            content = found[0]
+            depth = i
+            break
+    record_selector_depth("content", depth)
+
+    if content is not None:
+        text = element_text(content)
+        result["char_count"] = count_chars(text)
+        result["content_signature"] = minhash_signature(text)
+        result["content_terms"] = sorted(set(tokenize(text)))
+        imgs = content.iter("img")
+    else:
+        if body_fallback:
+            body = root.find("body")
+            result["char_count"] = count_chars(element_text(body if body is not None else root))
+        imgs = root.iter("img")
+
+    valid_cnt = 0
+    for img in imgs:
+        # 지연 로딩 이미지는 src가 placeholder(data:)이고 실제 주소가 data-* 속성에 있음
+        sources = [img.get(attr) or "" for attr in IMAGE_SRC_ATTRS]
+        if any(is_content_image(src, img.get("class") or "") for src in sources):
+            valid_cnt += 1
+    result["image_count"] = valid_cnt
+
+    for key, selector in (("like_count", LIKE_SELECTOR), ("comment_count", COMMENT_SELECTOR)):
+        found = _select(root, selector)
+        value = element_text(found[0]) if found else ""
+        if re.fullmatch(r"[\d,]+", value):
+            result[key] = value
+
+    return result
+
+
+# 검색 결과에서 제외할 광고 링크
+AD_LINK_MARKERS = ["ad.search", "ader.naver"]
+SERP_DEPTH = 20
+
+_POST_LINK_RE = re.compile(r"blog\.naver\.com/([\w-]+)/(\d+)")
+_POST_VIEW_RE = re.compile(r"blog\.naver\.com/PostView\.n(?:aver|hn)\?")
+
+
+def post_key(href: str):
+    """
+    블로그 글 링크에서 (블로그 ID, 글 번호)를 추출합니다. 글 링크가 아니면 None.
+    - blog.naver.com/{id}/{logNo}, m.blog.naver.com/{id}/{logNo}, PostView.naver?blogId=&logNo= 형식 지원
+    """
+    if not href:
+        return None
+    if _POST_VIEW_RE.search(href):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(href).query)
+        blog_id, log_no = query.get("blogId", [None])[0], query.get("logNo", [None])[0]
+        if blog_id and log_no and log_no.isdigit():
+            return blog_id, log_no
+        return None
+    match = _POST_LINK_RE.search(href)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+def normalize_query(query: str) -> str:
+    """
+    검색어 정규화 (SERP 캐시 키)
+    - 전각/반각 등 유니코드 표기 통일(NFKC), 영문 소문자화, 연속 공백을 하나로 줄임
+    """
+    query = unicodedata.normalize("NFKC", query or "")
+    return " ".join(query.lower().split())
+
+
+def parse_serp_links(html: str, limit: int = SERP_DEPTH) -> list:
+    """
+    검색 결과 HTML에서 블로그 글 링크를 노출 순서대로 추출합니다.
+    - 광고 링크와 글이 아닌 링크(블로그 홈 등)는 제외
+    - 같은 글을 가리키는 링크(m./PC 주소, 추적 파라미터 차이)는 처음 나온 것만 남김
+    """
+    if not html:
+        return []
+    root = lxml.html.fromstring(html)
+    links = []
+    seen = set()
+    for anchor in _select(root, 'a[href*="blog.naver.com"]'):
+        href = anchor.get("href") or ""
+        if any(marker in href for marker in AD_LINK_MARKERS):
+            continue
+        key = post_key(href)
+        if key and key not in seen:
+            seen.add(key)
+            links.append(href)
+            if len(links) >= limit:
+                break
+    return links
+
+
+def serp_blog_ids(links: list) -> list:
+    """링크 목록에서 블로그 ID를 노출 순서대로 중복 없이 추출합니다."""
+    blog_ids = []
+    for link in links:
+        key = post_key(link)
+        if key and key[0] not in blog_ids:
+            blog_ids.append(key[0])
+    return blog_ids
@@ -0,0 +1,287 @@
+"""
+WebDriver 풀
+- 세션마다 하나의 Chrome을 공유하지 않고, 크기가 정해진 풀에서 드라이버를 빌려 씁니다.
+- 빌려줄 때 상태 점검(health check)을 하고, 일정 페이지 수를 넘긴 드라이버는 새로 만듭니다.
+- prewarm()으로 앱 시작 시 Chrome을 미리 띄워 두면 첫 분석이 Chrome 시작을 기다리지 않습니다.
+  (BLOGCHECK_PREWARM: 미리 띄울 개수)
+- BLOGCHECK_TABS=1 이면 Chrome 하나의 탭을 빌려주는 TabPool을 씁니다. (blogcheck.tabs, 실험 기능이라 기본은 꺼짐)
+
+사용 예:
+    pool = DriverPool(size=4)
+    with pool.driver() as driver:
+        driver.get(url)
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from blogcheck.driver import create_driver, release_profile_dir, resolve_driver_path
+from blogcheck.metrics import get_metrics, record_failure
+
+logger = logging.getLogger(__name__)
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# 기본 풀 크기 / 드라이버 재생성 주기 / 대기 시간 (환경 변수로 조정)
+DEFAULT_POOL_SIZE = _env_int("BLOGCHECK_POOL_SIZE", 3)
+DEFAULT_MAX_PAGES = _env_int("BLOGCHECK_DRIVER_MAX_PAGES", 50)
+DEFAULT_CHECKOUT_TIMEOUT = _env_int("BLOGCHECK_CHECKOUT_TIMEOUT", 60)
+DEFAULT_PREWARM = _env_int("BLOGCHECK_PREWARM", 0)
+
+
+class PoolExhausted(Exception):
+    """대기 시간 안에 빌려줄 드라이버가 없을 때 발생합니다."""
+
+
+def _is_healthy(driver) -> bool:
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except Exception:
+        return False
+
+
+def _quit(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    release_profile_dir(driver)
+
+
+class DriverPool:
+    """
+    크기가 제한된 WebDriver 풀
+
+    Args:
+        size: 동시에 존재할 수 있는 최대 드라이버 수
+        max_pages: 드라이버 하나가 처리할 최대 페이지 수 (넘으면 종료 후 새로 생성)
+        factory: 드라이버 생성 함수
+        checkout_timeout: checkout 대기 시간 (초)
+    """
+
+    def __init__(self, size: int = None, max_pages: int = None, factory=create_driver,
+                 checkout_timeout: float = None):
+        self.size = max(1, size or DEFAULT_POOL_SIZE)
+        self.max_pages = max_pages or DEFAULT_MAX_PAGES
+        self.factory = factory
+        self.checkout_timeout = checkout_timeout or DEFAULT_CHECKOUT_TIMEOUT
+
+        self._cond = threading.Condition()
+        self._idle = []          # 쉬고 있는 드라이버
+        self._pages = {}         # id(driver) -> 처리한 페이지 수
+        self._total = 0          # 현재 존재하는 드라이버 수 (대여 중 + 대기 중)
+        self._closed = False
+        self.created = 0
+        self.recycled = 0
+
+    def checkout(self, timeout: float = None):
+        """
+        드라이버를 빌립니다. 대기 중인 드라이버가 없고 풀이 가득 찼으면 반납될 때까지 기다립니다.
+
+        Raises:
+            PoolExhausted: timeout 안에 드라이버를 얻지 못한 경우
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            with self._cond:
+                while not self._idle and self._total >= self.size:
+                    if self._closed:
+                        raise PoolExhausted("드라이버 풀이 종료되었습니다.")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        record_failure("pool_checkout", "PoolExhausted")
+                        raise PoolExhausted(f"{timeout:g}초 동안 사용 가능한 드라이버가 없습니다.")
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    driver = None
+                    self._total += 1  # 생성할 자리를 먼저 예약
+
+            if driver is None:
+                get_metrics().observe("blogcheck_pool_wait_seconds", time.monotonic() - started)
+                return self._create()
+
+            # 죽은 드라이버는 버리고 다시 시도
+            if _is_healthy(driver):
+                get_metrics().observe("blogcheck_pool_wait_seconds", time.monotonic() - started)
+                return driver
+            record_failure("pool_checkout", "unhealthy_driver")
+            self._discard(driver)
+
+    def _create(self):
+        """예약해 둔 자리에 드라이버를 새로 만듭니다. 실패하면 자리를 돌려놓습니다."""
+        create_start = time.perf_counter()
+        try:
+            driver = self.factory()
+        except Exception as e:
+            record_failure("driver_start", e)
+            self._release_slot()
+            raise
+        get_metrics().observe("blogcheck_driver_start_seconds", time.perf_counter() - create_start)
+        with self._cond:
+            self._pages[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def prewarm(self, count: int = None, background: bool = True):
+        """
+        드라이버를 미리 count개(풀 크기까지) 만들어 대기 목록에 넣습니다.
+
+        Args:
+            count: 미리 띄울 드라이버 수 (기본: BLOGCHECK_PREWARM)
+            background: True면 별도 스레드에서 만들고 바로 반환 (앱 시작을 막지 않음)
+
+        Returns:
+            background면 작업 스레드, 아니면 새로 만든 드라이버 수
+        """
+        count = DEFAULT_PREWARM if count is None else count
+        if background:
+            thread = threading.Thread(target=self.prewarm, args=(count, False),
+                                      name="blogcheck-prewarm", daemon=True)
+            thread.start()
+            return thread
+
+        # chromedriver 경로 확인(ChromeDriverManager 포함)도 첫 요청 전에 끝내 둠
+        if self.factory is create_driver:
+            resolve_driver_path()
+        made = 0
+        for _ in range(count):
+            with self._cond:
+                if self._closed or self._total >= self.size:
+                    break
+                self._total += 1
+            try:
+                driver = self._create()
+            except Exception as e:
+                logger.warning("드라이버 미리 띄우기 실패: %s", e)
+                break
+            with self._cond:
+                closed = self._closed
+                if not closed:
+                    self._idle.append(driver)
+                    self._cond.notify()
+            if closed:
+                self._discard(driver)
+                break
+            made += 1
+        return made
+
+    def checkin(self, driver, broken: bool = False) -> None:
+        """
+        드라이버를 반납합니다. 체크아웃 1회를 페이지 1개로 셉니다.
+        고장났거나 max_pages를 넘긴 드라이버는 종료합니다.
+        """
+        if driver is None:
+            return
+        with self._cond:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+            recycle = broken or self._closed or pages >= self.max_pages
+
+        if recycle:
+            if not broken and not self._closed:
+                self.recycled += 1
+            self._discard(driver)
+            return
+
+        try:
+            driver.switch_to.default_content()
+        except Exception:
+            self._discard(driver)
+            return
+
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout: float = None):
+        """with 문으로 드라이버를 빌리고 자동으로 반납합니다."""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        except BaseException:
+            # 작업 중 예외가 나면 드라이버가 살아있는지 확인 후 반납
+            self.checkin(driver, broken=not _is_healthy(driver))
+            raise
+        self.checkin(driver)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "in_use": self._total - len(self._idle),
+                "created": self.created,
+                "recycled": self.recycled,
+            }
+
+    def metric_samples(self) -> list:
+        """지표 수집기용 (이름, 종류, labels, 값) 목록"""
+        stats = self.stats()
+        samples = [(f"blogcheck_pool_{field}", "gauge", {}, stats[field]) for field in ("size", "total", "idle", "in_use")]
+        samples.append(("blogcheck_pool_utilization", "gauge", {}, stats["in_use"] / stats["size"]))
+        samples += [(f"blogcheck_pool_drivers_{field}_total", "counter", {}, stats[field])
+                    for field in ("created", "recycled")]
+        return samples
+
+    def close(self) -> None:
+        """대기 중인 드라이버를 모두 종료합니다. 대여 중인 드라이버는 반납 시 종료됩니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def _discard(self, driver) -> None:
+        _quit(driver)
+        with self._cond:
+            self._pages.pop(id(driver), None)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def tabs_enabled() -> bool:
+    """탭 다중화(실험 기능)가 켜져 있는지 (BLOGCHECK_TABS)"""
+    return os.environ.get("BLOGCHECK_TABS", "").lower() in ("1", "true", "yes", "on")
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    프로세스 전체가 공유하는 드라이버 풀 (크기는 BLOGCHECK_POOL_SIZE 환경 변수로 조정)
+    BLOGCHECK_TABS가 켜져 있으면 Chrome 하나에 탭을 여는 TabPool을 반환합니다.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            if tabs_enabled():
+                from blogcheck.tabs import TabPool
+                _shared_pool = TabPool()
+            else:
+                _shared_pool = DriverPool()
+            get_metrics().register_collector("pool", _shared_pool.metric_samples)
+        return _shared_pool
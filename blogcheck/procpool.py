@@ -0,0 +1,186 @@
+"""
+프로세스 작업자 풀 (멀티 코어 일괄 분석)
+- 작업자 프로세스마다 자기 드라이버 풀/캐시를 가지고, 블로그 ID를 받아 결과 딕셔너리를 돌려줍니다.
+- 결과 후처리(HTML 파싱 등)가 GIL에 묶이지 않고, Chrome이나 작업자 하나가 죽어도 전체가 멈추지 않습니다.
+- 죽은 작업자(또는 job_timeout을 넘긴 작업자)는 새 프로세스로 교체하고, 맡고 있던 블로그는 한 번 더 시도합니다.
+
+사용 예:
+    with ProcessWorkerPool(processes=8, queries=3) as pool:
+        for row in pool.imap(blog_ids):
+            print(row)
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from collections import deque
+
+from blogcheck.batch import dedupe_blog_ids
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROCESSES = os.cpu_count() or 1
+DEFAULT_DRIVERS_PER_PROCESS = 2
+DEFAULT_JOB_TIMEOUT = 300
+MAX_JOB_ATTEMPTS = 2
+POLL_INTERVAL = 0.5
+
+
+def _worker_main(task_queue, result_queue, analyze_kwargs: dict, drivers: int) -> None:
+    # 작업자 프로세스 본체: 드라이버 풀 크기를 정한 뒤 blogcheck를 import 해야 설정이 적용됨
+    os.environ["BLOGCHECK_POOL_SIZE"] = str(drivers)
+
+    import functools
+
+    from blogcheck.batch import _run_one
+    from blogcheck.crawler import analyze_blog
+    from blogcheck.pool import get_driver_pool
+
+    analyze_kwargs = dict(analyze_kwargs)
+    history_path = analyze_kwargs.pop("history_path", None)
+    if history_path:
+        # SQLite 연결은 프로세스 사이에 넘길 수 없으므로 작업자마다 따로 연결
+        from blogcheck.history import HistoryStore
+        analyze_kwargs["history"] = HistoryStore(history_path)
+
+    analyze = functools.partial(analyze_blog, **analyze_kwargs)
+    try:
+        while True:
+            job = task_queue.get()
+            if job is None:
+                break
+            job_id, blog_id = job
+            result_queue.put((job_id, _run_one(analyze, blog_id)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        get_driver_pool().close()
+
+
+class _Worker:
+    def __init__(self, ctx, index: int, result_queue, analyze_kwargs: dict, drivers: int):
+        self.index = index
+        self.tasks = ctx.Queue()
+        self.process = ctx.Process(
+            target=_worker_main, args=(self.tasks, result_queue, analyze_kwargs, drivers),
+            name=f"blogcheck-worker-{index}", daemon=True,
+        )
+        self.process.start()
+        self.job = None       # (job_id, blog_id, 시도 횟수)
+        self.started = None   # 현재 작업 시작 시각
+
+    def assign(self, job) -> None:
+        self.job = job
+        self.started = time.monotonic()
+        self.tasks.put(job[:2])
+
+    def stop(self, timeout: float = 5) -> None:
+        if self.process.is_alive():
+            self.tasks.put(None)
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+
+
+class ProcessWorkerPool:
+    """
+    작업자 프로세스 풀
+
+    Args:
+        processes: 작업자 프로세스 수 (기본: CPU 코어 수)
+        drivers_per_process: 프로세스 하나가 띄울 최대 Chrome 수
+        job_timeout: 블로그 하나에 허용할 최대 시간 (초, 넘기면 작업자를 교체)
+        **analyze_kwargs: analyze_blog에 넘길 인자 (deep_posts, queries, incremental 등, pickle 가능해야 함)
+            history 대신 history_path(SQLite 경로)를 넘기면 작업자마다 이력 저장소를 엽니다.
+    """
+
+    def __init__(self, processes: int = None, drivers_per_process: int = DEFAULT_DRIVERS_PER_PROCESS,
+                 job_timeout: float = DEFAULT_JOB_TIMEOUT, **analyze_kwargs):
+        # fork는 부모의 스레드/Chrome 연결 상태를 복사하므로 항상 spawn 사용
+        self._ctx = multiprocessing.get_context("spawn")
+        self.processes = max(1, processes or DEFAULT_PROCESSES)
+        self.drivers_per_process = max(1, drivers_per_process)
+        self.job_timeout = job_timeout
+        self.analyze_kwargs = analyze_kwargs
+        self.restarts = 0
+        self._results = self._ctx.Queue()
+        self._workers = [self._spawn(i) for i in range(self.processes)]
+
+    def _spawn(self, index: int) -> _Worker:
+        return _Worker(self._ctx, index, self._results, self.analyze_kwargs, self.drivers_per_process)
+
+    def _replace(self, worker: _Worker, reason: str) -> tuple:
+        """작업자를 새 프로세스로 교체하고, 맡고 있던 작업을 반환합니다."""
+        job = worker.job
+        logger.warning("작업자 %d 교체 (%s, 작업: %s)", worker.index, reason, job[1] if job else "-")
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(1)
+        self.restarts += 1
+        self._workers[worker.index] = self._spawn(worker.index)
+        return job
+
+    def imap(self, items):
+        """블로그 목록을 작업자들에게 나눠 주고, 끝나는 순서대로 결과를 yield 합니다."""
+        pending = deque((job_id, blog_id, 1) for job_id, blog_id in enumerate(dedupe_blog_ids(items)))
+        running = 0
+        finished = set()
+
+        while pending or running:
+            for worker in self._workers:
+                if worker.job is None and pending:
+                    worker.assign(pending.popleft())
+                    running += 1
+
+            try:
+                job_id, row = self._results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                job_id, row = None, None
+
+            if row is not None:
+                for worker in self._workers:
+                    if worker.job and worker.job[0] == job_id:
+                        worker.job = None
+                        running -= 1
+                # 교체 직전에 끝난 작업이 다시 시도되는 경우 결과는 한 번만 반환
+                if job_id not in finished:
+                    finished.add(job_id)
+                    pending = deque(job for job in pending if job[0] != job_id)
+                    yield row
+                continue
+
+            # 결과가 없는 동안 죽었거나 멈춘 작업자 확인
+            for worker in list(self._workers):
+                if worker.job is None:
+                    if not worker.process.is_alive():
+                        self._replace(worker, "프로세스 종료")
+                    continue
+                if not worker.process.is_alive():
+                    reason = f"프로세스 종료 (exit {worker.process.exitcode})"
+                elif self.job_timeout and time.monotonic() - worker.started > self.job_timeout:
+                    reason = f"{self.job_timeout:g}초 초과"
+                else:
+                    continue
+                job_id, blog_id, attempt = self._replace(worker, reason)
+                running -= 1
+                if job_id in finished:
+                    continue
+                if attempt < MAX_JOB_ATTEMPTS:
+                    pending.appendleft((job_id, blog_id, attempt + 1))
+                else:
+                    finished.add(job_id)
+                    yield {"blog_id": blog_id, "error": f"작업자 실패: {reason}", "elapsed": None}
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
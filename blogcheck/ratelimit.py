@@ -0,0 +1,122 @@
+"""
+호스트별 요청 속도 제한 (토큰 버킷)
+- 네이버 각 호스트(m.blog.naver.com, rss.blog.naver.com, m.search.naver.com)로 보내는 요청 수를 프로세스 전체에서 제한합니다.
+- HTTP 빠른 경로(httpx)와 Selenium driver.get이 같은 버킷을 씁니다.
+- BLOGCHECK_RATE_PER_HOST(초당 요청 수)를 지정하지 않으면 제한하지 않습니다. (대화형 사용 기본값)
+
+사용 예:
+    limiter = get_rate_limiter()
+    limiter.acquire(url)              # 동기 코드
+    await limiter.acquire_async(url)  # asyncio 코드
+"""
+
+import asyncio
+import os
+import threading
+import time
+import urllib.parse
+
+
+def _env_float(name: str, default):
+    try:
+        value = os.environ.get(name)
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+DEFAULT_RATE_PER_HOST = _env_float("BLOGCHECK_RATE_PER_HOST", None)
+DEFAULT_BURST = _env_float("BLOGCHECK_RATE_BURST", 5)
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷
+
+    reserve()는 토큰을 미리 예약하고 기다려야 할 시간을 돌려주므로, 호출하는 쪽이 time.sleep 또는
+    asyncio.sleep 중 알맞은 방법으로 기다릴 수 있습니다.
+    """
+
+    def __init__(self, rate: float, burst: float = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 남은 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """
+    호스트마다 TokenBucket을 하나씩 두는 속도 제한기
+
+    Args:
+        rate: 호스트당 초당 요청 수 (None이면 제한 없음)
+        burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    """
+
+    def __init__(self, rate: float = None, burst: float = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.waited = 0.0  # 속도 제한으로 기다린 누적 시간 (초)
+
+    def _bucket(self, url: str):
+        if not self.rate:
+            return None
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def _reserve(self, url: str) -> float:
+        bucket = self._bucket(url)
+        delay = bucket.reserve() if bucket else 0.0
+        if delay:
+            with self._lock:
+                self.waited += delay
+        return delay
+
+    def acquire(self, url: str) -> None:
+        delay = self._reserve(url)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        delay = self._reserve(url)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """프로세스 전체가 공유하는 속도 제한기 (BLOGCHECK_RATE_PER_HOST, BLOGCHECK_RATE_BURST)"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter(DEFAULT_RATE_PER_HOST, DEFAULT_BURST)
+        return _shared_limiter
+
+
+def configure_rate_limit(rate: float, burst: float = DEFAULT_BURST) -> HostRateLimiter:
+    """공유 속도 제한기를 새 설정으로 바꿉니다. (스케줄러 시작 시 사용)"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        _shared_limiter = HostRateLimiter(rate, burst)
+        return _shared_limiter
@@ -0,0 +1,33 @@
+"""
+분석 단계 동시 실행 (점진적 화면 표시용)
+- 서로 독립된 단계(상세 분석, 검색 노출, 최근 글 분석 등)를 작업자 스레드에서 동시에 실행하고 끝나는 순서대로 내보냅니다.
+- Streamlit 요소는 스크립트 스레드에서만 그릴 수 있으므로, 화면은 호출하는 쪽이 결과를 받을 때마다 자리(placeholder)에 채웁니다.
+
+사용 예:
+    steps = {"detail": lambda: analyze_post_detail(url), "exposure": lambda: check_search_exposure(blog_id, title)}
+    for name, result, error in iter_steps(steps):
+        slots[name].write(result)
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from blogcheck.metrics import record_failure
+
+
+def iter_steps(steps: dict):
+    """
+    {단계 이름: 인자 없는 함수}를 동시에 실행하고 끝나는 순서대로 (이름, 결과, 예외)를 yield 합니다.
+    실패한 단계는 결과가 None이고 예외 객체가 함께 전달됩니다.
+    """
+    if not steps:
+        return
+    with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="blogcheck-step") as executor:
+        futures = {executor.submit(func): name for name, func in steps.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                record_failure(name, e)
+                result, error = None, e
+            yield name, result, error
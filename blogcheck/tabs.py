@@ -0,0 +1,243 @@
+"""
+탭 다중화 (Chrome 하나에 여러 탭) - 실험 기능, 기본은 꺼짐
+- Chrome 프로세스를 분석 수만큼 띄우지 않고, 브라우저 하나에 탭(창 핸들)을 여러 개 열어 분석마다 하나씩 빌려줍니다.
+- 탭 객체(Tab)는 WebDriver와 같은 방식으로 쓰므로 get_blog_info / analyze_post_detail / fetch_serp_links가 그대로 동작합니다.
+- WebDriver 세션은 한 번에 한 창만 다루므로 명령 하나를 보낼 때만 잠금을 잡고 그 탭으로 전환합니다.
+  페이지 로딩은 잠금 없이 기다리므로 여러 탭의 로딩이 겹쳐서 진행됩니다.
+- chromedriver는 page load strategy가 eager/normal이면 명령마다 활성 창의 진행 중인 이동을 기다리므로,
+  그 사이 잠금이 잡혀 로딩이 사실상 하나씩 진행됩니다. 그래서 탭용 Chrome은 "none"으로 띄우고
+  로딩 완료는 Tab.get이 직접 확인합니다.
+  (주의: 실제 Chrome에서 동시 로딩 효과는 아직 측정하지 않았습니다. 가짜 드라이버로만 확인함)
+- 페이지 로딩 밖의 명령은 브라우저 하나의 잠금을 거치므로 탭끼리 겹치지 않습니다. 같은 메모리에서 드라이버 여러 개보다
+  빠르다는 측정이 없으므로 실험 기능으로 두고, --tabs(명령줄) 또는 BLOGCHECK_TABS=1로 직접 켤 때만 씁니다.
+- 리소스 차단(CDP Network.setBlockedURLs)은 탭마다 적용합니다.
+- BLOGCHECK_TABS=1 이면 get_driver_pool()이 이 모드를 씁니다. (BLOGCHECK_POOL_SIZE = 탭 수)
+
+사용 예:
+    pool = TabPool(size=8)
+    with pool.driver() as tab:
+        tab.get(url)
+        html = tab.page_source
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import NoSuchFrameException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from blogcheck.driver import apply_resource_blocking, blocked_resources, create_driver
+from blogcheck.pool import DriverPool, _quit
+
+
+PAGE_LOAD_TIMEOUT = 30
+NAVIGATION_POLL = 0.1
+
+# 이동 전 문서에 표시를 남기고, 표시가 없는 새 문서가 DOMContentLoaded를 지나면 로딩 완료 (eager 전략과 같은 시점)
+_NAVIGATE_JS = "window.__blogcheckNav = true; window.location.href = arguments[0];"
+_NAVIGATED_JS = "return !window.__blogcheckNav && document.readyState !== 'loading';"
+
+
+def create_tab_driver():
+    """탭 다중화용 Chrome (page load strategy "none": 명령이 다른 탭의 로딩을 기다리지 않음)"""
+    return create_driver(page_load_strategy="none")
+
+
+class BrowserClosed(WebDriverException):
+    """탭이 속한 Chrome이 종료되었거나 다시 시작된 경우 발생합니다."""
+
+
+class _TabSwitchTo:
+    """Tab용 switch_to (iframe 전환만 지원)"""
+
+    def __init__(self, tab):
+        self._tab = tab
+
+    def frame(self, frame_reference) -> None:
+        self._tab._switch_frame(frame_reference)
+
+    def default_content(self) -> None:
+        self._tab._switch_frame(None)
+
+
+class Tab:
+    """
+    Chrome 탭 하나를 WebDriver처럼 다루는 객체
+    명령은 모두 execute()를 거치므로 driver.count_commands로 탭별 명령 수를 셀 수 있습니다.
+    """
+
+    def __init__(self, browser, handle: str, generation: int):
+        self._browser = browser
+        self.handle = handle
+        self.generation = generation
+        self._frame = None
+        self.switch_to = _TabSwitchTo(self)
+
+    def execute(self, command: str, params: dict = None) -> dict:
+        return self._browser.execute(self, command, params)
+
+    def execute_script(self, script: str, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})["value"]
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def find_elements(self, by: str, value: str) -> list:
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"] or []
+
+    @property
+    def page_source(self) -> str:
+        return self.execute(Command.GET_PAGE_SOURCE)["value"]
+
+    @property
+    def current_url(self) -> str:
+        return self.execute(Command.GET_CURRENT_URL)["value"]
+
+    def get(self, url: str, timeout: float = PAGE_LOAD_TIMEOUT) -> None:
+        """
+        페이지를 엽니다. 로딩을 기다리는 동안에는 잠금을 잡지 않아 다른 탭이 명령을 보낼 수 있습니다.
+
+        Raises:
+            TimeoutException: timeout 안에 DOMContentLoaded에 도달하지 못한 경우
+        """
+        self._switch_frame(None)
+        self.execute_script(_NAVIGATE_JS, url)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self.execute_script(_NAVIGATED_JS):
+                    return
+            except BrowserClosed:
+                raise
+            except WebDriverException:
+                pass  # 문서가 바뀌는 중에는 스크립트 실행이 실패할 수 있음
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"{timeout:g}초 안에 페이지를 불러오지 못했습니다: {url}")
+            time.sleep(NAVIGATION_POLL)
+
+    def _switch_frame(self, frame_reference) -> None:
+        if frame_reference is None:
+            if self._frame is not None:
+                self.execute(Command.SWITCH_TO_FRAME, {"id": None})
+                self._frame = None
+            return
+        if isinstance(frame_reference, str):
+            css = f'iframe[id="{frame_reference}"], iframe[name="{frame_reference}"], frame[name="{frame_reference}"]'
+            elements = self.find_elements("css selector", css)
+            if not elements:
+                raise NoSuchFrameException(frame_reference)
+            frame_reference = elements[0]
+        self.execute(Command.SWITCH_TO_FRAME, {"id": frame_reference})
+        self._frame = frame_reference
+
+    def quit(self) -> None:
+        """탭을 닫습니다. (Chrome은 TabBrowser.close에서 종료)"""
+        self._browser.close_tab(self)
+
+
+class TabBrowser:
+    """
+    탭을 여는 Chrome 하나
+
+    Args:
+        factory: Chrome WebDriver 생성 함수
+        resources: 탭마다 차단할 리소스 분류 (기본: BLOGCHECK_BLOCK_RESOURCES)
+    """
+
+    def __init__(self, factory=create_tab_driver, resources: list = None):
+        self.factory = factory
+        self.resources = blocked_resources() if resources is None else resources
+        self._lock = threading.Lock()
+        self._driver = None
+        self._home = None        # 처음 열린 창 (세션 유지용, 분석에는 쓰지 않음)
+        self._active = None      # 지금 WebDriver 세션이 가리키는 탭
+        self.generation = 0      # Chrome을 다시 띄울 때마다 증가
+        self.started = 0
+
+    def _ensure_browser(self) -> None:
+        if self._driver is not None:
+            try:
+                self._driver.switch_to.window(self._home)
+                self._active = None
+                return
+            except Exception:
+                _quit(self._driver)
+        self._driver = self.factory()
+        self._home = self._driver.current_window_handle
+        self._active = None
+        self.generation += 1
+        self.started += 1
+
+    def open_tab(self) -> Tab:
+        """새 탭을 열어 반환합니다. Chrome이 없거나 죽었으면 새로 띄웁니다. (DriverPool의 factory로 사용)"""
+        with self._lock:
+            self._ensure_browser()
+            self._driver.switch_to.new_window("tab")
+            tab = Tab(self, self._driver.current_window_handle, self.generation)
+            self._active = tab
+        if self.resources:
+            apply_resource_blocking(tab, self.resources)
+        return tab
+
+    def _activate(self, tab: Tab) -> None:
+        if tab.generation != self.generation or self._driver is None:
+            raise BrowserClosed("탭이 속한 Chrome이 종료되었습니다.")
+        if self._active is tab:
+            return
+        # 창을 바꾸면 최상위 문서로 돌아가므로, 탭이 iframe 안에 있었으면 다시 들어감
+        self._driver.switch_to.window(tab.handle)
+        self._active = tab
+        if tab._frame is not None:
+            self._driver.execute(Command.SWITCH_TO_FRAME, {"id": tab._frame})
+
+    def execute(self, tab: Tab, command: str, params: dict = None) -> dict:
+        with self._lock:
+            self._activate(tab)
+            return self._driver.execute(command, params)
+
+    def close_tab(self, tab: Tab) -> None:
+        with self._lock:
+            if tab.generation != self.generation or self._driver is None:
+                return
+            try:
+                self._driver.switch_to.window(tab.handle)
+                self._driver.close()
+                self._driver.switch_to.window(self._home)
+            finally:
+                self._active = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._driver is not None:
+                _quit(self._driver)
+            self._driver = None
+            self._active = None
+            self.generation += 1
+
+
+class TabPool(DriverPool):
+    """
+    Chrome 하나의 탭을 빌려주는 풀 (DriverPool과 같은 사용법)
+    탭 상태 점검, max_pages마다 탭 재생성, 대기 시간 제한은 DriverPool 그대로이고,
+    Chrome이 죽으면 다음 탭을 열 때 새로 띄웁니다.
+
+    Args:
+        size: 동시에 열 수 있는 최대 탭 수
+        max_pages: 탭 하나가 처리할 최대 페이지 수
+        checkout_timeout: checkout 대기 시간 (초)
+        browser_factory: Chrome WebDriver 생성 함수
+    """
+
+    def __init__(self, size: int = None, max_pages: int = None, checkout_timeout: float = None,
+                 browser_factory=create_tab_driver):
+        self.browser = TabBrowser(browser_factory)
+        super().__init__(size, max_pages, factory=self.browser.open_tab, checkout_timeout=checkout_timeout)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["browsers_started"] = self.browser.started
+        return stats
+
+    def close(self) -> None:
+        super().close()
+        self.browser.close()
@@ -0,0 +1,14 @@
+"""
+네이버 블로그 주소 처리
+"""
+
+
+def extract_blog_id(text):
+    if not text: return ""
+    text = text.strip()
+    if "blog.naver.com" in text:
+        parts = text.split("/")
+        for p in parts:
+            if p and "http" not in p and "blog.naver" not in p:
+                return p
+    return text
@@ -0,0 +1,133 @@
+"""
+페이지 준비 상태 대기 유틸리티
+- 고정 time.sleep 대신, 각 단계에 필요한 선택자가 DOM에 나타나는 즉시 다음 단계로 넘어갑니다.
+- 단계마다 최대 대기 시간(데드라인)이 있어 선택자가 끝내 나타나지 않아도 그 이상 기다리지 않습니다.
+- StepTimer로 단계별 소요 시간을 기록해 어디서 시간이 쓰이는지 확인할 수 있습니다.
+"""
+
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from blogcheck.metrics import get_metrics
+
+
+# 단계별 최대 대기 시간 (초)
+STEP_DEADLINES = {
+    "profile": 6.0,
+    "post": 6.0,
+    "serp": 6.0,
+    "serp_scroll": 2.0,
+}
+
+# 선택자 폴링 간격 (초)
+POLL_INTERVAL = 0.1
+
+# 선택자 그룹마다 하나라도 존재하는지 한 번의 스크립트 호출로 확인합니다.
+_GROUPS_READY_JS = """
+var groups = arguments[0];
+return groups.map(function(group) {
+    for (var i = 0; i < group.length; i++) {
+        try {
+            if (document.querySelector(group[i]) !== null) return true;
+        } catch (e) {}
+    }
+    return false;
+});
+"""
+
+_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+
+class StepTimer:
+    """
+    단계별 소요 시간 기록기
+
+    사용 예:
+        timer = StepTimer()
+        with timer.step("프로필 로딩"):
+            ...
+        timer.as_dict()  # {"프로필 로딩": 0.42}
+    """
+
+    def __init__(self):
+        self.steps = []
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.steps.append((name, seconds))
+            get_metrics().observe("blogcheck_substep_seconds", seconds, step=name)
+
+    def total(self) -> float:
+        return sum(seconds for _, seconds in self.steps)
+
+    def as_dict(self) -> dict:
+        """같은 이름의 단계는 합산해서 반환합니다."""
+        merged = {}
+        for name, seconds in self.steps:
+            merged[name] = merged.get(name, 0.0) + seconds
+        return merged
+
+
+def wait_for_groups(driver, groups: list, timeout: float) -> list:
+    """
+    선택자 그룹마다 하나 이상의 요소가 나타날 때까지 기다립니다.
+
+    Args:
+        driver: Selenium WebDriver
+        groups: CSS 선택자 리스트들의 리스트 (예: [방문자 선택자들, 제목 선택자들])
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        그룹별 준비 여부 리스트. 데드라인이 지나면 그 시점의 상태를 반환합니다.
+    """
+    state = {"ready": [False] * len(groups)}
+
+    def _all_ready(d):
+        try:
+            state["ready"] = d.execute_script(_GROUPS_READY_JS, groups)
+        except Exception:
+            return False
+        return all(state["ready"])
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(_all_ready)
+    except TimeoutException:
+        pass
+    return list(state["ready"])
+
+
+def wait_for_any(driver, selectors: list, timeout: float) -> bool:
+    """선택자 중 하나라도 나타나면 True, 데드라인까지 없으면 False를 반환합니다."""
+    return wait_for_groups(driver, [selectors], timeout)[0]
+
+
+def wait_for_count(driver, selector: str, minimum: int, timeout: float) -> int:
+    """
+    선택자에 해당하는 요소가 minimum 개 이상이 될 때까지 기다립니다.
+    (스크롤 후 동적으로 추가되는 검색 결과 대기용)
+
+    Returns:
+        마지막으로 확인한 요소 개수
+    """
+    state = {"count": 0}
+
+    def _enough(d):
+        try:
+            state["count"] = d.execute_script(_COUNT_JS, selector) or 0
+        except Exception:
+            return False
+        return state["count"] >= minimum
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(_enough)
+    except TimeoutException:
+        pass
+    return state["count"]
@@ -1,18 +1,39 @@
 import streamlit as st
-import re
-import time
-import urllib.parse
+import functools
 import os
-from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+import time
+from blogcheck.batch import DEFAULT_WORKERS, MAX_WORKERS, iter_batch, read_blog_ids, to_csv, to_json
+from blogcheck.cache import get_result_cache
+from blogcheck.deep import MAX_DEEP_POSTS, analyze_recent_posts
+from blogcheck.metrics import get_metrics, serve_metrics
+from blogcheck.crawler import (DEFAULT_QUERY_COUNT, MAX_QUERY_COUNT, analyze_blog, analyze_post_detail,
+                               check_duplicates, check_search_exposure_multi, diagnose_quality, get_blog_info,
+                               incremental_post_detail)
+from blogcheck.history import get_history_store, previous_detail
+from blogcheck.pool import DEFAULT_PREWARM, get_driver_pool, tabs_enabled
+from blogcheck.steps import iter_steps
+from blogcheck.urls import extract_blog_id
+from blogcheck.wait import StepTimer
 
 # --- 1. 페이지 기본 설정 ---
 st.set_page_config(page_title="베리굿 블로그 판독기", page_icon="🍫", layout="wide")
 
+# BLOGCHECK_METRICS_PORT가 있으면 Prometheus 지표 엔드포인트를 한 번만 띄움
+@st.cache_resource
+def start_metrics_server(port):
+    return serve_metrics(port)
+
+if os.environ.get("BLOGCHECK_METRICS_PORT"):
+    start_metrics_server(int(os.environ["BLOGCHECK_METRICS_PORT"]))
+
+# BLOGCHECK_PREWARM개의 Chrome을 앱 시작 시 백그라운드에서 미리 띄움 (첫 분석의 Chrome 시작 대기 제거)
+@st.cache_resource
+def prewarm_drivers(count):
+    return get_driver_pool().prewarm(count)
+
+if DEFAULT_PREWARM:
+    prewarm_drivers(DEFAULT_PREWARM)
+
 # --- 하이브리드 UI 스타일링 ---
 st.markdown("""
 <style>
@@ -406,286 +427,14 @@ with col_input:
 
 st.markdown('</div>', unsafe_allow_html=True)
 
-# --- 2. 서버용 강력한 드라이버 설정 ---
-@st.cache_resource
-def get_driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1")
-    
-    possible_paths = [
-        "/usr/bin/chromium", 
-        "/usr/bin/chromium-browser",
-        "/usr/bin/google-chrome-stable"
-    ]
-    
-    binary_location = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            binary_location = path
-            break
-            
-    if binary_location:
-        chrome_options.binary_location = binary_location
-    
-    try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    except:
-        driver = webdriver.Chrome(options=chrome_options)
-        
-    return driver
-
-# --- 3. 유틸리티 함수들 ---
-def parse_visitor_text(text):
-    today = "0"
-    total = "0"
-    try:
-        numbers = re.findall(r'[\d,]+', text)
-        if len(numbers) >= 2:
-            today = numbers[0]
-            total = numbers[1]
-        elif len(numbers) == 1:
-            if "오늘" in text: today = numbers[0]
-            elif "전체" in text: total = numbers[0]
-    except:
-        pass
-    return today, total
-
-def parse_date(date_text):
-    try:
-        clean_text = date_text.replace(" ", "").strip(".")
-        parts = clean_text.split(".")
-        if len(parts) >= 3:
-            year = int(parts[0])
-            month = int(parts[1])
-            day = int(parts[2]) if parts[2] else 1
-            return datetime(year, month, day)
-    except:
-        pass
-    return None
-
-def is_within_one_month(date_obj):
-    if not date_obj: return False
-    one_month_ago = datetime.now() - timedelta(days=30)
-    return date_obj >= one_month_ago
-
-# --- 4. 블로그 기본 정보 가져오기 ---
-def get_blog_info(blog_id):
-    driver = get_driver()
-    result = {
-        "today_visitors": "확인 불가",
-        "total_visitors": "확인 불가", 
-        "latest_post_title": "글 없음",
-        "latest_post_url": None
-    }
-    
-    try:
-        url = f"https://m.blog.naver.com/{blog_id}"
-        driver.get(url)
-        time.sleep(2.5)
-        
-        visitor_selectors = [".count.total", "div[class^='count__']", ".count"]
-        for selector in visitor_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                text = elem.text.strip()
-                if "오늘" in text or "전체" in text:
-                    result["today_visitors"], result["total_visitors"] = parse_visitor_text(text)
-                    break
-            except:
-                continue
-        
-        post_selectors = ["strong[class*='title__']", ".list_post_article a.title", "a.title"]
-        for selector in post_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                title = elem.text.strip()
-                href = elem.get_attribute("href")
-                if not href:
-                    parent = elem.find_element(By.XPATH, "./ancestor::a")
-                    href = parent.get_attribute("href")
-                
-                if title and len(title) > 2 and "사진 개수" not in title:
-                    if href and blog_id in href:
-                        result["latest_post_title"] = title
-                        result["latest_post_url"] = href
-                        break
-            except:
-                continue
-                
-    except Exception as e:
-        print(f"Error: {e}")
-        
-    return result
-
-# --- 5. 상세 페이지 분석 ---
-def analyze_post_detail(post_url):
-    driver = get_driver()
-    result = {
-        "publish_date": "확인 불가",
-        "publish_date_obj": None,
-        "char_count": 0,
-        "image_count": 0,
-        "like_count": "0",
-        "comment_count": "0"
-    }
-    
-    if not post_url: return result
-    is_in_iframe = False
-    
-    try:
-        driver.get(post_url)
-        time.sleep(3)
-        
-        try:
-            driver.switch_to.frame("mainFrame")
-            is_in_iframe = True
-            time.sleep(1)
-        except:
-            pass
-        
-        date_selectors = [".se_publishDate", ".blog_date", ".date", ".fil5", "span[class*='date']"]
-        for selector in date_selectors:
-            try:
-                elem = driver.find_element(By.CSS_SELECTOR, selector)
-                date_text = elem.text.strip()
-                if date_text:
-                    result["publish_date"] = date_text
-                    result["publish_date_obj"] = parse_date(date_text)
-                    break
-            except:
-                continue
-                
-        try:
-            content = driver.find_element(By.CSS_SELECTOR, ".se-main-container")
-            text = content.text.strip()
-        except:
-            try:
-                content = driver.find_element(By.CSS_SELECTOR, "#postViewArea")
-                text = content.text.strip()
-            except:
-                text = ""
-                try:
-                    text = driver.find_element(By.TAG_NAME, "body").text
-                except: pass
-
-        result["char_count"] = len(text.replace(" ", "").replace("\n", ""))
-        
-        try:
-            if is_in_iframe:
-                imgs = driver.find_elements(By.TAG_NAME, "img")
-            else:
-                imgs = driver.find_elements(By.CSS_SELECTOR, ".se-main-container img")
-                if not imgs:
-                    imgs = driver.find_elements(By.TAG_NAME, "img")
-                
-            valid_cnt = 0
-            for img in imgs:
-                src = img.get_attribute("src") or img.get_attribute("data-src") or ""
-                cls = img.get_attribute("class") or ""
-                
-                if "sticker" in cls or "icon" in cls or "profile" in cls: continue
-                if "l.blog.naver" in src: continue
-                
-                valid_domains = ["postfiles", "blogfiles", "pstatic.net", "naver.net", "blogpfthumb"]
-                if any(d in src for d in valid_domains):
-                    valid_cnt += 1
-            result["image_count"] = valid_cnt
-        except:
-            pass
-            
-        try:
-            like = driver.find_element(By.CSS_SELECTOR, "em[class*='u_cnt']").text
-            result["like_count"] = like
-        except: pass
-        
-        try:
-            cmt = driver.find_element(By.CSS_SELECTOR, "em[class*='_count']").text
-            result["comment_count"] = cmt
-        except: pass
-
-    except Exception as e:
-        print(e)
-    finally:
-        if is_in_iframe:
-            try: driver.switch_to.default_content()
-            except: pass
-            
-    return result
-
-# --- 6. 검색 노출 확인 ---
-def check_search_exposure(blog_id, post_title):
-    if not post_title or post_title == "글 없음":
-        return False, "제목 없음"
-        
-    driver = get_driver()
-    try:
-        clean_title = re.sub(r'[^\w\s가-힣]', ' ', post_title).strip()
-        words = clean_title.split()
-        
-        stopwords = ["더", "그", "이", "저", "및", "등", "를", "을", "의", "에", "로", "나", "하다", "하는", "합니다"]
-        keywords = [w for w in words if w not in stopwords and len(w) > 1]
-        
-        if len(keywords) > 3:
-            keywords = keywords[:3]
-        
-        search_query = " ".join(keywords)
-        if not search_query:
-            search_query = clean_title[:20]
-            
-        encoded_query = urllib.parse.quote(search_query)
-        
-        search_url = f"https://m.search.naver.com/search.naver?where=m_view&query={encoded_query}"
-        driver.get(search_url)
-        time.sleep(2)
-        
-        result_links = driver.execute_script("""
-            var links = [];
-            var allLinks = document.querySelectorAll('a[href*="blog.naver.com"]');
-            for(var i=0; i<allLinks.length && links.length < 20; i++){
-                var href = allLinks[i].href;
-                if(href && !href.includes('ad.search') && !href.includes('ader.naver')){
-                    if(links.indexOf(href) === -1) links.push(href);
-                }
-            }
-            return links;
-        """)
-        
-        if not result_links:
-            if blog_id in driver.page_source:
-                return False, "⚠️ 검색은 되나 상위권 아님"
-            return False, "❌ 검색 결과 없음"
-        
-        for i, link in enumerate(result_links):
-            if f"blog.naver.com/{blog_id}" in link:
-                rank = i + 1
-                if rank == 1:
-                    return True, f"🏅 1위! 키워드({search_query}) 최적화"
-                elif rank <= 3:
-                    return True, f"✅ {rank}위 - 경쟁력 있음"
-                elif rank <= 10:
-                    return False, f"⚠️ {rank}위 - 상위권 진입 필요"
-                else:
-                    return False, f"❌ {rank}위 - 노출 약함"
-                    
-        return False, f"❌ 20위권 밖 (키워드: {search_query})"
-        
-    except Exception as e:
-        return False, f"에러: {e}"
+with st.expander("⚙️ 분석 옵션"):
+    deep_posts = st.slider("최근 글 심층 분석 개수 (0 = 최신 글만)", 0, MAX_DEEP_POSTS, 0)
+    query_count = st.slider("검색 노출 확인 키워드 수", 1, MAX_QUERY_COUNT, DEFAULT_QUERY_COUNT)
+    incremental = st.checkbox("최신 글이 지난 분석과 같으면 상세 분석 생략 (검색 순위만 다시 확인)")
 
-# --- 7. UI 구성 ---
-def extract_blog_id(text):
-    if not text: return ""
-    if "blog.naver.com" in text:
-        parts = text.split("/")
-        for p in parts:
-            if p and "http" not in p and "blog.naver" not in p:
-                return p
-    return text
+if tabs_enabled():
+    st.caption("🧪 실험 기능: 탭 다중화(BLOGCHECK_TABS)로 Chrome 하나에 탭을 열어 분석 중입니다. "
+               "실제 Chrome에서 더 빠른지는 아직 측정하지 않았습니다.")
 
 # --- 결과 출력 영역 ---
 if submitted and user_input:
@@ -700,59 +449,225 @@ if submitted and user_input:
     </div>
     """, unsafe_allow_html=True)
     
-    with st.spinner(""):
-        info = get_blog_info(blog_id)
-        
-        st.divider()
-        
-        st.markdown('<div class="dashboard-header">📊 방문자 통계</div>', unsafe_allow_html=True)
-        
-        c1, c2 = st.columns(2)
-        c1.metric("오늘 방문자", info["today_visitors"])
-        c2.metric("전체 방문자", info["total_visitors"])
-        
-        if info['latest_post_url']:
-            detail = analyze_post_detail(info['latest_post_url'])
-            
-            st.markdown('<div class="dashboard-header">📝 최신글 분석</div>', unsafe_allow_html=True)
-            st.info(f"**제목:** {info['latest_post_title']}")
-            
-            c1, c2, c3, c4 = st.columns(4)
-            c1.metric("발행일", detail["publish_date"])
-            c2.metric("글자수", f"{detail['char_count']:,}")
-            c3.metric("이미지", f"{detail['image_count']}장")
-            c4.metric("공감", detail["like_count"])
-            
-            st.markdown('<div class="dashboard-header">🔍 품질 진단</div>', unsafe_allow_html=True)
+    timer = StepTimer()
+    history = get_history_store()
+    previous = history.latest(blog_id)
+    progress = st.progress(0.0, text="프로필 조회 중...")
+    
+    # 방문자 통계는 get_blog_info가 끝나는 즉시 표시
+    info = get_blog_info(blog_id, timer)
+    record = dict(info, blog_id=blog_id)
+    
+    st.divider()
+    
+    st.markdown('<div class="dashboard-header">📊 방문자 통계</div>', unsafe_allow_html=True)
+    
+    c1, c2 = st.columns(2)
+    c1.metric("오늘 방문자", info["today_visitors"])
+    c2.metric("전체 방문자", info["total_visitors"])
+    
+    if info['latest_post_url']:
+        # 상세 분석 / 검색 노출 / 최근 글 분석을 동시에 실행하고, 끝나는 대로 미리 잡아 둔 자리에 채움
+        check_exposure = functools.partial(check_search_exposure_multi, max_queries=query_count)
+        detail_step = incremental_post_detail(previous) if incremental and previous else analyze_post_detail
+        steps = {
+            "detail": lambda: detail_step(info["latest_post_url"], timer),
+            "exposure": lambda: check_exposure(blog_id, info["latest_post_title"], timer),
+        }
+        step_labels = {"detail": "최신글 분석", "exposure": "검색 노출 분석"}
+        if deep_posts:
+            steps["deep"] = lambda: analyze_recent_posts(blog_id, analyze_post_detail, deep_posts)
+            step_labels["deep"] = f"최근 글 {deep_posts}개 분석"
+        
+        st.markdown('<div class="dashboard-header">📝 최신글 분석</div>', unsafe_allow_html=True)
+        st.info(f"**제목:** {info['latest_post_title']}")
+        slots = {"detail": st.empty()}
+        st.markdown('<div class="dashboard-header">🔍 품질 진단</div>', unsafe_allow_html=True)
+        slots["quality"] = st.empty()
+        slots["duplicates"] = st.empty()
+        if deep_posts:
+            st.markdown(f'<div class="dashboard-header">📚 최근 글 {deep_posts}개 분석</div>', unsafe_allow_html=True)
+            slots["deep"] = st.empty()
+        st.markdown('<div class="dashboard-header">🎯 검색 노출 분석</div>', unsafe_allow_html=True)
+        slots["exposure"] = st.empty()
+        
+        slots["detail"].caption("⏳ 게시글 분석 중...")
+        slots["quality"].caption("⏳ 게시글 분석이 끝나면 진단합니다.")
+        if deep_posts:
+            slots["deep"].caption("⏳ 최근 글 분석 중...")
+        slots["exposure"].caption("⏳ 검색 노출 확인 중...")
+        
+        detail, deep_result = None, None
+        done = []
+        progress.progress(1 / (len(steps) + 1), text=f"프로필 완료 · {' / '.join(step_labels.values())} 진행 중...")
+        for name, result, error in iter_steps(steps):
+            done.append(name)
+            remaining = [label for key, label in step_labels.items() if key not in done]
+            progress.progress((len(done) + 1) / (len(steps) + 1),
+                              text=f"{step_labels[name]} 완료" + (f" · {' / '.join(remaining)} 진행 중..." if remaining else ""))
             
-            warns = []
-            if detail['char_count'] < 1000: warns.append("글자 수 부족 (1,000자 미만)")
-            if detail['image_count'] < 5: warns.append("이미지 부족 (5장 미만)")
-            if not is_within_one_month(detail['publish_date_obj']): warns.append("최근 활동 뜸함")
+            if error is not None:
+                slots[name].error(f"{step_labels[name]} 실패: {error}")
+                if name == "detail":
+                    slots["quality"].empty()
+                continue
             
-            if warns:
-                for w in warns: st.warning(f"⚠️ {w}")
-            else:
-                st.success("✅ 블로그 품질 합격점!")
+            if name == "detail":
+                detail = result
+                record.update({k: v for k, v in detail.items()
+                               if k not in ("publish_date_obj", "content_signature", "content_terms", "duplicates")})
+                slots["duplicates"].caption("⏳ 분석이 모두 끝나면 유사 문서를 확인합니다.")
+                with slots["detail"].container():
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("발행일", detail["publish_date"])
+                    c2.metric("글자수", f"{detail['char_count']:,}")
+                    c3.metric("이미지", f"{detail['image_count']}장")
+                    c4.metric("공감", detail["like_count"])
                 
-            st.markdown('<div class="dashboard-header">🎯 검색 노출 분석</div>', unsafe_allow_html=True)
+                with slots["quality"].container():
+                    warns = diagnose_quality(detail)
+                    if warns:
+                        for w in warns: st.warning(f"⚠️ {w}")
+                    else:
+                        st.success("✅ 블로그 품질 합격점!")
             
-            is_good, msg = check_search_exposure(blog_id, info['latest_post_title'])
-            if is_good:
-                if "최적화" in msg:
-                    st.success(msg)
-                    st.balloons()
-                else:
-                    st.warning(msg)
-            else:
-                st.error(msg)
-                
+            elif name == "deep":
+                deep_result = result
+                summary = result["summary"]
+                with slots["deep"].container():
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("분석한 글", f"{summary['posts_analyzed']}개")
+                    c2.metric("글자수 중앙값", f"{summary['median_char_count'] or 0:,.0f}")
+                    c3.metric("이미지 중앙값", f"{summary['median_image_count'] or 0:.0f}장")
+                    c4.metric("발행 간격", f"{summary['median_post_interval_days']}일" if summary['median_post_interval_days'] is not None else "-")
+                    
+                    st.bar_chart(summary["image_count_distribution"])
+                    if result["skipped"]:
+                        st.caption(f"시간 예산 초과로 {result['skipped']}개 글은 제외했습니다.")
+                    st.dataframe([{
+                        "제목": p["title"],
+                        "발행일": p["publish_date"],
+                        "글자수": p["char_count"],
+                        "이미지": p["image_count"],
+                    } for p in result["posts"]], use_container_width=True)
+            
+            elif name == "exposure":
+                exposure = result
+                is_good, msg = exposure["primary"]
+                record.update(exposure_ok=is_good, exposure_msg=msg,
+                              exposure_rank=exposure["queries"][0]["rank"] if exposure["queries"] else None)
+                with slots["exposure"].container():
+                    if is_good:
+                        if "최적화" in msg:
+                            st.success(msg)
+                            st.balloons()
+                        else:
+                            st.warning(msg)
+                    else:
+                        st.error(msg)
+                    
+                    if len(exposure["queries"]) > 1:
+                        best = exposure["best_rank"]
+                        with st.expander(f"🔑 키워드별 노출 순위 (최고 {f'{best}위' if best else '20위권 밖'} · "
+                                         f"10위 이내 {exposure['exposed_count']}/{len(exposure['queries'])}개)"):
+                            st.dataframe([{
+                                "검색어": q["query"],
+                                "순위": q["rank"],
+                                "결과": q["message"],
+                            } for q in exposure["queries"]], use_container_width=True)
+        
+        # 유사 문서는 최신 글과 최근 글 결과가 모두 모인 뒤 한 번만 비교 (단계 완료 순서와 무관)
+        if detail is not None:
+            duplicates = check_duplicates(blog_id, info["latest_post_url"], detail,
+                                          deep_result["posts"] if deep_result else ())
+            record["duplicate_ratio"] = duplicates["duplicate_ratio"] if duplicates else None
+            record["duplicate_urls"] = detail.get("duplicates") or []
+            with slots["duplicates"].container():
+                if record["duplicate_urls"]:
+                    st.warning(f"⚠️ 유사 문서 {len(record['duplicate_urls'])}건 (복사/짜깁기 의심)")
+                    with st.expander("🧬 유사 문서"):
+                        for url in record["duplicate_urls"]:
+                            st.markdown(f"- {url}")
+                if record["duplicate_ratio"]:
+                    st.warning(f"⚠️ 최근 글 중 {record['duplicate_ratio']:.0%}가 다른 글과 유사합니다. (복사/짜깁기 의심)")
         else:
-            st.warning("최신 글을 찾지 못했습니다.")
+            slots["duplicates"].empty()
+        
+        record["incremental"] = incremental and previous_detail(previous, info["latest_post_url"]) is not None
+    else:
+        progress.progress(1.0, text="프로필 완료")
+        st.warning("최신 글을 찾지 못했습니다.")
+    
+    with st.expander(f"⏱ 단계별 소요 시간 (합계 {timer.total():.2f}초)"):
+        for step_name, seconds in timer.steps:
+            st.text(f"{step_name:<20} {seconds:6.2f}s")
+        if not timer.steps:
+            st.text("모든 단계가 캐시에서 응답했습니다.")
+        st.caption("캐시 적중률")
+        st.json(get_result_cache().stats())
+        st.caption("누적 지표 (서버 시작 이후)")
+        st.json(get_metrics().snapshot(), expanded=False)
+    
+    history.record(record)
+    past = history.history(blog_id)
+    if len(past) > 1:
+        with st.expander(f"📈 지난 분석 기록 ({len(past)}회)"):
+            st.dataframe([{
+                "분석 시각": time.strftime("%Y-%m-%d %H:%M", time.localtime(r["checked_at"])),
+                "오늘": r["today_visitors"],
+                "전체": r["total_visitors"],
+                "최신글": r["latest_post_title"],
+                "글자수": r["char_count"],
+                "이미지": r["image_count"],
+                "노출 순위": r["exposure_rank"],
+                "증분": "✓" if r["incremental"] else "",
+            } for r in past], use_container_width=True)
+    
+    st.markdown("""
+    <div class="analyzing-msg" style="margin-top: 20px; border-color: #5cb85c;">
+        <span style="color: #5cb85c;">[DONE]</span> Analysis completed successfully.<br>
+        <span style="color: #666;">Ready for next query...</span>
+    </div>
+    """, unsafe_allow_html=True)
+
+# --- 일괄 분석 영역 ---
+with st.expander("📂 일괄 분석 (CSV 업로드)"):
+    st.caption("블로그 ID 또는 URL이 담긴 CSV를 올려주세요. (blog_id / url 열 또는 첫 번째 열 사용, 중복은 자동 제거)")
+    batch_file = st.file_uploader("CSV 파일", type=["csv", "txt"], label_visibility="collapsed")
+    batch_workers = st.slider("동시 분석 수", 1, MAX_WORKERS, DEFAULT_WORKERS)
+    batch_submitted = st.button("일괄 분석 시작", disabled=batch_file is None)
+
+if batch_submitted and batch_file is not None:
+    batch_ids = read_blog_ids(batch_file.getvalue().decode("utf-8-sig", errors="ignore"))
+    
+    if not batch_ids:
+        st.warning("CSV에서 블로그 ID를 찾지 못했습니다.")
+    else:
+        st.markdown(f'<div class="dashboard-header">📂 일괄 분석 ({len(batch_ids)}개)</div>', unsafe_allow_html=True)
+        progress = st.progress(0.0)
+        table = st.empty()
+        
+        batch_rows = []
+        batch_start = time.perf_counter()
+        batch_analyze = functools.partial(analyze_blog, deep_posts=deep_posts, queries=query_count,
+                                          history=get_history_store(), incremental=incremental)
+        for row in iter_batch(batch_ids, batch_analyze, workers=batch_workers):
+            batch_rows.append(row)
+            elapsed = time.perf_counter() - batch_start
+            progress.progress(len(batch_rows) / len(batch_ids),
+                              text=f"{len(batch_rows)}/{len(batch_ids)} 완료 · {len(batch_rows) / elapsed * 60:.1f} 블로그/분")
+            table.dataframe([{
+                "블로그": r["blog_id"],
+                "오늘": r.get("today_visitors"),
+                "전체": r.get("total_visitors"),
+                "최신글": r.get("latest_post_title"),
+                "글자수": r.get("char_count"),
+                "이미지": r.get("image_count"),
+                "진단": " / ".join(r.get("warnings") or []) or "합격",
+                "검색 노출": r.get("exposure_msg") or r.get("error"),
+                "소요(초)": r.get("elapsed"),
+            } for r in batch_rows], use_container_width=True)
         
-        st.markdown("""
-        <div class="analyzing-msg" style="margin-top: 20px; border-color: #5cb85c;">
-            <span style="color: #5cb85c;">[DONE]</span> Analysis completed successfully.<br>
-            <span style="color: #666;">Ready for next query...</span>
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        c1, c2 = st.columns(2)
+        c1.download_button("CSV 다운로드", to_csv(batch_rows), "blogcheck_batch.csv", "text/csv")
+        c2.download_button("JSON 다운로드", to_json(batch_rows), "blogcheck_batch.json", "application/json")
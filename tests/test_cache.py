@@ -0,0 +1,50 @@
+import threading
+import time
+
+from blogcheck.cache import ResultCache
+
+POSTS = 50000
+
+
+def test_coalesced_followers_do_not_see_leader_mutations():
+    # 기다리던 호출이 값을 복사하는 동안 먼저 실행한 호출이 돌려받은 값을 고쳐도 영향이 없어야 함
+    cache = ResultCache()
+    release = threading.Event()
+    followers, errors = [], []
+
+    def compute():
+        release.wait(5)
+        return {f"post_{i}": {"title": str(i)} for i in range(POSTS)}
+
+    def lead():
+        value = cache.load("blog_info", "a", compute)
+        deadline = time.perf_counter() + 0.5
+        i = 0
+        while time.perf_counter() < deadline:
+            value[f"duplicates_{i}"] = []
+            i += 1
+
+    def follow():
+        try:
+            followers.append(cache.load("blog_info", "a", compute))
+        except Exception as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    while not cache._flights:
+        time.sleep(0.01)
+    threads = [threading.Thread(target=follow) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while cache.stats().get("blog_info", {}).get("coalesced", 0) < len(threads):
+        time.sleep(0.01)
+
+    release.set()
+    for thread in [leader, *threads]:
+        thread.join(10)
+
+    assert errors == []
+    assert len(followers) == len(threads)
+    assert all(len(value) == POSTS for value in followers)
+    assert len({id(value) for value in followers}) == len(threads)
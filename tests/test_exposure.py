@@ -0,0 +1,34 @@
+import pytest
+
+from blogcheck import crawler, keywords
+from blogcheck.keywords import KeywordIndex
+
+
+@pytest.fixture(autouse=True)
+def no_serp(monkeypatch):
+    index = KeywordIndex(":memory:")
+    monkeypatch.setattr(keywords, "_shared_index", index)
+    fetched = []
+    monkeypatch.setattr(crawler, "fetch_serp_links", lambda query, timer=None: fetched.append(query) or [])
+    yield fetched
+    index.close()
+
+
+@pytest.mark.parametrize("title", ["🍰🍰🍰", "!!! ???", "글 없음", ""])
+def test_single_query_without_words_is_not_searched(title, no_serp):
+    result = crawler.check_search_exposure_ranked("x", title)
+    assert result == {"query": None, "rank": None, "exposed": False, "message": "제목 없음"}
+    assert no_serp == []
+
+
+@pytest.mark.parametrize("title", ["🍰🍰🍰", "!!! ???", "글 없음", ""])
+def test_multi_query_without_words_is_not_searched(title, no_serp):
+    result = crawler.check_search_exposure_multi("x", title)
+    assert result["primary"] == (False, "제목 없음")
+    assert result["queries"] == []
+    assert no_serp == []
+
+
+def test_queries_are_never_empty(no_serp):
+    crawler.check_search_exposure_multi("x", "🍰 강남역 파스타 🍰 맛집 후기")
+    assert no_serp and all(query.strip() for query in no_serp)
@@ -0,0 +1,51 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blogcheck.fast import serp_url
+from blogcheck.httpclient import _cache_key, fetch_text
+
+
+def test_cache_key_keeps_post_query():
+    base = "https://m.blog.naver.com/PostView.naver"
+    assert _cache_key(f"{base}?blogId=a&logNo=1") != _cache_key(f"{base}?blogId=b&logNo=2")
+    assert _cache_key(f"{base}?blogId=a&logNo=1") == _cache_key(base, {"blogId": "a", "logNo": "1"})
+
+
+def test_cache_key_keeps_search_query():
+    assert _cache_key(serp_url("강남 맛집")) != _cache_key(serp_url("홍대 카페"))
+
+
+class _AlwaysNotModified(BaseHTTPRequestHandler):
+    # If-Modified-Since가 붙으면 무조건 304 (검증자가 다른 글 것이어도)
+    def do_GET(self):
+        if self.headers.get("If-Modified-Since"):
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = self.path.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Last-Modified", "Mon, 20 May 2024 09:30:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AlwaysNotModified)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_fetch_text_does_not_reuse_other_post_validators(server_url):
+    first = fetch_text(f"{server_url}/PostView.naver?blogId=a&logNo=1")
+    second = fetch_text(f"{server_url}/PostView.naver?blogId=b&logNo=2")
+    assert first == "/PostView.naver?blogId=a&logNo=1"
+    assert second == "/PostView.naver?blogId=b&logNo=2"
+    assert fetch_text(f"{server_url}/PostView.naver?blogId=a&logNo=1") == first
@@ -0,0 +1,39 @@
+import pytest
+
+from blogcheck import keywords
+from blogcheck.crawler import build_search_queries, build_search_query
+from blogcheck.keywords import KeywordIndex, keyword_phrase, tokenize
+
+
+@pytest.fixture(autouse=True)
+def keyword_index(monkeypatch):
+    index = KeywordIndex(":memory:")
+    monkeypatch.setattr(keywords, "_shared_index", index)
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize("word", ["고양이", "하와이", "첫사랑", "시험결과", "여행도"])
+def test_tokenize_keeps_nouns_ending_in_particle_syllables(word):
+    assert tokenize(word) == [word]
+
+
+def test_tokenize_strips_unambiguous_particles():
+    assert tokenize("서울에서 부산까지 맛집은") == ["서울", "부산", "맛집"]
+
+
+def test_tokenize_keeps_hanja_and_kana():
+    assert tokenize("東京旅行 2일차 ラーメン") == ["東京旅行", "2일차", "ラーメン"]
+
+
+def test_query_uses_title_words_in_title_order(keyword_index):
+    keyword_index.add("a/1", ["솔직", "후기"])
+    keyword_index.add("a/2", ["솔직", "후기"])
+    assert keyword_phrase("솔직 후기 강남역 맛집은 파스타", 3) == "강남역 맛집은 파스타"
+    assert build_search_query("서울에서 부산까지 기차 여행") == "서울에서 부산까지 기차"
+
+
+def test_queries_keep_non_hangul_title_words():
+    assert build_search_query("東京旅行 2일차") == "東京旅行 2일차"
+    assert all(query for query in build_search_queries("고양이랑 하와이 여행"))
+    assert "고양이랑 하와이" in build_search_queries("고양이랑 하와이 여행")